@@ -0,0 +1,470 @@
+"""
+Measures client throughput and latency against the local stub API server.
+
+Usage:
+    python benchmarks/run.py [--latency 5] [--error-rate 0.01] [--json out.json]
+
+See benchmarks/README.md for the scenarios and options.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+# The benchmarks run against the same stub API as the tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tests"))
+from stub_server import StubConfig, StubServer  # noqa: E402
+
+from mandoline import (  # noqa: E402
+    AdaptiveConcurrency,
+    AsyncMandoline,
+    EvaluationCreate,
+    Mandoline,
+    Metric,
+    RetryConfig,
+)
+from mandoline.config import MAX_BATCH_SIZE  # noqa: E402
+from mandoline.errors import MandolineError  # noqa: E402
+
+
+class ScenarioResult(BaseModel):
+    name: str
+    operations: int
+    errors: int
+    seconds: float
+    requests: int
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.seconds if self.seconds else 0.0
+
+
+class Context:
+    def __init__(self, *, server: StubServer, args: argparse.Namespace):
+        self.server = server
+        self.args = args
+        self.retry = RetryConfig(
+            max_attempts=args.max_attempts,
+            backoff_base=args.backoff_base,
+            retry_methods=["GET", "POST", "PUT", "DELETE"],
+        )
+        self.metric_ids: List[str] = []
+        self.metrics: List[Metric] = []
+
+    def client(self, **kwargs) -> Mandoline:
+        return Mandoline(
+            api_key="benchmark",
+            api_base_url=self.server.api_base_url,
+            retry=self.retry,
+            **kwargs,
+        )
+
+    def async_client(self, **kwargs) -> AsyncMandoline:
+        return AsyncMandoline(
+            api_key="benchmark",
+            api_base_url=self.server.api_base_url,
+            retry=self.retry,
+            **kwargs,
+        )
+
+    def evaluation_creates(self, count: int) -> List[EvaluationCreate]:
+        return [
+            EvaluationCreate(
+                metric_id=self.metrics[i % len(self.metrics)].id,
+                prompt=f"Prompt {i}",
+                response="Response " * (i % 50 + 1),
+                properties={"index": i},
+            )
+            for i in range(count)
+        ]
+
+
+def percentile(values: Sequence[float], q: int) -> Optional[float]:
+    if len(values) < 2:
+        return values[0] if values else None
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+Timings = Tuple[List[float], int]
+
+
+def run_timed(
+    *, name: str, context: Context, func: Callable[[], Timings], operations: int
+) -> ScenarioResult:
+    """
+    Runs `func`, which returns the latencies of the calls it timed (empty
+    when only throughput is meaningful) and the number of failed operations.
+    """
+    requests_before = len(context.server.state.requests)
+    started = time.perf_counter()
+    latencies, errors = func()
+    seconds = time.perf_counter() - started
+    return ScenarioResult(
+        name=name,
+        operations=operations,
+        errors=errors,
+        seconds=seconds,
+        requests=len(context.server.state.requests) - requests_before,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+    )
+
+
+def count_errors(result: object) -> int:
+    if isinstance(result, list):
+        return sum(isinstance(item, MandolineError) for item in result)
+    return 0
+
+
+def call_latencies(calls: Sequence[Callable[[], object]]) -> Timings:
+    latencies = []
+    errors = 0
+    for call in calls:
+        started = time.perf_counter()
+        try:
+            errors += count_errors(call())
+        except MandolineError:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    return latencies, errors
+
+
+def seed_evaluations(server: StubServer, *, metric_id: str, count: int) -> None:
+    """Stores `count` evaluations directly, without going through HTTP."""
+    for i in range(count):
+        server.state.create_evaluation(
+            {
+                "metric_id": metric_id,
+                "prompt": f"Prompt {i}: " + "lorem ipsum " * 20,
+                "response": f"Response {i}: " + "dolor sit amet " * 40,
+                "properties": {"model": f"model-{i % 4}", "run": i // 100},
+            }
+        )
+
+
+# Scenarios
+
+
+def create_evaluation(context: Context) -> ScenarioResult:
+    items = context.evaluation_creates(context.args.requests)
+    with context.client() as client:
+        return run_timed(
+            name="create_evaluation",
+            context=context,
+            operations=len(items),
+            func=lambda: call_latencies(
+                [
+                    lambda item=item: client.create_evaluation(
+                        metric_id=item.metric_id,
+                        prompt=item.prompt,
+                        response=item.response,
+                        properties=item.properties,
+                    )
+                    for item in items
+                ]
+            ),
+        )
+
+
+def evaluate(context: Context) -> ScenarioResult:
+    calls = max(1, context.args.requests // len(context.metrics))
+    with context.client() as client:
+        return run_timed(
+            name=f"evaluate ({len(context.metrics)} metrics)",
+            context=context,
+            operations=calls,
+            func=lambda: call_latencies(
+                [
+                    lambda i=i: client.evaluate(
+                        metrics=context.metrics, prompt=f"Prompt {i}", response="R"
+                    )
+                    for i in range(calls)
+                ]
+            ),
+        )
+
+
+def list_evaluations(context: Context, *, fast_decode: bool) -> ScenarioResult:
+    page_size = context.args.page_size
+    calls = context.args.list_calls
+    metric_id = context.metric_ids[0]
+    with context.client(fast_decode=fast_decode) as client:
+        return run_timed(
+            name=f"get_evaluations ({page_size}/page, fast_decode={fast_decode})",
+            context=context,
+            operations=calls,
+            func=lambda: call_latencies(
+                [lambda: client.get_evaluations(limit=page_size, metric_id=metric_id)]
+                * calls
+            ),
+        )
+
+
+def iter_evaluations(context: Context) -> ScenarioResult:
+    metric_id = context.metric_ids[0]
+    count = []
+    with context.client(fast_decode=True) as client:
+
+        def run() -> Timings:
+            try:
+                for _ in client.iter_evaluations(
+                    metric_id=metric_id,
+                    page_size=context.args.page_size,
+                    max_concurrency=context.args.concurrency,
+                ):
+                    count.append(None)
+            except MandolineError:
+                return [], 1
+            return [], 0
+
+        result = run_timed(
+            name=f"iter_evaluations (x{context.args.concurrency} pages)",
+            context=context,
+            operations=0,
+            func=run,
+        )
+    return result.model_copy(update={"operations": len(count)})
+
+
+def evaluate_many(context: Context, *, adaptive: bool) -> ScenarioResult:
+    items = context.evaluation_creates(context.args.requests)
+    concurrency = context.args.concurrency
+    max_concurrency = (
+        AdaptiveConcurrency(
+            initial_limit=max(1, concurrency // 2), max_limit=concurrency
+        )
+        if adaptive
+        else concurrency
+    )
+    with context.client() as client:
+
+        def run() -> Timings:
+            failures = 0
+            for result in client.evaluate_many(
+                items=items, max_concurrency=max_concurrency
+            ):
+                failures += not result.ok
+            return [], failures
+
+        return run_timed(
+            name=f"evaluate_many ({'adaptive' if adaptive else 'fixed'} x{concurrency})",
+            context=context,
+            operations=len(items),
+            func=run,
+        )
+
+
+def create_evaluations(context: Context) -> ScenarioResult:
+    items = context.evaluation_creates(context.args.requests)
+    with context.client() as client:
+        return run_timed(
+            name=f"create_evaluations (batches of {MAX_BATCH_SIZE})",
+            context=context,
+            operations=len(items),
+            func=lambda: call_latencies(
+                [
+                    lambda start=start: client.create_evaluations(
+                        evaluations=items[start : start + MAX_BATCH_SIZE],
+                        return_exceptions=True,
+                    )
+                    for start in range(0, len(items), MAX_BATCH_SIZE)
+                ]
+            ),
+        )
+
+
+def async_evaluate_many(context: Context) -> ScenarioResult:
+    items = context.evaluation_creates(context.args.requests)
+
+    async def run_async() -> Timings:
+        failures = 0
+        async with context.async_client() as client:
+            async for result in client.evaluate_many(
+                items=items, max_concurrency=context.args.concurrency
+            ):
+                failures += not result.ok
+        return [], failures
+
+    return run_timed(
+        name=f"async evaluate_many (x{context.args.concurrency})",
+        context=context,
+        operations=len(items),
+        func=lambda: asyncio.run(run_async()),
+    )
+
+
+SCENARIOS: Dict[str, Callable[[Context], ScenarioResult]] = {
+    "create_evaluation": create_evaluation,
+    "evaluate": evaluate,
+    "list": lambda context: list_evaluations(context, fast_decode=False),
+    "list_fast": lambda context: list_evaluations(context, fast_decode=True),
+    "iter": iter_evaluations,
+    "evaluate_many": lambda context: evaluate_many(context, adaptive=False),
+    "evaluate_many_adaptive": lambda context: evaluate_many(context, adaptive=True),
+    "create_evaluations": create_evaluations,
+    "async_evaluate_many": async_evaluate_many,
+}
+
+
+# Reporting
+
+
+def format_ms(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}"
+
+
+def print_results(
+    results: Sequence[ScenarioResult], baseline: Dict[str, ScenarioResult]
+) -> None:
+    header = (
+        f"{'scenario':<48} {'ops':>6} {'errors':>6} {'reqs':>6} {'ops/s':>10} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    )
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        line = (
+            f"{result.name:<48} {result.operations:>6} {result.errors:>6} "
+            f"{result.requests:>6} {result.throughput:>10.1f} "
+            f"{format_ms(result.p50):>8} {format_ms(result.p95):>8} "
+            f"{format_ms(result.p99):>8}"
+        )
+        base = baseline.get(result.name)
+        if base is not None and base.throughput:
+            change = (result.throughput / base.throughput - 1) * 100
+            line += f" {change:>+7.1f}%"
+        print(line)
+
+
+def quiet_client_logs() -> None:
+    """Silences retry warnings and the errors that injected failures cause."""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("mandoline"):
+            logging.getLogger(name).setLevel(logging.CRITICAL)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma-separated scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Evaluations created per scenario"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Limit for concurrent scenarios"
+    )
+    parser.add_argument(
+        "--metrics", type=int, default=5, help="Metrics used by `evaluate`"
+    )
+    parser.add_argument(
+        "--list-size", type=int, default=5000, help="Evaluations stored for listing"
+    )
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument(
+        "--list-calls", type=int, default=20, help="get_evaluations calls to time"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=2.0, help="Server latency per request (ms)"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra latency, up to (ms)"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests failing with 500",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of requests failing with 429",
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=0.0, help="Retry-After sent with 429s (s)"
+    )
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument(
+        "--backoff-base", type=float, default=0.01, help="Client retry backoff (s)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the client's log messages"
+    )
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument(
+        "--compare", help="Results file of a previous run to compare to"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    if not args.verbose:
+        quiet_client_logs()
+
+    config = StubConfig(
+        latency=args.latency / 1000,
+        latency_jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        # Measures the client's own overhead, not gzip on both ends
+        compress_responses=False,
+        seed=args.seed,
+    )
+    baseline: Dict[str, ScenarioResult] = {}
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            for data in json.load(file):
+                result = ScenarioResult.model_validate(data)
+                baseline[result.name] = result
+
+    results = []
+    with StubServer(config=config) as server:
+        context = Context(server=server, args=args)
+        # Set up through the server state so failure injection cannot abort it
+        for i in range(args.metrics):
+            metric = server.state.create_metric(
+                {"name": f"Metric {i}", "description": "Benchmark metric"}
+            )
+            context.metric_ids.append(metric["id"])
+            context.metrics.append(Metric.model_validate(metric))
+        seed_evaluations(server, metric_id=context.metric_ids[0], count=args.list_size)
+
+        for name in names:
+            results.append(SCENARIOS[name](context))
+
+    print_results(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump([result.model_dump() for result in results], file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
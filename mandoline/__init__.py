@@ -1,5 +1,15 @@
+from .analysis import ScoreSummary, summarize
+from .async_client import AsyncMandoline
+from .batch import BatchProgress, BatchResult
+from .batcher import EvaluationBatcher
 from .client import Mandoline
+from .concurrency import AdaptiveConcurrency
+from .config import RetryConfig
 from .errors import MandolineError
+from .frame import EvaluationFrame
+from .hooks import RequestEvent, RequestHook, StatsCollector
+from .jobs import EvaluationJob, JobCheckpoint
+from .json_codec import JSONCodec
 from .models import (
     Evaluation,
     EvaluationCreate,
@@ -8,6 +18,11 @@ from .models import (
     MetricCreate,
     MetricUpdate,
 )
+from .rate_limiter import RateLimiter
+from .result_cache import MemoryResultCache, ResultCache, SQLiteResultCache
+from .spool import EvaluationSpool, SpoolFullError
+from .store import LocalStore
+from .transfer import export_evaluations, import_evaluations
 from .types import (
     NotGiven,
     NullableSerializableDict,
@@ -19,17 +34,41 @@ from .types import (
 __version__ = "0.1.2"
 
 __all__ = [
+    "AdaptiveConcurrency",
+    "AsyncMandoline",
+    "BatchProgress",
+    "BatchResult",
     "Evaluation",
+    "EvaluationBatcher",
     "EvaluationCreate",
+    "EvaluationFrame",
+    "EvaluationJob",
+    "EvaluationSpool",
     "EvaluationUpdate",
+    "JSONCodec",
+    "JobCheckpoint",
+    "LocalStore",
     "Mandoline",
     "MandolineError",
+    "MemoryResultCache",
     "Metric",
     "MetricCreate",
     "MetricUpdate",
     "NotGiven",
     "NullableSerializableDict",
     "NullableStringArray",
+    "RateLimiter",
+    "RequestEvent",
+    "RequestHook",
+    "ResultCache",
+    "RetryConfig",
+    "SQLiteResultCache",
+    "ScoreSummary",
     "SerializableDict",
+    "SpoolFullError",
+    "StatsCollector",
     "StringArray",
+    "export_evaluations",
+    "import_evaluations",
+    "summarize",
 ]
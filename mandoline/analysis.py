@@ -0,0 +1,203 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from mandoline.config import (
+    DEFAULT_BOOTSTRAP_SAMPLES,
+    DEFAULT_CONFIDENCE,
+    DEFAULT_QUANTILES,
+)
+from mandoline.frame import DictionaryEncoder, EvaluationFrame, require_numpy
+from mandoline.models import Evaluation
+
+if TYPE_CHECKING:
+    import numpy
+
+GroupBy = Union[str, Sequence[str]]
+EvaluationResults = Union[EvaluationFrame, Iterable[Evaluation]]
+
+# Upper bound on the resampled values drawn at once while bootstrapping
+BOOTSTRAP_CHUNK_SIZE = 10_000_000
+
+
+class ScoreSummary(BaseModel):
+    """Score statistics for one group of evaluations."""
+
+    group: Dict[str, Any]
+    count: int
+    mean: float
+    std: Optional[float] = None
+    min: float
+    max: float
+    quantiles: Dict[float, float]
+    ci_low: Optional[float] = None
+    ci_high: Optional[float] = None
+
+
+def to_frame(results: EvaluationResults) -> EvaluationFrame:
+    if isinstance(results, EvaluationFrame):
+        return results
+    return EvaluationFrame.from_evaluations(results)
+
+
+def freeze(value: Any) -> Hashable:
+    """Makes list and dict property values usable as group keys."""
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    return value
+
+
+def group_column(frame: EvaluationFrame, key: str) -> "numpy.ndarray":
+    if key == "metric_id":
+        return frame.metric_ids
+    return frame.property(key)
+
+
+def group_rows(
+    frame: EvaluationFrame, keys: Sequence[str]
+) -> Tuple["numpy.ndarray", List[Dict[str, Any]]]:
+    """
+    Assigns every row a group number.
+
+    Returns the group number of each row and, for each group, its values
+    of `keys`. Groups are numbered in order of first appearance.
+    """
+    np = require_numpy()
+    if not keys:
+        return np.zeros(len(frame), dtype=np.intp), [{}]
+
+    codes = []
+    uniques = []
+    for key in keys:
+        encoder = DictionaryEncoder()
+        for value in group_column(frame, key):
+            encoder.append(freeze(value))
+        codes.append(encoder.to_array())
+        uniques.append(encoder.values)
+
+    combined, first_rows, inverse = np.unique(
+        np.stack(codes, axis=1), axis=0, return_index=True, return_inverse=True
+    )
+    # np.unique sorts the code rows; renumber them by first appearance
+    order = np.argsort(first_rows)
+    numbers = np.empty_like(order)
+    numbers[order] = np.arange(len(order))
+    groups = [
+        {key: uniques[i][code_row[i]] for i, key in enumerate(keys)}
+        for code_row in combined[order]
+    ]
+    return numbers[inverse.reshape(-1)], groups
+
+
+def bootstrap_mean_interval(
+    values: "numpy.ndarray",
+    *,
+    confidence: float,
+    samples: int,
+    rng: "numpy.random.Generator",
+) -> Tuple[float, float]:
+    """Percentile bootstrap confidence interval of the mean of `values`."""
+    np = require_numpy()
+    size = len(values)
+    means = np.empty(samples)
+    chunk = max(1, BOOTSTRAP_CHUNK_SIZE // size)
+    for start in range(0, samples, chunk):
+        stop = min(samples, start + chunk)
+        draws = rng.integers(0, size, size=(stop - start, size))
+        means[start:stop] = values[draws].mean(axis=1)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(means, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+def summarize(
+    results: EvaluationResults,
+    *,
+    by: GroupBy = (),
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    confidence: float = DEFAULT_CONFIDENCE,
+    bootstrap_samples: int = DEFAULT_BOOTSTRAP_SAMPLES,
+    seed: Optional[int] = None,
+) -> List[ScoreSummary]:
+    """
+    Summarizes evaluation scores, optionally grouped by property values.
+
+    `by` names one or more `properties` keys (or `"metric_id"`); rows
+    without a key fall into its `None` group. Each summary has the count,
+    mean, sample standard deviation, min, max, the requested `quantiles`
+    and a percentile bootstrap confidence interval of the mean from
+    `bootstrap_samples` resamples (pass 0 to skip it, and `seed` for
+    reproducible intervals). Counts, means and deviations are computed
+    for all groups at once; quantiles come from a single sort.
+    """
+    np = require_numpy()
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise ValueError("quantiles must be between 0 and 1")
+    if bootstrap_samples < 0:
+        raise ValueError("bootstrap_samples must not be negative")
+
+    frame = to_frame(results)
+    if not len(frame):
+        return []
+
+    keys = [by] if isinstance(by, str) else list(by)
+    scores = frame.scores
+    inverse, groups = group_rows(frame, keys)
+
+    counts = np.bincount(inverse, minlength=len(groups))
+    means = np.bincount(inverse, weights=scores) / counts
+    deviations = np.bincount(inverse, weights=(scores - means[inverse]) ** 2)
+
+    # Sorting by (group, score) makes each group a contiguous sorted slice
+    sorted_scores = scores[np.lexsort((scores, inverse))]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    rng = np.random.default_rng(seed)
+
+    summaries = []
+    for index, group in enumerate(groups):
+        values = sorted_scores[bounds[index] : bounds[index + 1]]
+        count = int(counts[index])
+        interval = (
+            bootstrap_mean_interval(
+                values, confidence=confidence, samples=bootstrap_samples, rng=rng
+            )
+            if bootstrap_samples
+            else (None, None)
+        )
+        summaries.append(
+            ScoreSummary(
+                group=group,
+                count=count,
+                mean=float(means[index]),
+                std=(
+                    float(np.sqrt(deviations[index] / (count - 1)))
+                    if count > 1
+                    else None
+                ),
+                min=float(values[0]),
+                max=float(values[-1]),
+                quantiles={
+                    q: float(value)
+                    for q, value in zip(quantiles, np.quantile(values, quantiles))
+                },
+                ci_low=interval[0],
+                ci_high=interval[1],
+            )
+        )
+    return summaries
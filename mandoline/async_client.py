@@ -0,0 +1,603 @@
+from functools import partial
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
+from uuid import UUID
+
+from httpx import AsyncClient
+
+from mandoline.batch import (
+    BatchProgress,
+    BatchResult,
+    EvaluationItem,
+    ProgressCallback,
+    decode_batch_evaluations,
+    is_batch_unsupported,
+    record_progress,
+    to_batch_payload,
+    to_batch_result,
+    to_evaluation_create,
+)
+from mandoline.client import BaseMandoline, process_get_options
+from mandoline.concurrency import Concurrency, amap_concurrently, astream_concurrently
+from mandoline.config import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_EVALUATE_CONCURRENCY,
+    DEFAULT_GET_LIMIT,
+    MAX_GET_LIMIT,
+)
+from mandoline.connection_manager import (
+    RequestOptions,
+    create_async_http_client,
+    make_async_request,
+    make_request_key,
+)
+from mandoline.decoding import (
+    decode_evaluation,
+    decode_evaluations,
+    decode_metric,
+    decode_metrics,
+)
+from mandoline.errors import MandolineError
+from mandoline.frame import EvaluationFrame, EvaluationFrameBuilder
+from mandoline.models import (
+    Evaluation,
+    EvaluationCreate,
+    EvaluationUpdate,
+    Metric,
+    MetricCreate,
+    MetricUpdate,
+)
+from mandoline.pagination import aiterate_pages
+from mandoline.singleflight import AsyncSingleFlight
+from mandoline.tracing import traced
+from mandoline.types import (
+    NotGiven,
+    NullableSerializableDict,
+    NullableStringArray,
+    SerializableDict,
+)
+from mandoline.utils import NOT_GIVEN
+
+
+class AsyncMandoline(BaseMandoline):
+    """
+    Asyncio client for interacting with the Mandoline API.
+
+    Mirrors every method of `Mandoline` as a coroutine, sharing the same
+    configuration, model validation and error handling.
+
+    The client keeps a pool of persistent connections open between
+    requests. Await `close()` when you are done with it, or use it as an
+    async context manager.
+    """
+
+    _http_client: AsyncClient
+
+    def _create_http_client(self) -> AsyncClient:
+        return create_async_http_client(config=self.request_config)
+
+    def _create_single_flight(self) -> AsyncSingleFlight:
+        return AsyncSingleFlight()
+
+    async def close(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._http_client.aclose()
+
+    async def __aenter__(self) -> "AsyncMandoline":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def _request(self, *, options: RequestOptions) -> Any:
+        return await make_async_request(
+            client=self._http_client,
+            config=self.request_config,
+            options=options,
+            rate_limiter=self.rate_limiter,
+            json_codec=self.json_codec,
+            hooks=self._request_hooks(),
+        )
+
+    async def _get(
+        self, *, endpoint: str, params: Optional[SerializableDict] = None
+    ) -> Any:
+        self._validate_get_params(params=params)
+        options = RequestOptions(
+            method="GET",
+            endpoint=endpoint,
+            auth_header=self._get_auth_header(),
+            raw_response=self.fast_decode,
+            params=params,
+        )
+        if self._single_flight is None:
+            return await self._request(options=options)
+        return await self._single_flight.do(
+            make_request_key(options=options), lambda: self._request(options=options)
+        )
+
+    async def _post(self, *, endpoint: str, data: SerializableDict) -> Any:
+        return await self._request(
+            options=RequestOptions(
+                method="POST",
+                endpoint=endpoint,
+                auth_header=self._get_auth_header(),
+                raw_response=self.fast_decode,
+                data=data,
+            )
+        )
+
+    async def _put(self, *, endpoint: str, data: SerializableDict) -> Any:
+        return await self._request(
+            options=RequestOptions(
+                method="PUT",
+                endpoint=endpoint,
+                auth_header=self._get_auth_header(),
+                raw_response=self.fast_decode,
+                data=data,
+            )
+        )
+
+    async def _delete(self, *, endpoint: str) -> Any:
+        return await self._request(
+            options=RequestOptions(
+                method="DELETE",
+                endpoint=endpoint,
+                auth_header=self._get_auth_header(),
+            )
+        )
+
+    # Metric methods
+    @traced
+    async def create_metric(
+        self,
+        *,
+        name: str,
+        description: str,
+        tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
+    ) -> Metric:
+        """Adds a new evaluation metric."""
+        metric_create = MetricCreate(name=name, description=description, tags=tags)
+
+        data = await self._post(endpoint="metrics/", data=metric_create.model_dump())
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_lists()
+        return decode_metric(data)
+
+    @traced
+    async def get_metric(self, *, metric_id: UUID) -> Metric:
+        """Fetches a specific metric by its unique identifier."""
+        if self.metric_cache is not None:
+            cached_metric = self.metric_cache.get_metric(metric_id=metric_id)
+            if cached_metric is not None:
+                return cached_metric
+
+        data = await self._get(endpoint=f"metrics/{metric_id}")
+        metric = decode_metric(data)
+        if self.metric_cache is not None:
+            self.metric_cache.set_metric(metric=metric)
+        return metric
+
+    @traced
+    async def get_metrics(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = DEFAULT_GET_LIMIT,
+        tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
+    ) -> List[Metric]:
+        """
+        Retrieve a list of metrics with optional filtering.
+
+        Pass `bypass_cache=True` to skip the `metric_cache` and fetch the
+        current metrics (which then replace the cached list).
+        """
+        params = process_get_options(
+            skip=skip,
+            limit=limit,
+            tags=tags,
+            filters=filters,
+            json_codec=self.json_codec,
+        )
+        if self.metric_cache is not None and not bypass_cache:
+            cached_metrics = self.metric_cache.get_metrics(params=params)
+            if cached_metrics is not None:
+                return cached_metrics
+
+        data = await self._get(endpoint="metrics/", params=params)
+        metrics = decode_metrics(data)
+        if self.metric_cache is not None:
+            self.metric_cache.set_metrics(params=params, metrics=metrics)
+        return metrics
+
+    async def iter_metrics(
+        self,
+        *,
+        skip: int = 0,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
+    ) -> AsyncIterator[Metric]:
+        """
+        Iterates over all metrics matching the filters.
+
+        See `Mandoline.iter_metrics`.
+        """
+
+        async def fetch_page(skip: int, limit: int) -> List[Metric]:
+            return await self.get_metrics(
+                skip=skip,
+                limit=limit,
+                tags=tags,
+                filters=filters,
+                bypass_cache=bypass_cache,
+            )
+
+        async for metric in aiterate_pages(
+            fetch_page=fetch_page,
+            skip=skip,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        ):
+            yield metric
+
+    @traced
+    async def update_metric(
+        self,
+        *,
+        metric_id: UUID,
+        name: Union[str, NotGiven] = NOT_GIVEN,
+        description: Union[str, NotGiven] = NOT_GIVEN,
+        tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
+    ) -> Metric:
+        """Modifies an existing metric's attributes."""
+        metric_update = MetricUpdate(
+            name=name,
+            description=description,
+            tags=tags,
+        )
+
+        data = await self._put(
+            endpoint=f"metrics/{metric_id}", data=metric_update.model_dump()
+        )
+        metric = decode_metric(data)
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_metric(metric_id=metric_id)
+            self.metric_cache.set_metric(metric=metric)
+        return metric
+
+    @traced
+    async def delete_metric(self, *, metric_id: UUID) -> None:
+        """Removes a metric permanently."""
+        await self._delete(endpoint=f"metrics/{metric_id}")
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_metric(metric_id=metric_id)
+
+    # Evaluation methods
+    @overload
+    async def evaluate(
+        self,
+        *,
+        metrics: List[Metric],
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[False] = False,
+    ) -> List[Evaluation]: ...
+
+    @overload
+    async def evaluate(
+        self,
+        *,
+        metrics: List[Metric],
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[True],
+    ) -> List[Union[Evaluation, MandolineError]]: ...
+
+    @traced
+    async def evaluate(
+        self,
+        *,
+        metrics: List[Metric],
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: bool = False,
+    ) -> Union[List[Evaluation], List[Union[Evaluation, MandolineError]]]:
+        """
+        Performs evaluations across multiple metrics for a given prompt-response pair.
+
+        Up to `max_concurrency` evaluations are requested at once and results
+        are returned in the same order as `metrics`; pass an
+        `AdaptiveConcurrency` instead of a number to tune the limit from
+        observed latency and rate limiting. By default the first
+        failure is raised; with `return_exceptions=True` failed metrics are
+        returned as `MandolineError`s in their slot instead.
+        """
+        evaluation_creates = [
+            EvaluationCreate(
+                metric_id=metric.id,
+                prompt=prompt,
+                response=response,
+                properties=properties,
+            )
+            for metric in metrics
+        ]
+        return await amap_concurrently(
+            func=partial(self._create_evaluation, bypass_cache=bypass_cache),
+            items=evaluation_creates,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    @traced
+    async def create_evaluation(
+        self,
+        *,
+        metric_id: UUID,
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
+    ) -> Evaluation:
+        """
+        Performs an evaluation for a single metric on a prompt-response pair.
+
+        When the client has a `result_cache`, an identical earlier request is
+        answered from the cache without a network call. Pass
+        `bypass_cache=True` to force a fresh evaluation (which then replaces
+        the cached one).
+        """
+        evaluation_create = EvaluationCreate(
+            metric_id=metric_id, prompt=prompt, response=response, properties=properties
+        )
+        return await self._create_evaluation(
+            evaluation_create, bypass_cache=bypass_cache
+        )
+
+    async def _create_evaluation(
+        self, evaluation_create: EvaluationCreate, *, bypass_cache: bool = False
+    ) -> Evaluation:
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._evaluation_cache_key(evaluation_create)
+            if not bypass_cache:
+                cached_evaluation = self.result_cache.get(cache_key)
+                if cached_evaluation is not None:
+                    return cached_evaluation
+
+        data = await self._post(
+            endpoint="evaluations/", data=evaluation_create.model_dump()
+        )
+        evaluation = decode_evaluation(data)
+        if cache_key is not None:
+            self.result_cache.set(cache_key, evaluation)
+        return evaluation
+
+    @overload
+    async def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[False] = False,
+    ) -> List[Evaluation]: ...
+
+    @overload
+    async def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[True],
+    ) -> List[Union[Evaluation, MandolineError]]: ...
+
+    @traced
+    async def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: bool = False,
+    ) -> Union[List[Evaluation], List[Union[Evaluation, MandolineError]]]:
+        """See `Mandoline.create_evaluations`."""
+        self._validate_batch_size(size=len(evaluations))
+        results: List[Any] = self._get_cached_evaluations(
+            evaluations, bypass_cache=bypass_cache
+        )
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        if misses and self._batch_supported is not False:
+            try:
+                data = await self._post(
+                    endpoint="evaluations/batch",
+                    data=to_batch_payload([evaluations[index] for index in misses]),
+                )
+                created = decode_batch_evaluations(data, count=len(misses))
+            except MandolineError as error:
+                if not is_batch_unsupported(error=error):
+                    if not return_exceptions:
+                        raise
+                    for index in misses:
+                        results[index] = error
+                    return results
+                self._batch_supported = False
+            else:
+                self._batch_supported = True
+                for index, evaluation in zip(misses, created):
+                    self._cache_evaluation(evaluations[index], evaluation)
+                    results[index] = evaluation
+                return results
+
+        fallback_results = await amap_concurrently(
+            func=partial(self._create_evaluation, bypass_cache=True),
+            items=[evaluations[index] for index in misses],
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+        for index, result in zip(misses, fallback_results):
+            results[index] = result
+        return results
+
+    async def evaluate_many(
+        self,
+        *,
+        items: Iterable[EvaluationItem],
+        max_concurrency: Concurrency = DEFAULT_BATCH_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+        bypass_cache: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Evaluates a stream of prompt-response pairs with bounded concurrency.
+
+        See `Mandoline.evaluate_many`.
+        """
+        progress = BatchProgress()
+
+        async def run(item: EvaluationItem) -> Evaluation:
+            return await self._create_evaluation(
+                to_evaluation_create(item), bypass_cache=bypass_cache
+            )
+
+        async for index, item, result in astream_concurrently(
+            func=run, items=items, max_concurrency=max_concurrency
+        ):
+            batch_result = to_batch_result(index=index, item=item, result=result)
+            record_progress(
+                progress=progress, result=batch_result, on_progress=on_progress
+            )
+            yield batch_result
+
+    @traced
+    async def get_evaluation(self, *, evaluation_id: UUID) -> Evaluation:
+        """Fetches details of a specific evaluation."""
+        data = await self._get(endpoint=f"evaluations/{evaluation_id}")
+        return decode_evaluation(data)
+
+    @traced
+    async def get_evaluations(
+        self,
+        *,
+        skip: int = 0,
+        limit: int = DEFAULT_GET_LIMIT,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> List[Evaluation]:
+        """Retrieve a list of evaluations with optional filtering."""
+        params = process_get_options(
+            skip=skip,
+            limit=limit,
+            metric_id=metric_id,
+            properties=properties,
+            filters=filters,
+            json_codec=self.json_codec,
+        )
+        data = await self._get(endpoint="evaluations/", params=params)
+        return decode_evaluations(data)
+
+    async def iter_evaluations(
+        self,
+        *,
+        skip: int = 0,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[Evaluation]:
+        """
+        Iterates over all evaluations matching the filters.
+
+        See `Mandoline.iter_evaluations`.
+        """
+
+        async def fetch_page(skip: int, limit: int) -> List[Evaluation]:
+            return await self.get_evaluations(
+                skip=skip,
+                limit=limit,
+                metric_id=metric_id,
+                properties=properties,
+                filters=filters,
+            )
+
+        async for evaluation in aiterate_pages(
+            fetch_page=fetch_page,
+            skip=skip,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        ):
+            yield evaluation
+
+    @traced
+    async def get_evaluation_frame(
+        self,
+        *,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> EvaluationFrame:
+        """See `Mandoline.get_evaluation_frame`."""
+        builder = EvaluationFrameBuilder()
+        async for evaluation in self.iter_evaluations(
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            metric_id=metric_id,
+            properties=properties,
+            filters=filters,
+        ):
+            builder.append(evaluation)
+        return builder.build()
+
+    @traced
+    async def update_evaluation(
+        self,
+        *,
+        evaluation_id: UUID,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> Evaluation:
+        """Modifies an existing evaluation's properties."""
+        evaluation_update = EvaluationUpdate(properties=properties)
+
+        data = await self._put(
+            endpoint=f"evaluations/{evaluation_id}", data=evaluation_update.model_dump()
+        )
+        return decode_evaluation(data)
+
+    @traced
+    async def delete_evaluation(self, *, evaluation_id: UUID) -> None:
+        """Removes an evaluation permanently."""
+        await self._delete(endpoint=f"evaluations/{evaluation_id}")
@@ -0,0 +1,132 @@
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+
+from mandoline.decoding import decode_evaluations
+from mandoline.errors import (
+    GenericErrorDetails,
+    HTTPErrorDetails,
+    MandolineError,
+    handle_error,
+)
+from mandoline.models import Evaluation, EvaluationCreate
+from mandoline.types import NullableSerializableDict, SerializableDict
+from mandoline.utils import make_serializable
+
+# Statuses returned by servers that do not provide the batch endpoint
+BATCH_UNSUPPORTED_STATUS_CODES = (404, 405)
+
+EvaluationItem = Union[
+    EvaluationCreate,
+    Tuple[UUID, str, str],
+    Tuple[UUID, str, str, NullableSerializableDict],
+]
+
+
+class BatchResult(BaseModel):
+    """Outcome of a single item submitted through `evaluate_many`."""
+
+    model_config = dict(arbitrary_types_allowed=True)
+
+    index: int
+    item: Any
+    evaluation: Optional[Evaluation] = None
+    error: Optional[MandolineError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchProgress(BaseModel):
+    """Running totals reported to `evaluate_many` progress callbacks."""
+
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+ProgressCallback = Callable[[BatchProgress], None]
+
+
+def to_evaluation_create(item: EvaluationItem) -> EvaluationCreate:
+    """Normalizes a batch item into an `EvaluationCreate` payload."""
+    if isinstance(item, EvaluationCreate):
+        return item
+
+    try:
+        if len(item) == 3:
+            metric_id, prompt, response = item  # type: ignore[misc]
+            return EvaluationCreate(
+                metric_id=metric_id, prompt=prompt, response=response
+            )
+        metric_id, prompt, response, properties = item  # type: ignore[misc]
+        return EvaluationCreate(
+            metric_id=metric_id,
+            prompt=prompt,
+            response=response,
+            properties=properties,
+        )
+    except (TypeError, ValueError, ValidationError) as error:
+        raise handle_error(err=error)
+
+
+def to_batch_result(
+    *, index: int, item: Any, result: Union[Evaluation, MandolineError]
+) -> BatchResult:
+    if isinstance(result, MandolineError):
+        return BatchResult(index=index, item=item, error=result)
+    return BatchResult(index=index, item=item, evaluation=result)
+
+
+def record_progress(
+    *,
+    progress: BatchProgress,
+    result: BatchResult,
+    on_progress: Optional[ProgressCallback],
+) -> None:
+    progress.completed += 1
+    if result.ok:
+        progress.succeeded += 1
+    else:
+        progress.failed += 1
+    if on_progress is not None:
+        on_progress(progress.model_copy())
+
+
+def to_batch_payload(
+    evaluation_creates: Sequence[EvaluationCreate],
+) -> SerializableDict:
+    """Builds the request body for the `evaluations/batch` endpoint."""
+    return {
+        "evaluations": [
+            make_serializable(data=evaluation_create.model_dump())
+            for evaluation_create in evaluation_creates
+        ]
+    }
+
+
+def decode_batch_evaluations(data: Any, *, count: int) -> List[Evaluation]:
+    """
+    Decodes an `evaluations/batch` response, which must hold exactly one
+    evaluation per submitted one.
+    """
+    evaluations = decode_evaluations(data)
+    if len(evaluations) != count:
+        raise MandolineError(
+            details=GenericErrorDetails(
+                message=(
+                    f"The batch response holds {len(evaluations)} evaluations "
+                    f"for {count} submitted"
+                )
+            )
+        )
+    return evaluations
+
+
+def is_batch_unsupported(*, error: MandolineError) -> bool:
+    return (
+        isinstance(error.details, HTTPErrorDetails)
+        and error.details.status_code in BATCH_UNSUPPORTED_STATUS_CODES
+    )
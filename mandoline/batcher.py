@@ -0,0 +1,176 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import List, Optional, Set, Tuple, Type
+
+from mandoline.batch import EvaluationItem, to_evaluation_create
+from mandoline.client import Mandoline
+from mandoline.concurrency import Concurrency, submit_in_context
+from mandoline.config import (
+    DEFAULT_BATCH_WAIT,
+    DEFAULT_BATCHER_CONCURRENCY,
+    DEFAULT_EVALUATE_CONCURRENCY,
+    MAX_BATCH_SIZE,
+)
+from mandoline.errors import MandolineError
+from mandoline.models import Evaluation, EvaluationCreate
+
+PendingItem = Tuple[EvaluationCreate, "Future[Evaluation]", float]
+
+
+class EvaluationBatcher:
+    """
+    Groups individually submitted evaluations into batch requests.
+
+    `submit()` queues an evaluation and returns a future for its result.
+    A batch is sent as soon as `max_batch_size` evaluations are queued, or
+    once the oldest queued evaluation has waited `max_wait` seconds, and up
+    to `max_concurrency` batches are in flight at once. Batches go through
+    `Mandoline.create_evaluations`, so they fall back to concurrent single
+    requests (up to `fallback_concurrency` per batch) when the server has
+    no batch endpoint.
+
+    Call `close()` when done, or use the batcher as a context manager;
+    both send whatever is still queued and wait for it to complete.
+    """
+
+    def __init__(
+        self,
+        client: Mandoline,
+        *,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_BATCH_WAIT,
+        max_concurrency: int = DEFAULT_BATCHER_CONCURRENCY,
+        fallback_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+    ):
+        if not 1 <= max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"max_batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        if max_wait < 0:
+            raise ValueError("max_wait must not be negative")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.fallback_concurrency = fallback_concurrency
+        self.bypass_cache = bypass_cache
+
+        self._condition = threading.Condition()
+        self._pending: List[PendingItem] = []
+        self._outstanding: Set["Future[Evaluation]"] = set()
+        self._flush_requested = False
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        # Batches mix callers, so they are traced under the creator's context
+        self._dispatcher = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._dispatch,),
+            name="mandoline-batcher",
+            daemon=True,
+        )
+        self._dispatcher.start()
+
+    def submit(self, item: EvaluationItem) -> "Future[Evaluation]":
+        """Queues an evaluation and returns a future for its result."""
+        evaluation_create = to_evaluation_create(item)
+        future: "Future[Evaluation]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed EvaluationBatcher")
+            self._pending.append((evaluation_create, future, time.monotonic()))
+            self._outstanding.add(future)
+            self._condition.notify()
+        future.add_done_callback(self._forget)
+        return future
+
+    def flush(self) -> None:
+        """Sends everything queued so far and waits until it has completed."""
+        with self._condition:
+            futures = list(self._outstanding)
+            self._flush_requested = True
+            self._condition.notify()
+        wait(futures)
+
+    def close(self) -> None:
+        """Flushes the queue and stops the batcher."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "EvaluationBatcher":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _forget(self, future: "Future[Evaluation]") -> None:
+        with self._condition:
+            self._outstanding.discard(future)
+
+    def _dispatch(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            submit_in_context(self._executor, self._send, batch)
+
+    def _next_batch(self) -> Optional[List[PendingItem]]:
+        """Blocks until a batch is due; returns None once closed and drained."""
+        with self._condition:
+            while True:
+                if self._pending:
+                    waited = time.monotonic() - self._pending[0][2]
+                    if (
+                        len(self._pending) >= self.max_batch_size
+                        or self._flush_requested
+                        or self._closed
+                        or waited >= self.max_wait
+                    ):
+                        break
+                    self._condition.wait(self.max_wait - waited)
+                elif self._closed:
+                    return None
+                else:
+                    self._flush_requested = False
+                    self._condition.wait()
+
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            if not self._pending:
+                self._flush_requested = False
+
+        # Evaluations cancelled by the caller while queued are not sent
+        return [item for item in batch if item[1].set_running_or_notify_cancel()]
+
+    def _send(self, batch: List[PendingItem]) -> None:
+        if not batch:
+            return
+
+        try:
+            results = self.client.create_evaluations(
+                evaluations=[evaluation_create for evaluation_create, _, _ in batch],
+                max_concurrency=self.fallback_concurrency,
+                bypass_cache=self.bypass_cache,
+                return_exceptions=True,
+            )
+        except BaseException as error:
+            for _, future, _ in batch:
+                future.set_exception(error)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if isinstance(result, MandolineError):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
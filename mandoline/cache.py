@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from mandoline.config import CACHE_MAXSIZE
+from mandoline.models import Metric
+from mandoline.types import SerializableDict
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe in-memory cache with LRU eviction and optional expiry.
+
+    Entries older than `ttl` seconds are treated as missing (`ttl=None`
+    keeps them until evicted). Once `maxsize` entries are stored, the
+    least recently used one is evicted.
+    """
+
+    def __init__(self, *, maxsize: int = CACHE_MAXSIZE, ttl: Optional[float]):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def make_params_key(*, params: SerializableDict) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+class MetricCache:
+    """
+    Cache for metric definitions, keyed by metric ID and by list query.
+
+    Single metrics and tag/filter-filtered metric lists are stored
+    separately. Any metric change drops every cached list, because the
+    changed metric may now match (or stop matching) any of them.
+    Cached `Metric` objects are shared between callers and should be
+    treated as read-only.
+    """
+
+    def __init__(self, *, ttl: float, maxsize: int = CACHE_MAXSIZE):
+        self._metrics: TTLCache[UUID, Metric] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lists: TTLCache[Tuple[Tuple[str, str], ...], List[Metric]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    def get_metric(self, *, metric_id: UUID) -> Optional[Metric]:
+        return self._metrics.get(metric_id)
+
+    def set_metric(self, *, metric: Metric) -> None:
+        self._metrics.set(metric.id, metric)
+
+    def get_metrics(self, *, params: SerializableDict) -> Optional[List[Metric]]:
+        metrics = self._lists.get(make_params_key(params=params))
+        return list(metrics) if metrics is not None else None
+
+    def set_metrics(self, *, params: SerializableDict, metrics: List[Metric]) -> None:
+        self._lists.set(make_params_key(params=params), list(metrics))
+        for metric in metrics:
+            self.set_metric(metric=metric)
+
+    def invalidate_metric(self, *, metric_id: UUID) -> None:
+        self._metrics.invalidate(metric_id)
+        self._lists.clear()
+
+    def invalidate_lists(self) -> None:
+        self._lists.clear()
+
+    def clear(self) -> None:
+        self._metrics.clear()
+        self._lists.clear()
@@ -1,10 +1,64 @@
-import json
 import os
-from typing import Any, List, Optional, Union
+from abc import ABC, abstractmethod
+from functools import partial
+from types import TracebackType
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    overload,
+)
 from uuid import UUID
 
-from mandoline.config import DEFAULT_GET_LIMIT, MAX_GET_LIMIT, MandolineRequestConfig
-from mandoline.connection_manager import RequestOptions, make_request
+from httpx import Client
+
+from mandoline.batch import (
+    BatchProgress,
+    BatchResult,
+    EvaluationItem,
+    ProgressCallback,
+    decode_batch_evaluations,
+    is_batch_unsupported,
+    record_progress,
+    to_batch_payload,
+    to_batch_result,
+    to_evaluation_create,
+)
+from mandoline.cache import MetricCache
+from mandoline.compression import validate_compression
+from mandoline.concurrency import Concurrency, map_concurrently, stream_concurrently
+from mandoline.config import (
+    CACHE_MAXSIZE,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_EVALUATE_CONCURRENCY,
+    DEFAULT_GET_LIMIT,
+    MAX_BATCH_SIZE,
+    MAX_GET_LIMIT,
+    MandolineRequestConfig,
+    RetryConfig,
+)
+from mandoline.connection_manager import (
+    RequestOptions,
+    create_http_client,
+    make_request,
+    make_request_key,
+)
+from mandoline.decoding import (
+    decode_evaluation,
+    decode_evaluations,
+    decode_metric,
+    decode_metrics,
+)
+from mandoline.errors import MandolineError
+from mandoline.frame import EvaluationFrame
+from mandoline.hooks import RequestHook
+from mandoline.json_codec import DEFAULT_JSON_CODEC, JSONCodec, get_json_codec
 from mandoline.models import (
     Evaluation,
     EvaluationCreate,
@@ -13,6 +67,20 @@ from mandoline.models import (
     MetricCreate,
     MetricUpdate,
 )
+from mandoline.pagination import iterate_pages
+from mandoline.rate_limiter import RateLimiter
+from mandoline.result_cache import (
+    ResultCache,
+    make_cache_namespace,
+    make_evaluation_key,
+)
+from mandoline.singleflight import SingleFlight
+from mandoline.tracing import (
+    TracingHook,
+    traced,
+    tracing_available,
+    tracing_configured,
+)
 from mandoline.types import (
     Headers,
     NotGiven,
@@ -23,14 +91,8 @@ from mandoline.types import (
 from mandoline.utils import NOT_GIVEN
 
 
-class Mandoline:
-    """
-    Mandoline client for interacting with the Mandoline API.
-
-    This class provides methods to create, retrieve, update, and delete
-    metrics and evaluations. It handles authentication and request
-    management to the Mandoline API.
-    """
+class BaseMandoline(ABC):
+    """Configuration and authentication shared by the sync and async clients."""
 
     def __init__(
         self,
@@ -39,6 +101,22 @@ class Mandoline:
         api_base_url: Optional[str] = None,
         connect_timeout: Optional[float] = None,
         rwp_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        compression: Optional[Literal["gzip", "zstd"]] = None,
+        compression_threshold: Optional[int] = None,
+        retry: Optional[RetryConfig] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        metric_cache_ttl: Optional[float] = None,
+        metric_cache_maxsize: int = CACHE_MAXSIZE,
+        result_cache: Optional[ResultCache] = None,
+        coalesce_requests: bool = True,
+        fast_decode: bool = False,
+        json_codec: Optional[Union[JSONCodec, str]] = None,
+        hooks: Optional[Sequence[RequestHook]] = None,
+        tracing: bool = True,
     ):
         """Creates a new Mandoline client instance."""
         self.api_key = api_key or os.environ.get("MANDOLINE_API_KEY")
@@ -47,6 +125,13 @@ class Mandoline:
             "api_base_url": api_base_url or os.environ.get("MANDOLINE_API_BASE_URL"),
             "connect_timeout": connect_timeout,
             "rwp_timeout": rwp_timeout,
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+            "http2": http2,
+            "compression": compression,
+            "compression_threshold": compression_threshold,
+            "retry": retry,
         }
         # Remove None values – Pydantic will use default values
         config_dict = {k: v for k, v in config_dict.items() if v is not None}
@@ -54,6 +139,48 @@ class Mandoline:
         self.request_config = MandolineRequestConfig.model_validate(
             obj=config_dict, strict=True
         )
+        if self.request_config.compression is not None:
+            validate_compression(encoding=self.request_config.compression)
+        self.rate_limiter = rate_limiter
+        # Metric definitions rarely change, so they can be cached on request
+        self.metric_cache: Optional[MetricCache] = (
+            MetricCache(ttl=metric_cache_ttl, maxsize=metric_cache_maxsize)
+            if metric_cache_ttl is not None
+            else None
+        )
+        self.result_cache = result_cache
+        # Cached results are only valid for the API and account they came from
+        self._cache_namespace = make_cache_namespace(
+            api_base_url=self.request_config.api_base_url, api_key=self.api_key
+        )
+        # Parse and validate response bytes in one pass instead of via dicts
+        self.fast_decode = fast_decode
+        self.json_codec = get_json_codec(json_codec)
+        # Observers of every request attempt, e.g. a StatsCollector
+        self.hooks: List[RequestHook] = list(hooks or ())
+        # Spans for methods and their attempts, see `_request_hooks`
+        self.tracing = tracing
+        self._tracing_hook = TracingHook() if tracing and tracing_available() else None
+        # Concurrent identical GETs share a single network call
+        self._single_flight = (
+            self._create_single_flight() if coalesce_requests else None
+        )
+        # Unknown until the first batch request tells us
+        self._batch_supported: Optional[bool] = None
+        self._http_client = self._create_http_client()
+
+    @abstractmethod
+    def _create_http_client(self) -> Any: ...
+
+    def _request_hooks(self) -> Sequence[RequestHook]:
+        # Decided per request: only once a tracer provider is set (possibly
+        # after the client was created) are attempts worth tracing
+        if self._tracing_hook is not None and tracing_configured():
+            return [*self.hooks, self._tracing_hook]
+        return self.hooks
+
+    @abstractmethod
+    def _create_single_flight(self) -> Any: ...
 
     def _get_auth_header(self) -> Headers:
         if not self.api_key:
@@ -62,54 +189,134 @@ class Mandoline:
             )
         return {"X-API-KEY": self.api_key}
 
-    def _get(self, *, endpoint: str, params: Optional[SerializableDict] = None) -> Any:
+    def _validate_get_params(self, *, params: Optional[SerializableDict]) -> None:
         if params and params.get("limit") and params["limit"] > MAX_GET_LIMIT:
             raise ValueError(
                 f"Limit exceeds maximum allowed value of {MAX_GET_LIMIT}. Please reduce the limit."
             )
+
+    def _validate_batch_size(self, *, size: int) -> None:
+        if size > MAX_BATCH_SIZE:
+            raise ValueError(
+                f"Batch size exceeds maximum allowed value of {MAX_BATCH_SIZE}. Please split the batch."
+            )
+
+    def _get_cached_evaluations(
+        self, evaluation_creates: Sequence[EvaluationCreate], *, bypass_cache: bool
+    ) -> List[Optional[Evaluation]]:
+        if self.result_cache is None or bypass_cache:
+            return [None] * len(evaluation_creates)
+        return [
+            self.result_cache.get(self._evaluation_cache_key(evaluation_create))
+            for evaluation_create in evaluation_creates
+        ]
+
+    def _cache_evaluation(
+        self, evaluation_create: EvaluationCreate, evaluation: Evaluation
+    ) -> None:
+        if self.result_cache is not None:
+            self.result_cache.set(
+                self._evaluation_cache_key(evaluation_create), evaluation
+            )
+
+    def _evaluation_cache_key(self, evaluation_create: EvaluationCreate) -> str:
+        return make_evaluation_key(evaluation_create, namespace=self._cache_namespace)
+
+
+class Mandoline(BaseMandoline):
+    """
+    Mandoline client for interacting with the Mandoline API.
+
+    This class provides methods to create, retrieve, update, and delete
+    metrics and evaluations. It handles authentication and request
+    management to the Mandoline API.
+
+    The client keeps a pool of persistent connections open between
+    requests. Call `close()` when you are done with it, or use it as a
+    context manager.
+    """
+
+    _http_client: Client
+
+    def _create_http_client(self) -> Client:
+        return create_http_client(config=self.request_config)
+
+    def _create_single_flight(self) -> SingleFlight:
+        return SingleFlight()
+
+    def close(self) -> None:
+        """Closes the underlying connection pool."""
+        self._http_client.close()
+
+    def __enter__(self) -> "Mandoline":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _request(self, *, options: RequestOptions) -> Any:
         return make_request(
+            client=self._http_client,
             config=self.request_config,
-            options=RequestOptions(
-                method="GET",
-                endpoint=endpoint,
-                auth_header=self._get_auth_header(),
-                params=params,
-            ),
+            options=options,
+            rate_limiter=self.rate_limiter,
+            json_codec=self.json_codec,
+            hooks=self._request_hooks(),
+        )
+
+    def _get(self, *, endpoint: str, params: Optional[SerializableDict] = None) -> Any:
+        self._validate_get_params(params=params)
+        options = RequestOptions(
+            method="GET",
+            endpoint=endpoint,
+            auth_header=self._get_auth_header(),
+            raw_response=self.fast_decode,
+            params=params,
+        )
+        if self._single_flight is None:
+            return self._request(options=options)
+        return self._single_flight.do(
+            make_request_key(options=options), lambda: self._request(options=options)
         )
 
     def _post(self, *, endpoint: str, data: SerializableDict) -> Any:
-        return make_request(
-            config=self.request_config,
+        return self._request(
             options=RequestOptions(
                 method="POST",
                 endpoint=endpoint,
                 auth_header=self._get_auth_header(),
+                raw_response=self.fast_decode,
                 data=data,
-            ),
+            )
         )
 
     def _put(self, *, endpoint: str, data: SerializableDict) -> Any:
-        return make_request(
-            config=self.request_config,
+        return self._request(
             options=RequestOptions(
                 method="PUT",
                 endpoint=endpoint,
                 auth_header=self._get_auth_header(),
+                raw_response=self.fast_decode,
                 data=data,
-            ),
+            )
         )
 
     def _delete(self, *, endpoint: str) -> Any:
-        return make_request(
-            config=self.request_config,
+        return self._request(
             options=RequestOptions(
                 method="DELETE",
                 endpoint=endpoint,
                 auth_header=self._get_auth_header(),
-            ),
+            )
         )
 
     # Metric methods
+    @traced
     def create_metric(
         self,
         *,
@@ -121,13 +328,25 @@ class Mandoline:
         metric_create = MetricCreate(name=name, description=description, tags=tags)
 
         data = self._post(endpoint="metrics/", data=metric_create.model_dump())
-        return Metric.model_validate(data)
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_lists()
+        return decode_metric(data)
 
+    @traced
     def get_metric(self, *, metric_id: UUID) -> Metric:
         """Fetches a specific metric by its unique identifier."""
+        if self.metric_cache is not None:
+            cached_metric = self.metric_cache.get_metric(metric_id=metric_id)
+            if cached_metric is not None:
+                return cached_metric
+
         data = self._get(endpoint=f"metrics/{metric_id}")
-        return Metric.model_validate(data)
+        metric = decode_metric(data)
+        if self.metric_cache is not None:
+            self.metric_cache.set_metric(metric=metric)
+        return metric
 
+    @traced
     def get_metrics(
         self,
         *,
@@ -135,12 +354,68 @@ class Mandoline:
         limit: int = DEFAULT_GET_LIMIT,
         tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
         filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
     ) -> List[Metric]:
-        """Retrieve a list of metrics with optional filtering."""
-        params = process_get_options(skip=skip, limit=limit, tags=tags, filters=filters)
+        """
+        Retrieve a list of metrics with optional filtering.
+
+        Pass `bypass_cache=True` to skip the `metric_cache` and fetch the
+        current metrics (which then replace the cached list).
+        """
+        params = process_get_options(
+            skip=skip,
+            limit=limit,
+            tags=tags,
+            filters=filters,
+            json_codec=self.json_codec,
+        )
+        if self.metric_cache is not None and not bypass_cache:
+            cached_metrics = self.metric_cache.get_metrics(params=params)
+            if cached_metrics is not None:
+                return cached_metrics
+
         data = self._get(endpoint="metrics/", params=params)
-        return [Metric.model_validate(metric_data) for metric_data in data]
+        metrics = decode_metrics(data)
+        if self.metric_cache is not None:
+            self.metric_cache.set_metrics(params=params, metrics=metrics)
+        return metrics
 
+    def iter_metrics(
+        self,
+        *,
+        skip: int = 0,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        tags: Union[NullableStringArray, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
+    ) -> Iterator[Metric]:
+        """
+        Iterates over all metrics matching the filters, page by page.
+
+        The next page is prefetched while the current one is consumed, so
+        memory use stays bounded by a few pages regardless of result size.
+        Raise `max_concurrency` to download that many pages in parallel.
+        """
+
+        def fetch_page(skip: int, limit: int) -> List[Metric]:
+            return self.get_metrics(
+                skip=skip,
+                limit=limit,
+                tags=tags,
+                filters=filters,
+                bypass_cache=bypass_cache,
+            )
+
+        for metric in iterate_pages(
+            fetch_page=fetch_page,
+            skip=skip,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        ):
+            yield metric
+
+    @traced
     def update_metric(
         self,
         *,
@@ -159,13 +434,21 @@ class Mandoline:
         data = self._put(
             endpoint=f"metrics/{metric_id}", data=metric_update.model_dump()
         )
-        return Metric.model_validate(data)
+        metric = decode_metric(data)
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_metric(metric_id=metric_id)
+            self.metric_cache.set_metric(metric=metric)
+        return metric
 
+    @traced
     def delete_metric(self, *, metric_id: UUID) -> None:
         """Removes a metric permanently."""
         self._delete(endpoint=f"metrics/{metric_id}")
+        if self.metric_cache is not None:
+            self.metric_cache.invalidate_metric(metric_id=metric_id)
 
     # Evaluation methods
+    @overload
     def evaluate(
         self,
         *,
@@ -173,25 +456,63 @@ class Mandoline:
         prompt: str,
         response: str,
         properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
-    ) -> List[Evaluation]:
-        """Performs evaluations across multiple metrics for a given prompt-response pair."""
-        evaluations = []
-        for metric in metrics:
-            evaluation_create = EvaluationCreate(
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[False] = False,
+    ) -> List[Evaluation]: ...
+
+    @overload
+    def evaluate(
+        self,
+        *,
+        metrics: List[Metric],
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[True],
+    ) -> List[Union[Evaluation, MandolineError]]: ...
+
+    @traced
+    def evaluate(
+        self,
+        *,
+        metrics: List[Metric],
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: bool = False,
+    ) -> Union[List[Evaluation], List[Union[Evaluation, MandolineError]]]:
+        """
+        Performs evaluations across multiple metrics for a given prompt-response pair.
+
+        Up to `max_concurrency` evaluations are requested at once and results
+        are returned in the same order as `metrics`; pass an
+        `AdaptiveConcurrency` instead of a number to tune the limit from
+        observed latency and rate limiting. By default the first
+        failure is raised; with `return_exceptions=True` failed metrics are
+        returned as `MandolineError`s in their slot instead.
+        """
+        evaluation_creates = [
+            EvaluationCreate(
                 metric_id=metric.id,
                 prompt=prompt,
                 response=response,
                 properties=properties,
             )
+            for metric in metrics
+        ]
+        return map_concurrently(
+            func=partial(self._create_evaluation, bypass_cache=bypass_cache),
+            items=evaluation_creates,
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
 
-            data = self._post(
-                endpoint="evaluations/", data=evaluation_create.model_dump()
-            )
-            evaluation = Evaluation.model_validate(data)
-
-            evaluations.append(evaluation)
-        return evaluations
-
+    @traced
     def create_evaluation(
         self,
         *,
@@ -199,20 +520,157 @@ class Mandoline:
         prompt: str,
         response: str,
         properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        bypass_cache: bool = False,
     ) -> Evaluation:
-        """Performs an evaluation for a single metric on a prompt-response pair."""
+        """
+        Performs an evaluation for a single metric on a prompt-response pair.
+
+        When the client has a `result_cache`, an identical earlier request is
+        answered from the cache without a network call. Pass
+        `bypass_cache=True` to force a fresh evaluation (which then replaces
+        the cached one).
+        """
         evaluation_create = EvaluationCreate(
             metric_id=metric_id, prompt=prompt, response=response, properties=properties
         )
+        return self._create_evaluation(evaluation_create, bypass_cache=bypass_cache)
+
+    def _create_evaluation(
+        self, evaluation_create: EvaluationCreate, *, bypass_cache: bool = False
+    ) -> Evaluation:
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self._evaluation_cache_key(evaluation_create)
+            if not bypass_cache:
+                cached_evaluation = self.result_cache.get(cache_key)
+                if cached_evaluation is not None:
+                    return cached_evaluation
 
         data = self._post(endpoint="evaluations/", data=evaluation_create.model_dump())
-        return Evaluation.model_validate(data)
+        evaluation = decode_evaluation(data)
+        if cache_key is not None:
+            self.result_cache.set(cache_key, evaluation)
+        return evaluation
+
+    @overload
+    def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[False] = False,
+    ) -> List[Evaluation]: ...
+
+    @overload
+    def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: Literal[True],
+    ) -> List[Union[Evaluation, MandolineError]]: ...
+
+    @traced
+    def create_evaluations(
+        self,
+        *,
+        evaluations: Sequence[EvaluationCreate],
+        max_concurrency: Concurrency = DEFAULT_EVALUATE_CONCURRENCY,
+        bypass_cache: bool = False,
+        return_exceptions: bool = False,
+    ) -> Union[List[Evaluation], List[Union[Evaluation, MandolineError]]]:
+        """
+        Performs up to `MAX_BATCH_SIZE` evaluations in a single request.
+
+        Results are returned in the same order as `evaluations`. If the
+        server does not provide the batch endpoint, the client remembers
+        this and sends the evaluations as concurrent single requests (up to
+        `max_concurrency` at once) from then on. Cached results and
+        failures are handled as in `evaluate`; a failed batch request fails
+        every evaluation in it.
+        """
+        self._validate_batch_size(size=len(evaluations))
+        results: List[Any] = self._get_cached_evaluations(
+            evaluations, bypass_cache=bypass_cache
+        )
+        misses = [index for index, result in enumerate(results) if result is None]
+
+        if misses and self._batch_supported is not False:
+            try:
+                data = self._post(
+                    endpoint="evaluations/batch",
+                    data=to_batch_payload([evaluations[index] for index in misses]),
+                )
+                created = decode_batch_evaluations(data, count=len(misses))
+            except MandolineError as error:
+                if not is_batch_unsupported(error=error):
+                    if not return_exceptions:
+                        raise
+                    for index in misses:
+                        results[index] = error
+                    return results
+                self._batch_supported = False
+            else:
+                self._batch_supported = True
+                for index, evaluation in zip(misses, created):
+                    self._cache_evaluation(evaluations[index], evaluation)
+                    results[index] = evaluation
+                return results
+
+        # The cache was already checked above, so only the store is needed
+        fallback_results = map_concurrently(
+            func=partial(self._create_evaluation, bypass_cache=True),
+            items=[evaluations[index] for index in misses],
+            max_concurrency=max_concurrency,
+            return_exceptions=return_exceptions,
+        )
+        for index, result in zip(misses, fallback_results):
+            results[index] = result
+        return results
 
+    def evaluate_many(
+        self,
+        *,
+        items: Iterable[EvaluationItem],
+        max_concurrency: Concurrency = DEFAULT_BATCH_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+        bypass_cache: bool = False,
+    ) -> Iterator[BatchResult]:
+        """
+        Evaluates a stream of prompt-response pairs with bounded concurrency.
+
+        Each item is an `EvaluationCreate` or a `(metric_id, prompt, response)`
+        / `(metric_id, prompt, response, properties)` tuple. Items are pulled
+        lazily, at most `max_concurrency` requests are in flight (a fixed
+        number or an `AdaptiveConcurrency` controller), and a
+        `BatchResult` is yielded for every item as it completes. Failures are
+        reported on the result instead of aborting the batch.
+        """
+        progress = BatchProgress()
+
+        def run(item: EvaluationItem) -> Evaluation:
+            return self._create_evaluation(
+                to_evaluation_create(item), bypass_cache=bypass_cache
+            )
+
+        for index, item, result in stream_concurrently(
+            func=run, items=items, max_concurrency=max_concurrency
+        ):
+            batch_result = to_batch_result(index=index, item=item, result=result)
+            record_progress(
+                progress=progress, result=batch_result, on_progress=on_progress
+            )
+            yield batch_result
+
+    @traced
     def get_evaluation(self, *, evaluation_id: UUID) -> Evaluation:
         """Fetches details of a specific evaluation."""
         data = self._get(endpoint=f"evaluations/{evaluation_id}")
-        return Evaluation.model_validate(data)
+        return decode_evaluation(data)
 
+    @traced
     def get_evaluations(
         self,
         *,
@@ -229,10 +687,74 @@ class Mandoline:
             metric_id=metric_id,
             properties=properties,
             filters=filters,
+            json_codec=self.json_codec,
         )
         data = self._get(endpoint="evaluations/", params=params)
-        return [Evaluation.model_validate(evaluation_data) for evaluation_data in data]
+        return decode_evaluations(data)
+
+    def iter_evaluations(
+        self,
+        *,
+        skip: int = 0,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[Evaluation]:
+        """
+        Iterates over all evaluations matching the filters, page by page.
+
+        The next page is prefetched while the current one is consumed, so
+        memory use stays bounded by a few pages regardless of result size.
+        For bulk exports, raise `max_concurrency` to download that many
+        pages in parallel; results are still yielded in order.
+        """
+
+        def fetch_page(skip: int, limit: int) -> List[Evaluation]:
+            return self.get_evaluations(
+                skip=skip,
+                limit=limit,
+                metric_id=metric_id,
+                properties=properties,
+                filters=filters,
+            )
+
+        for evaluation in iterate_pages(
+            fetch_page=fetch_page,
+            skip=skip,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+        ):
+            yield evaluation
+
+    @traced
+    def get_evaluation_frame(
+        self,
+        *,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+        filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> EvaluationFrame:
+        """
+        Downloads all matching evaluations into a compact `EvaluationFrame`.
+
+        Pages are added to the frame as they arrive, so only a few pages
+        of `Evaluation` objects exist at any time. Requires numpy.
+        """
+        return EvaluationFrame.from_evaluations(
+            self.iter_evaluations(
+                page_size=page_size,
+                max_concurrency=max_concurrency,
+                metric_id=metric_id,
+                properties=properties,
+                filters=filters,
+            )
+        )
 
+    @traced
     def update_evaluation(
         self,
         *,
@@ -245,8 +767,9 @@ class Mandoline:
         data = self._put(
             endpoint=f"evaluations/{evaluation_id}", data=evaluation_update.model_dump()
         )
-        return Evaluation.model_validate(data)
+        return decode_evaluation(data)
 
+    @traced
     def delete_evaluation(self, *, evaluation_id: UUID) -> None:
         """Removes an evaluation permanently."""
         self._delete(endpoint=f"evaluations/{evaluation_id}")
@@ -263,6 +786,7 @@ def process_get_options(
     metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
     properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
     filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
 ) -> SerializableDict:
     params: SerializableDict = {"skip": skip, "limit": limit}
 
@@ -283,6 +807,6 @@ def process_get_options(
         _filters.update(filters)
 
     if _filters:
-        params["filters"] = json.dumps(_filters)
+        params["filters"] = json_codec.dumps(_filters).decode("utf-8")
 
     return params
@@ -0,0 +1,41 @@
+import gzip
+from typing import Dict, Tuple
+
+from mandoline.config import GZIP_COMPRESSION_LEVEL, ZSTD_COMPRESSION_LEVEL
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+
+def validate_compression(*, encoding: str) -> None:
+    if encoding == "zstd" and zstandard is None:
+        raise ImportError(
+            "zstd compression requires the `zstandard` package: pip install zstandard"
+        )
+
+
+def compress(*, content: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        # A fixed mtime keeps the output identical for identical bodies
+        return gzip.compress(content, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0)
+    if encoding == "zstd":
+        validate_compression(encoding=encoding)
+        return zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(content)
+    raise ValueError(f"Unsupported compression: {encoding}")
+
+
+def compress_body(
+    *, content: bytes, encoding: str, threshold: int
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Compresses a request body of at least `threshold` bytes.
+
+    Returns the body to send and the headers to add to the request.
+    Smaller bodies are returned unchanged, since compressing them costs
+    more time than it saves.
+    """
+    if len(content) < threshold:
+        return content, {}
+    return compress(content=content, encoding=encoding), {"Content-Encoding": encoding}
@@ -0,0 +1,329 @@
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from mandoline.errors import HTTPErrorDetails, MandolineError, MandolineErrorType
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+CONGESTION_ERROR_TYPES = (
+    MandolineErrorType.RateLimitExceeded,
+    MandolineErrorType.TimeoutError,
+)
+CONGESTION_STATUS_CODES = (429, 503)
+
+
+def submit_in_context(
+    executor: ThreadPoolExecutor, func: Callable[..., R], *args: Any
+) -> "Future[R]":
+    """
+    Submits `func` to run in a copy of the caller's context, so context
+    variables such as the current tracing span carry over to the worker.
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD (additive increase, multiplicative decrease) concurrency limit.
+
+    The limit grows by `increase` per window of successful calls while
+    latency stays under `latency_target`, and is multiplied by
+    `decrease_factor` when a call is rate limited, times out or exceeds
+    `latency_target`. Rate limits and timeouts count per request attempt,
+    so they cut the limit even when a retry then succeeds. Failures of
+    calls that started before the last decrease are ignored, so a burst of
+    failures from the same congestion event only cuts the limit once.
+
+    Pass an instance as `max_concurrency` to `evaluate` or `evaluate_many`;
+    it can be shared by several concurrent jobs and read through `limit`.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_target: Optional[float] = None,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if increase <= 0:
+            raise ValueError("increase must be greater than 0")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+
+        self._limit = float(initial_limit)
+        self._last_decrease_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of calls currently allowed in flight."""
+        return int(self._limit)
+
+    def record_success(self, *, latency: float) -> None:
+        if self.latency_target is not None and latency > self.latency_target:
+            self._decrease(latency=latency)
+            return
+
+        with self._lock:
+            # Grows by `increase` once every `limit` successful calls
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+    def record_failure(self, *, error: MandolineError, latency: float) -> None:
+        if is_congestion_error(error=error):
+            self._decrease(latency=latency)
+
+    def _decrease(self, *, latency: float) -> None:
+        started_at = time.monotonic() - latency
+        with self._lock:
+            # Calls sent before the last decrease belong to the same congestion event
+            if started_at < self._last_decrease_at:
+                return
+            self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+            self._last_decrease_at = time.monotonic()
+
+
+Concurrency = Union[int, AdaptiveConcurrency]
+
+# The controller of the fan-out the current call runs in, so that request
+# attempts failing inside it (even ones retried to success) reach it
+CURRENT_CONTROLLER: ContextVar[Optional[AdaptiveConcurrency]] = ContextVar(
+    "mandoline_concurrency_controller", default=None
+)
+
+
+def record_attempt_failure(*, error: MandolineError, started_at: float) -> None:
+    """Reports a failed request attempt to the current call's controller."""
+    controller = CURRENT_CONTROLLER.get()
+    if controller is not None:
+        controller.record_failure(error=error, latency=time.monotonic() - started_at)
+
+
+def is_congestion_error(*, error: MandolineError) -> bool:
+    if error.details.type in CONGESTION_ERROR_TYPES:
+        return True
+    return (
+        isinstance(error.details, HTTPErrorDetails)
+        and error.details.status_code in CONGESTION_STATUS_CODES
+    )
+
+
+def get_max_workers(*, max_concurrency: Concurrency) -> int:
+    if isinstance(max_concurrency, AdaptiveConcurrency):
+        return max_concurrency.max_limit
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return max_concurrency
+
+
+def get_current_limit(*, max_concurrency: Concurrency) -> int:
+    if isinstance(max_concurrency, AdaptiveConcurrency):
+        return max_concurrency.limit
+    return max_concurrency
+
+
+def record_result(
+    *,
+    max_concurrency: Concurrency,
+    result: Union[R, MandolineError],
+    started_at: float,
+) -> None:
+    if not isinstance(max_concurrency, AdaptiveConcurrency):
+        return
+    latency = time.monotonic() - started_at
+    if isinstance(result, MandolineError):
+        max_concurrency.record_failure(error=result, latency=latency)
+    else:
+        max_concurrency.record_success(latency=latency)
+
+
+def map_concurrently(
+    *,
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_concurrency: Concurrency,
+    return_exceptions: bool = False,
+) -> List[Union[R, MandolineError]]:
+    """
+    Applies `func` to every item using a bounded thread pool.
+
+    Results keep the order of `items`. When `return_exceptions` is False the
+    first `MandolineError` cancels the calls that have not started yet and
+    is raised; otherwise failed items are returned as `MandolineError`s.
+    """
+    results: List[Union[R, MandolineError]] = [None] * len(items)  # type: ignore
+    stream = stream_concurrently(
+        func=func, items=items, max_concurrency=max_concurrency
+    )
+    try:
+        for index, _, result in stream:
+            if isinstance(result, MandolineError) and not return_exceptions:
+                raise result
+            results[index] = result
+    finally:
+        stream.close()  # type: ignore[attr-defined]
+    return results
+
+
+async def amap_concurrently(
+    *,
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    max_concurrency: Concurrency,
+    return_exceptions: bool = False,
+) -> List[Union[R, MandolineError]]:
+    """Asyncio counterpart of `map_concurrently`."""
+    results: List[Union[R, MandolineError]] = [None] * len(items)  # type: ignore
+    stream = astream_concurrently(
+        func=func, items=items, max_concurrency=max_concurrency
+    )
+    try:
+        async for index, _, result in stream:
+            if isinstance(result, MandolineError) and not return_exceptions:
+                raise result
+            results[index] = result
+    finally:
+        await stream.aclose()  # type: ignore[attr-defined]
+    return results
+
+
+def stream_concurrently(
+    *,
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: Concurrency,
+) -> Iterator[Tuple[int, T, Union[R, MandolineError]]]:
+    """
+    Lazily applies `func` to `items` with a bounded number of calls in flight.
+
+    Yields `(index, item, result)` tuples in completion order, where a failed
+    call yields its `MandolineError` as the result. Items are only pulled
+    from `items` when a slot frees up, so arbitrarily large (or unbounded)
+    iterables are processed with bounded memory. `max_concurrency` is either
+    a fixed limit or an `AdaptiveConcurrency` controller.
+    """
+    max_workers = get_max_workers(max_concurrency=max_concurrency)
+
+    def call(item: T) -> Union[R, MandolineError]:
+        # Each call runs in its own copy of the context, so this does not leak
+        if isinstance(max_concurrency, AdaptiveConcurrency):
+            CURRENT_CONTROLLER.set(max_concurrency)
+        started_at = time.monotonic()
+        try:
+            result: Union[R, MandolineError] = func(item)
+        except MandolineError as error:
+            result = error
+        record_result(
+            max_concurrency=max_concurrency, result=result, started_at=started_at
+        )
+        return result
+
+    iterator = iter(enumerate(items))
+    in_flight: Dict["Future[Union[R, MandolineError]]", Tuple[int, T]] = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        exhausted = False
+        while True:
+            limit = get_current_limit(max_concurrency=max_concurrency)
+            while not exhausted and len(in_flight) < limit:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                in_flight[submit_in_context(executor, call, item)] = (index, item)
+
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = in_flight.pop(future)
+                yield index, item, future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def astream_concurrently(
+    *,
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: Concurrency,
+) -> AsyncIterator[Tuple[int, T, Union[R, MandolineError]]]:
+    """Asyncio counterpart of `stream_concurrently`."""
+    get_max_workers(max_concurrency=max_concurrency)
+
+    async def call(item: T) -> Union[R, MandolineError]:
+        # Each call runs in its own copy of the context, so this does not leak
+        if isinstance(max_concurrency, AdaptiveConcurrency):
+            CURRENT_CONTROLLER.set(max_concurrency)
+        started_at = time.monotonic()
+        try:
+            result: Union[R, MandolineError] = await func(item)
+        except MandolineError as error:
+            result = error
+        record_result(
+            max_concurrency=max_concurrency, result=result, started_at=started_at
+        )
+        return result
+
+    iterator = iter(enumerate(items))
+    in_flight: Dict["asyncio.Task[Union[R, MandolineError]]", Tuple[int, T]] = {}
+    try:
+        exhausted = False
+        while True:
+            limit = get_current_limit(max_concurrency=max_concurrency)
+            while not exhausted and len(in_flight) < limit:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                in_flight[asyncio.ensure_future(call(item))] = (index, item)
+
+            if not in_flight:
+                return
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = in_flight.pop(task)
+                yield index, item, task.result()
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
@@ -1,15 +1,88 @@
-from typing import Final
+from typing import Final, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from mandoline.errors import MandolineErrorType
+
 MANDOLINE_API_BASE_URL: Final[str] = "https://mandoline-api.fly.dev/v1"
 
 DEFAULT_GET_LIMIT: Final[int] = 100
 MAX_GET_LIMIT: Final[int] = 1000
 
+DEFAULT_EVALUATE_CONCURRENCY: Final[int] = 8
+DEFAULT_BATCH_CONCURRENCY: Final[int] = 16
+
+MAX_BATCH_SIZE: Final[int] = 100
+DEFAULT_BATCH_WAIT: Final[float] = 0.05
+DEFAULT_BATCHER_CONCURRENCY: Final[int] = 4
+
+SPOOL_MAX_ITEMS: Final[int] = 100_000
+SPOOL_FLUSH_INTERVAL: Final[float] = 1.0
+SPOOL_MAX_ATTEMPTS: Final[int] = 10
+SPOOL_BACKOFF_MAX: Final[float] = 300.0
+
+CACHE_MAXSIZE: Final[int] = 1024
+RESULT_CACHE_MAXSIZE: Final[int] = 100_000
+
 CONNECT_TIMEOUT: Final[float] = 10.0
 RWP_TIMEOUT: Final[float] = 300.0
 
+MAX_CONNECTIONS: Final[int] = 100
+MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+KEEPALIVE_EXPIRY: Final[float] = 30.0
+
+DEFAULT_QUANTILES: Final[Tuple[float, ...]] = (0.25, 0.5, 0.75)
+DEFAULT_CONFIDENCE: Final[float] = 0.95
+DEFAULT_BOOTSTRAP_SAMPLES: Final[int] = 1000
+
+COMPRESSION_THRESHOLD: Final[int] = 1024
+GZIP_COMPRESSION_LEVEL: Final[int] = 6
+ZSTD_COMPRESSION_LEVEL: Final[int] = 3
+
+MAX_ATTEMPTS: Final[int] = 3
+BACKOFF_BASE: Final[float] = 0.5
+BACKOFF_MAX: Final[float] = 30.0
+
+
+class RetryConfig(BaseModel):
+    """Retry policy for failed Mandoline API requests."""
+
+    max_attempts: int = Field(
+        default=MAX_ATTEMPTS,
+        description="The maximum number of attempts per request, including the first one.",
+    )
+    backoff_base: float = Field(
+        default=BACKOFF_BASE,
+        description="The delay (in seconds) before the first retry; doubles on every retry.",
+    )
+    backoff_max: float = Field(
+        default=BACKOFF_MAX,
+        description="The maximum delay (in seconds) between two attempts. Requests whose `Retry-After` asks for longer are not retried.",
+    )
+    jitter: bool = Field(
+        default=True,
+        description="Whether to randomize delays (full jitter) to avoid synchronized retries.",
+    )
+    respect_retry_after: bool = Field(
+        default=True,
+        description="Whether to wait for the delay requested by a `Retry-After` header.",
+    )
+    retry_on: List[MandolineErrorType] = Field(
+        default_factory=lambda: [
+            MandolineErrorType.RateLimitExceeded,
+            MandolineErrorType.TimeoutError,
+        ],
+        description="The error types that are retried.",
+    )
+    retry_statuses: List[int] = Field(
+        default_factory=lambda: [429, 500, 502, 503, 504],
+        description="The HTTP status codes that are retried.",
+    )
+    retry_methods: List[Literal["GET", "POST", "PUT", "DELETE"]] = Field(
+        default_factory=lambda: ["GET", "PUT", "DELETE"],
+        description="The HTTP methods that are retried. POST is not idempotent and must be opted into.",
+    )
+
 
 class MandolineRequestConfig(BaseModel):
     """Configuration for Mandoline API requests."""
@@ -26,6 +99,34 @@ class MandolineRequestConfig(BaseModel):
         default=RWP_TIMEOUT,
         description="The timeout (in seconds) for the entire request-response cycle.",
     )
+    max_connections: int = Field(
+        default=MAX_CONNECTIONS,
+        description="The maximum number of concurrent connections in the pool.",
+    )
+    max_keepalive_connections: int = Field(
+        default=MAX_KEEPALIVE_CONNECTIONS,
+        description="The maximum number of idle connections kept alive in the pool.",
+    )
+    keepalive_expiry: float = Field(
+        default=KEEPALIVE_EXPIRY,
+        description="The time (in seconds) an idle connection is kept alive.",
+    )
+    http2: bool = Field(
+        default=False,
+        description="Whether to enable HTTP/2. Requires the `h2` package.",
+    )
+    compression: Optional[Literal["gzip", "zstd"]] = Field(
+        default=None,
+        description="The encoding used to compress request bodies, if any. `zstd` requires the `zstandard` package.",
+    )
+    compression_threshold: int = Field(
+        default=COMPRESSION_THRESHOLD,
+        description="The minimum size (in bytes) of a request body before it is compressed.",
+    )
+    retry: RetryConfig = Field(
+        default_factory=RetryConfig,
+        description="The retry policy for failed requests.",
+    )
 
 
 class MandolineClientOptions(MandolineRequestConfig):
@@ -1,12 +1,21 @@
-from typing import Any, Dict, Literal, Optional
+import asyncio
+import json
+import time
+from typing import Any, Dict, Hashable, List, Literal, Optional, Sequence, Tuple
 from urllib.parse import urlencode
 
-from httpx import Client, Response, Timeout
+from httpx import AsyncClient, Client, Limits, Response, Timeout
 from pydantic import BaseModel
 
+from mandoline.compression import compress_body
+from mandoline.concurrency import record_attempt_failure
 from mandoline.config import MandolineRequestConfig
 from mandoline.errors import handle_error
+from mandoline.hooks import AttemptTrace, RequestHook
+from mandoline.json_codec import DEFAULT_JSON_CODEC, JSONCodec
 from mandoline.logger import get_logger
+from mandoline.rate_limiter import RateLimiter
+from mandoline.retry import get_retry_delay
 from mandoline.types import Headers, SerializableDict
 from mandoline.utils import make_serializable
 
@@ -24,38 +33,105 @@ def process_url(
     return f"{api_base_url}/{endpoint}?{query_string}"
 
 
-def process_request_body(*, data: Optional[SerializableDict] = None) -> Dict[str, Any]:
+def process_request_body(
+    *,
+    data: Optional[SerializableDict] = None,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+) -> Dict[str, Any]:
     if not data:
         return {}
 
     serializable_data = make_serializable(data=data)
-    return {"json": serializable_data}
+    return {"content": json_codec.dumps(serializable_data)}
+
+
+def create_timeout(*, config: MandolineRequestConfig) -> Timeout:
+    return Timeout(
+        connect=config.connect_timeout,
+        read=config.rwp_timeout,
+        write=config.rwp_timeout,
+        pool=config.rwp_timeout,
+    )
+
+
+def create_limits(*, config: MandolineRequestConfig) -> Limits:
+    return Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+def create_http_client(*, config: MandolineRequestConfig) -> Client:
+    """Creates a pooled HTTP client that is reused across requests."""
+    return Client(
+        timeout=create_timeout(config=config),
+        limits=create_limits(config=config),
+        http2=config.http2,
+    )
+
+
+def create_async_http_client(*, config: MandolineRequestConfig) -> AsyncClient:
+    """Creates a pooled async HTTP client that is reused across requests."""
+    return AsyncClient(
+        timeout=create_timeout(config=config),
+        limits=create_limits(config=config),
+        http2=config.http2,
+    )
 
 
 def make_request_with_timeout(
     *,
+    client: Client,
     config: MandolineRequestConfig,
     method: str,
     url: str,
     headers: Dict[str, str],
     body: Dict[str, Any],
+    extensions: Optional[Dict[str, Any]] = None,
 ) -> Response:
-    timeout = Timeout(
-        connect=config.connect_timeout,
-        read=config.rwp_timeout,
-        write=config.rwp_timeout,
-        pool=config.rwp_timeout,
+    return client.request(
+        method=method,
+        url=url,
+        headers=headers,
+        timeout=create_timeout(config=config),
+        extensions=extensions,
+        **body,
     )
-    with Client(timeout=timeout) as client:
-        response = client.request(method=method, url=url, headers=headers, **body)
-        return response
 
 
-def process_response(*, response: Response) -> Any:
+async def make_async_request_with_timeout(
+    *,
+    client: AsyncClient,
+    config: MandolineRequestConfig,
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    body: Dict[str, Any],
+    extensions: Optional[Dict[str, Any]] = None,
+) -> Response:
+    return await client.request(
+        method=method,
+        url=url,
+        headers=headers,
+        timeout=create_timeout(config=config),
+        extensions=extensions,
+        **body,
+    )
+
+
+def process_response(
+    *,
+    response: Response,
+    raw: bool = False,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+) -> Any:
     response.raise_for_status()
     if response.status_code == 204:
         return None  # No content to process for 204 responses
-    return response.json()
+    if raw:
+        return response.content  # Left for the caller to parse and validate
+    return json_codec.loads(response.content)
 
 
 class RequestOptions(BaseModel):
@@ -64,25 +140,241 @@ class RequestOptions(BaseModel):
     auth_header: Headers
     params: Optional[SerializableDict] = None
     data: Optional[SerializableDict] = None
+    raw_response: bool = False
+
+
+def make_request_key(*, options: RequestOptions) -> Hashable:
+    """Identifies requests that are interchangeable (same method, endpoint and params)."""
+    params = tuple(
+        sorted(
+            (k, str(v)) for k, v in make_serializable(data=options.params or {}).items()
+        )
+    )
+    return (options.method, options.endpoint, params)
 
 
-def make_request(*, config: MandolineRequestConfig, options: RequestOptions) -> Any:
+def prepare_request(
+    *,
+    config: MandolineRequestConfig,
+    options: RequestOptions,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
     url = process_url(
         api_base_url=config.api_base_url,
         endpoint=options.endpoint,
         params=options.params,
     )
     headers = {**options.auth_header, "Content-Type": "application/json"}
-    body = process_request_body(data=options.data)
+    body = process_request_body(data=options.data, json_codec=json_codec)
+    if config.compression is not None and "content" in body:
+        body["content"], encoding_headers = compress_body(
+            content=body["content"],
+            encoding=config.compression,
+            threshold=config.compression_threshold,
+        )
+        headers.update(encoding_headers)
+    return url, headers, body
+
+
+def request_metric_ids(*, options: RequestOptions) -> List[str]:
+    """The metrics a request is about: from its endpoint, body or filters."""
+    segments = options.endpoint.strip("/").split("/")
+    if segments[0] == "metrics" and len(segments) > 1:
+        return [segments[1]]
+    data = options.data or {}
+    if "metric_id" in data:
+        return [str(data["metric_id"])]
+    if "evaluations" in data:
+        metric_ids = (str(item["metric_id"]) for item in data["evaluations"])
+        return list(dict.fromkeys(metric_ids))
+    filters = (options.params or {}).get("filters")
+    if isinstance(filters, str) and "metric_id" in filters:
+        metric_id = json.loads(filters).get("metric_id")
+        if isinstance(metric_id, str):
+            return [metric_id]
+    return []
+
+
+def start_attempt_trace(
+    *,
+    hooks: Sequence[RequestHook],
+    options: RequestOptions,
+    attempt: int,
+    body: Dict[str, Any],
+    asynchronous: bool,
+) -> AttemptTrace:
+    return AttemptTrace(
+        hooks=hooks,
+        method=options.method,
+        endpoint=options.endpoint,
+        attempt=attempt,
+        content=body.get("content"),
+        metric_ids=request_metric_ids(options=options),
+        asynchronous=asynchronous,
+    )
+
+
+def make_request(
+    *,
+    client: Client,
+    config: MandolineRequestConfig,
+    options: RequestOptions,
+    rate_limiter: Optional[RateLimiter] = None,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+    hooks: Sequence[RequestHook] = (),
+) -> Any:
+    try:
+        url, headers, body = prepare_request(
+            config=config, options=options, json_codec=json_codec
+        )
+    except Exception as error:
+        # e.g. unserializable data: reported like any other request failure
+        raise handle_error(err=error) from error
+
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        started_at = time.monotonic()
+        trace = (
+            start_attempt_trace(
+                hooks=hooks,
+                options=options,
+                attempt=attempt,
+                body=body,
+                asynchronous=False,
+            )
+            if hooks
+            else None
+        )
+        try:
+            response = make_request_with_timeout(
+                client=client,
+                config=config,
+                method=options.method,
+                url=url,
+                headers=(
+                    trace.request_headers(headers) if trace is not None else headers
+                ),
+                body=body,
+                extensions=trace.extensions if trace is not None else None,
+            )
+            if trace is not None:
+                trace.response(response)
+            return process_response(
+                response=response, raw=options.raw_response, json_codec=json_codec
+            )
+        except Exception as error:
+            if trace is not None:
+                trace.error(error)
+            delay = handle_attempt_error(
+                err=error,
+                config=config,
+                options=options,
+                attempt=attempt,
+                started_at=started_at,
+            )
+            time.sleep(delay)
+            attempt += 1
+        except BaseException as error:
+            # Cancelled or interrupted: hooks still see the attempt end
+            if trace is not None:
+                trace.error(error)
+            raise
 
+
+async def make_async_request(
+    *,
+    client: AsyncClient,
+    config: MandolineRequestConfig,
+    options: RequestOptions,
+    rate_limiter: Optional[RateLimiter] = None,
+    json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+    hooks: Sequence[RequestHook] = (),
+) -> Any:
     try:
-        response = make_request_with_timeout(
-            config=config,
-            method=options.method,
-            url=url,
-            headers=headers,
-            body=body,
+        url, headers, body = prepare_request(
+            config=config, options=options, json_codec=json_codec
         )
-        return process_response(response=response)
     except Exception as error:
-        raise handle_error(err=error)
+        # e.g. unserializable data: reported like any other request failure
+        raise handle_error(err=error) from error
+
+    attempt = 1
+    while True:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        started_at = time.monotonic()
+        trace = (
+            start_attempt_trace(
+                hooks=hooks,
+                options=options,
+                attempt=attempt,
+                body=body,
+                asynchronous=True,
+            )
+            if hooks
+            else None
+        )
+        try:
+            response = await make_async_request_with_timeout(
+                client=client,
+                config=config,
+                method=options.method,
+                url=url,
+                headers=(
+                    trace.request_headers(headers) if trace is not None else headers
+                ),
+                body=body,
+                extensions=trace.extensions if trace is not None else None,
+            )
+            if trace is not None:
+                trace.response(response)
+            return process_response(
+                response=response, raw=options.raw_response, json_codec=json_codec
+            )
+        except Exception as error:
+            if trace is not None:
+                trace.error(error)
+            delay = handle_attempt_error(
+                err=error,
+                config=config,
+                options=options,
+                attempt=attempt,
+                started_at=started_at,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+        except BaseException as error:
+            # Cancelled or interrupted: hooks still see the attempt end
+            if trace is not None:
+                trace.error(error)
+            raise
+
+
+def handle_attempt_error(
+    *,
+    err: Exception,
+    config: MandolineRequestConfig,
+    options: RequestOptions,
+    attempt: int,
+    started_at: float,
+) -> float:
+    """Returns the delay before the next attempt, or raises if the error is final."""
+    error = handle_error(err=err, log=False)
+    record_attempt_failure(error=error, started_at=started_at)
+    delay = get_retry_delay(
+        error=error,
+        err=err,
+        method=options.method,
+        attempt=attempt,
+        policy=config.retry,
+    )
+    if delay is None:
+        raise handle_error(err=err)
+
+    logger.warning(
+        f"Retrying {options.method} {options.endpoint} in {delay:.2f}s "
+        f"(attempt {attempt + 1}/{config.retry.max_attempts}): {error}"
+    )
+    return delay
@@ -0,0 +1,46 @@
+from typing import Any, List
+
+from pydantic import TypeAdapter
+
+from mandoline.models import Evaluation, Metric
+
+# Built once: compiling a validator is far more expensive than running it
+METRIC_LIST_ADAPTER: "TypeAdapter[List[Metric]]" = TypeAdapter(List[Metric])
+EVALUATION_LIST_ADAPTER: "TypeAdapter[List[Evaluation]]" = TypeAdapter(List[Evaluation])
+
+
+def is_raw_json(data: Any) -> bool:
+    return isinstance(data, (bytes, bytearray, str))
+
+
+def decode_metric(data: Any) -> Metric:
+    """Builds a `Metric` from a decoded JSON object or from raw JSON bytes."""
+    if is_raw_json(data):
+        return Metric.model_validate_json(data)
+    return Metric.model_validate(data)
+
+
+def decode_metrics(data: Any) -> List[Metric]:
+    """
+    Builds a list of `Metric`s from a decoded JSON array or from raw JSON bytes.
+
+    Raw bytes are parsed and validated in a single pass, without first
+    building a dict for every object.
+    """
+    if is_raw_json(data):
+        return METRIC_LIST_ADAPTER.validate_json(data)
+    return [Metric.model_validate(metric_data) for metric_data in data]
+
+
+def decode_evaluation(data: Any) -> Evaluation:
+    """Builds an `Evaluation` from a decoded JSON object or from raw JSON bytes."""
+    if is_raw_json(data):
+        return Evaluation.model_validate_json(data)
+    return Evaluation.model_validate(data)
+
+
+def decode_evaluations(data: Any) -> List[Evaluation]:
+    """See `decode_metrics`."""
+    if is_raw_json(data):
+        return EVALUATION_LIST_ADAPTER.validate_json(data)
+    return [Evaluation.model_validate(evaluation_data) for evaluation_data in data]
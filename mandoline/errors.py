@@ -77,7 +77,7 @@ class MandolineError(Exception):
         self.details: MandolineErrorDetails = details
 
 
-def handle_error(*, err: Any) -> MandolineError:
+def handle_error(*, err: Any, log: bool = True) -> MandolineError:
     if isinstance(err, MandolineError):
         return err
 
@@ -90,7 +90,7 @@ def handle_error(*, err: Any) -> MandolineError:
     else:
         error_details = create_generic_error_details(err=err)
 
-    if error_details.message:
+    if log and error_details.message:
         logger.error(f"Error: {error_details}")
 
     return MandolineError(details=error_details)
@@ -0,0 +1,399 @@
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+    overload,
+)
+from uuid import UUID
+
+from mandoline.models import Evaluation
+from mandoline.utils import NOT_GIVEN
+
+if TYPE_CHECKING:
+    import numpy
+
+# Imported by require_numpy on first use, so that importing mandoline does
+# not pay for numpy
+np: Any = None
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+# `properties` states, stored per row
+PROPERTIES_DICT = 0
+PROPERTIES_NONE = 1
+PROPERTIES_NOT_GIVEN = 2
+
+
+class Missing:
+    """Marks rows whose `properties` lack a given key."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = Missing()
+
+
+def require_numpy() -> Any:
+    """Imports numpy if needed and returns it."""
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError(
+                "EvaluationFrame requires the `numpy` package: pip install numpy"
+            ) from error
+        np = numpy
+    return np
+
+
+def to_microseconds(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - EPOCH) // MICROSECOND
+
+
+def from_microseconds(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+class DictionaryEncoder:
+    """Maps repeated values to small integer codes, keeping each value once."""
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self.codes: List[int] = []
+        self._index: Dict[Hashable, int] = {}
+
+    def append(self, value: Hashable) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def to_array(self) -> "numpy.ndarray":
+        return np.asarray(self.codes, dtype=np.int32)
+
+
+class EvaluationFrame(Sequence[Evaluation]):
+    """
+    Compact, column-oriented collection of evaluations.
+
+    Scores are held in a float64 array, IDs as 16-byte values and
+    timestamps as UTC `datetime64[us]`. Metric IDs, prompts and responses
+    are dictionary-encoded, so a text repeated across rows is stored once.
+    `properties` are split into one column per key. Indexing with an
+    integer materializes an `Evaluation` on demand; slices, integer arrays
+    and boolean masks return a new frame sharing the same dictionaries.
+
+    Requires numpy; `to_pandas()` and `to_arrow()` additionally require
+    pandas and pyarrow.
+    """
+
+    def __init__(
+        self,
+        *,
+        ids: "numpy.ndarray",
+        scores: "numpy.ndarray",
+        created_at: "numpy.ndarray",
+        updated_at: "numpy.ndarray",
+        metric_codes: "numpy.ndarray",
+        metric_ids: List[UUID],
+        prompt_codes: "numpy.ndarray",
+        prompts: List[str],
+        response_codes: "numpy.ndarray",
+        responses: List[str],
+        properties_state: "numpy.ndarray",
+        properties: Dict[str, "numpy.ndarray"],
+    ):
+        require_numpy()
+        self._ids = ids
+        self._scores = scores
+        self._created_at = created_at
+        self._updated_at = updated_at
+        self._metric_codes = metric_codes
+        self._metric_ids = metric_ids
+        self._prompt_codes = prompt_codes
+        self._prompts = prompts
+        self._response_codes = response_codes
+        self._responses = responses
+        self._properties_state = properties_state
+        self._properties = properties
+
+    @classmethod
+    def from_evaluations(cls, evaluations: Iterable[Evaluation]) -> "EvaluationFrame":
+        """
+        Builds a frame from any iterable of evaluations.
+
+        The iterable is consumed one evaluation at a time, so passing
+        `Mandoline.iter_evaluations(...)` never holds more than a few pages
+        of `Evaluation` objects in memory.
+        """
+        builder = EvaluationFrameBuilder()
+        for evaluation in evaluations:
+            builder.append(evaluation)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    @overload
+    def __getitem__(self, index: int) -> Evaluation: ...
+
+    @overload
+    def __getitem__(self, index: Any) -> "EvaluationFrame": ...
+
+    def __getitem__(self, index: Any) -> Union[Evaluation, "EvaluationFrame"]:
+        if isinstance(index, (int, np.integer)):
+            return self._materialize(int(index))
+        return self._take(index)
+
+    def __iter__(self) -> Iterator[Evaluation]:
+        for row in range(len(self)):
+            yield self._materialize(row)
+
+    def __repr__(self) -> str:
+        return f"EvaluationFrame({len(self)} evaluations)"
+
+    # Columns
+    @property
+    def scores(self) -> "numpy.ndarray":
+        return self._scores
+
+    @property
+    def created_at(self) -> "numpy.ndarray":
+        """Creation times as UTC `datetime64[us]`."""
+        return self._created_at
+
+    @property
+    def updated_at(self) -> "numpy.ndarray":
+        """Update times as UTC `datetime64[us]`."""
+        return self._updated_at
+
+    @property
+    def ids(self) -> List[UUID]:
+        return [UUID(bytes=value.tobytes()) for value in self._ids]
+
+    @property
+    def metric_ids(self) -> "numpy.ndarray":
+        return to_object_array(self._metric_ids)[self._metric_codes]
+
+    @property
+    def prompts(self) -> "numpy.ndarray":
+        return to_object_array(self._prompts)[self._prompt_codes]
+
+    @property
+    def responses(self) -> "numpy.ndarray":
+        return to_object_array(self._responses)[self._response_codes]
+
+    @property
+    def property_keys(self) -> List[str]:
+        return list(self._properties)
+
+    def property(self, key: str, default: Any = None) -> "numpy.ndarray":
+        """
+        Returns the values of `properties[key]` as an array.
+
+        Rows without the key hold `default`. Numeric columns with no
+        missing values are returned with a numeric dtype.
+        """
+        column = self._properties.get(key)
+        if column is None:
+            return to_object_array([default] * len(self))
+        values = column.copy()
+        values[[value is MISSING for value in values]] = default
+        if values.size and all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in values
+        ):
+            return values.astype(np.float64)
+        return values
+
+    # Conversions
+    def to_pandas(self) -> Any:
+        """
+        Returns a pandas DataFrame with one row per evaluation.
+
+        Prompts, responses and metric IDs become categoricals, so repeated
+        texts are not duplicated; each property becomes a
+        `properties.<key>` column.
+        """
+        import pandas as pd
+
+        columns: Dict[str, Any] = {
+            "id": [str(value) for value in self.ids],
+            "metric_id": pd.Categorical.from_codes(
+                self._metric_codes, categories=[str(v) for v in self._metric_ids]
+            ),
+            "prompt": pd.Categorical.from_codes(
+                self._prompt_codes, categories=pd.Index(self._prompts, dtype=object)
+            ),
+            "response": pd.Categorical.from_codes(
+                self._response_codes,
+                categories=pd.Index(self._responses, dtype=object),
+            ),
+            "score": self._scores,
+            "created_at": pd.to_datetime(self._created_at, utc=True),
+            "updated_at": pd.to_datetime(self._updated_at, utc=True),
+        }
+        for key in self._properties:
+            columns[f"properties.{key}"] = self.property(key)
+        return pd.DataFrame(columns)
+
+    def to_arrow(self) -> Any:
+        """
+        Returns a pyarrow Table with one row per evaluation.
+
+        Prompts, responses and metric IDs are dictionary arrays; each
+        property becomes a `properties.<key>` column.
+        """
+        import pyarrow as pa
+
+        def dictionary(codes: "numpy.ndarray", values: List[Any]) -> Any:
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, type=pa.int32()), pa.array(values, type=pa.string())
+            )
+
+        columns: Dict[str, Any] = {
+            "id": pa.array([str(value) for value in self.ids], type=pa.string()),
+            "metric_id": dictionary(
+                self._metric_codes, [str(value) for value in self._metric_ids]
+            ),
+            "prompt": dictionary(self._prompt_codes, self._prompts),
+            "response": dictionary(self._response_codes, self._responses),
+            "score": pa.array(self._scores, type=pa.float64()),
+            "created_at": pa.array(self._created_at, type=pa.timestamp("us", "UTC")),
+            "updated_at": pa.array(self._updated_at, type=pa.timestamp("us", "UTC")),
+        }
+        for key in self._properties:
+            columns[f"properties.{key}"] = pa.array(list(self.property(key)))
+        return pa.table(columns)
+
+    def _take(self, index: Any) -> "EvaluationFrame":
+        if isinstance(index, slice):
+            index = np.arange(len(self))[index]
+        index = np.asarray(index)
+        return EvaluationFrame(
+            ids=self._ids[index],
+            scores=self._scores[index],
+            created_at=self._created_at[index],
+            updated_at=self._updated_at[index],
+            metric_codes=self._metric_codes[index],
+            metric_ids=self._metric_ids,
+            prompt_codes=self._prompt_codes[index],
+            prompts=self._prompts,
+            response_codes=self._response_codes[index],
+            responses=self._responses,
+            properties_state=self._properties_state[index],
+            properties={key: column[index] for key, column in self._properties.items()},
+        )
+
+    def _materialize(self, row: int) -> Evaluation:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("EvaluationFrame index out of range")
+
+        state = self._properties_state[row]
+        properties: Any
+        if state == PROPERTIES_DICT:
+            properties = {
+                key: column[row]
+                for key, column in self._properties.items()
+                if column[row] is not MISSING
+            }
+        else:
+            properties = None if state == PROPERTIES_NONE else NOT_GIVEN
+
+        # Every value was validated when the frame was built
+        return Evaluation.model_construct(
+            id=UUID(bytes=self._ids[row].tobytes()),
+            metric_id=self._metric_ids[self._metric_codes[row]],
+            prompt=self._prompts[self._prompt_codes[row]],
+            response=self._responses[self._response_codes[row]],
+            properties=properties,
+            score=float(self._scores[row]),
+            created_at=from_microseconds(int(self._created_at[row].astype(np.int64))),
+            updated_at=from_microseconds(int(self._updated_at[row].astype(np.int64))),
+        )
+
+
+class EvaluationFrameBuilder:
+    """Accumulates evaluations one at a time into an `EvaluationFrame`."""
+
+    def __init__(self) -> None:
+        require_numpy()
+        self._rows = 0
+        self._ids = bytearray()
+        self._scores: List[float] = []
+        self._created_at: List[int] = []
+        self._updated_at: List[int] = []
+        self._metric_ids = DictionaryEncoder()
+        self._prompts = DictionaryEncoder()
+        self._responses = DictionaryEncoder()
+        self._properties_state: List[int] = []
+        self._properties: Dict[str, List[Any]] = {}
+
+    def append(self, evaluation: Evaluation) -> None:
+        row = self._rows
+        self._ids += evaluation.id.bytes
+        self._scores.append(evaluation.score)
+        self._created_at.append(to_microseconds(evaluation.created_at))
+        self._updated_at.append(to_microseconds(evaluation.updated_at))
+        self._metric_ids.append(evaluation.metric_id)
+        self._prompts.append(evaluation.prompt)
+        self._responses.append(evaluation.response)
+
+        properties = evaluation.properties
+        if isinstance(properties, dict):
+            self._properties_state.append(PROPERTIES_DICT)
+            for key, value in properties.items():
+                column = self._properties.get(key)
+                if column is None:
+                    column = self._properties[key] = [MISSING] * row
+                column.append(value)
+        else:
+            self._properties_state.append(
+                PROPERTIES_NONE if properties is None else PROPERTIES_NOT_GIVEN
+            )
+        # Pad the columns of keys this row does not have
+        for column in self._properties.values():
+            if len(column) == row:
+                column.append(MISSING)
+        self._rows += 1
+
+    def build(self) -> EvaluationFrame:
+        return EvaluationFrame(
+            ids=np.frombuffer(bytes(self._ids), dtype="V16"),
+            scores=np.asarray(self._scores, dtype=np.float64),
+            created_at=np.asarray(self._created_at, dtype="datetime64[us]"),
+            updated_at=np.asarray(self._updated_at, dtype="datetime64[us]"),
+            metric_codes=self._metric_ids.to_array(),
+            metric_ids=self._metric_ids.values,
+            prompt_codes=self._prompts.to_array(),
+            prompts=self._prompts.values,
+            response_codes=self._responses.to_array(),
+            responses=self._responses.values,
+            properties_state=np.asarray(self._properties_state, dtype=np.int8),
+            properties={
+                key: to_object_array(column) for key, column in self._properties.items()
+            },
+        )
+
+
+def to_object_array(values: Sequence[Any]) -> "numpy.ndarray":
+    # np.asarray would turn nested lists into extra dimensions
+    array = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        array[index] = value
+    return array
@@ -0,0 +1,292 @@
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from httpx import Response
+from pydantic import BaseModel, Field
+
+from mandoline.errors import MandolineError, handle_error
+from mandoline.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Histogram buckets grow by this factor, bounding percentile error to 2%
+HISTOGRAM_GROWTH = 1.02
+# Latencies at or below this many seconds share the first bucket
+HISTOGRAM_MIN_LATENCY = 1e-4
+
+
+class RequestEvent(BaseModel):
+    """
+    One attempt of an API request, as seen by `RequestHook`s.
+
+    `route` is `endpoint` with IDs replaced by `{id}`, so requests for
+    different resources of the same kind share it. Response fields and
+    timings (in seconds) stay None until known: `connect_time` is only set
+    when the attempt opened a new connection, and `ttfb` is the time until
+    the response headers arrived. `metric_ids` are the metrics the request
+    concerns, if any. Headers added to `headers` in `before_request` are
+    sent with the attempt.
+    """
+
+    method: str
+    endpoint: str
+    route: str
+    attempt: int
+    request_bytes: int
+    metric_ids: List[str] = Field(default_factory=list)
+    status_code: Optional[int] = None
+    response_bytes: Optional[int] = None
+    connect_time: Optional[float] = None
+    ttfb: Optional[float] = None
+    total_time: Optional[float] = None
+    headers: Dict[str, str] = Field(default_factory=dict)
+
+
+class RequestHook:
+    """
+    Receives events for every request attempt; override what you need.
+
+    `before_request` runs before an attempt is sent, `after_response` once
+    a response (of any status) has been read, and `on_error` when the
+    attempt fails, either without a response or with an error status; a
+    retried request produces events for each attempt. Hooks run inline on
+    the request path, also for the async client, so they should be quick
+    and must not block. Exceptions raised by hooks are logged and ignored.
+    """
+
+    def before_request(self, event: RequestEvent) -> None:
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        pass
+
+    def on_error(self, event: RequestEvent, error: MandolineError) -> None:
+        pass
+
+
+def endpoint_route(endpoint: str) -> str:
+    segments = []
+    for segment in endpoint.strip("/").split("/"):
+        try:
+            UUID(segment)
+            segments.append("{id}")
+        except ValueError:
+            segments.append(segment)
+    return "/".join(segments)
+
+
+def call_hooks(hooks: Sequence[RequestHook], name: str, *args: Any) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, name)(*args)
+        except Exception as error:
+            logger.error(f"Request hook {type(hook).__name__}.{name} failed: {error}")
+
+
+class AttemptTrace:
+    """
+    Collects the event of one request attempt and dispatches it to hooks.
+
+    `extensions` go to httpx, whose connection-level trace callbacks give
+    the connect and time-to-first-byte timings.
+    """
+
+    def __init__(
+        self,
+        *,
+        hooks: Sequence[RequestHook],
+        method: str,
+        endpoint: str,
+        attempt: int,
+        content: Optional[bytes],
+        metric_ids: Sequence[str] = (),
+        asynchronous: bool = False,
+    ):
+        self.hooks = hooks
+        self.event = RequestEvent(
+            method=method,
+            endpoint=endpoint,
+            route=endpoint_route(endpoint),
+            attempt=attempt,
+            request_bytes=len(content or b""),
+            metric_ids=list(metric_ids),
+        )
+        self.extensions = {"trace": self._atrace if asynchronous else self._trace}
+        self._connect_started: Optional[float] = None
+        call_hooks(self.hooks, "before_request", self.event)
+        self._started = time.perf_counter()
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        now = time.perf_counter()
+        if event_name == "connection.connect_tcp.started":
+            self._connect_started = now
+        elif event_name in (
+            "connection.connect_tcp.complete",
+            "connection.start_tls.complete",
+        ):
+            if self._connect_started is not None:
+                self.event.connect_time = now - self._connect_started
+        elif event_name.endswith(".receive_response_headers.complete"):
+            self.event.ttfb = now - self._started
+
+    def request_headers(self, headers: Dict[str, str]) -> Dict[str, str]:
+        if not self.event.headers:
+            return headers
+        return {**headers, **self.event.headers}
+
+    async def _atrace(self, event_name: str, info: Dict[str, Any]) -> None:
+        self._trace(event_name, info)
+
+    def response(self, response: Response) -> None:
+        self.event.total_time = time.perf_counter() - self._started
+        self.event.status_code = response.status_code
+        self.event.response_bytes = response.num_bytes_downloaded
+        call_hooks(self.hooks, "after_response", self.event)
+
+    def error(self, err: Exception) -> None:
+        if self.event.total_time is None:
+            self.event.total_time = time.perf_counter() - self._started
+        call_hooks(self.hooks, "on_error", self.event, handle_error(err=err, log=False))
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram.
+
+    Memory is bounded by the number of distinct buckets (a few hundred
+    across microseconds to minutes), not by the number of samples.
+    Reported percentiles are within 2% of the exact value.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, latency: float) -> None:
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        bucket = (
+            0
+            if latency <= HISTOGRAM_MIN_LATENCY
+            else math.ceil(math.log(latency / HISTOGRAM_MIN_LATENCY, HISTOGRAM_GROWTH))
+        )
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the `q`-th (0 to 100) percentile."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(self.max, HISTOGRAM_MIN_LATENCY * HISTOGRAM_GROWTH**bucket)
+        return self.max
+
+
+class EndpointStats(BaseModel):
+    """Request totals and latency percentiles (in seconds) for one route."""
+
+    count: int
+    errors: int
+    request_bytes: int
+    response_bytes: int
+    mean: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    p99: Optional[float] = None
+    max: Optional[float] = None
+
+
+class EndpointRecorder:
+    def __init__(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def stats(self) -> EndpointStats:
+        histogram = self.histogram
+        return EndpointStats(
+            count=histogram.count,
+            errors=self.errors,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            mean=histogram.total / histogram.count if histogram.count else None,
+            p50=histogram.percentile(50),
+            p95=histogram.percentile(95),
+            p99=histogram.percentile(99),
+            max=histogram.max if histogram.count else None,
+        )
+
+
+class StatsCollector(RequestHook):
+    """
+    In-process request statistics, keyed by `"<METHOD> <route>"`.
+
+    Every attempt's total time is added to a latency histogram of its
+    route; `stats()` reports counts, failed attempts, bytes sent and
+    received, and p50/p95/p99 latencies. Safe to share between clients
+    and threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._recorders: Dict[str, EndpointRecorder] = {}
+
+    def _recorder(self, event: RequestEvent) -> EndpointRecorder:
+        key = f"{event.method} {event.route}"
+        recorder = self._recorders.get(key)
+        if recorder is None:
+            recorder = self._recorders[key] = EndpointRecorder()
+        return recorder
+
+    def after_response(self, event: RequestEvent) -> None:
+        with self._lock:
+            recorder = self._recorder(event)
+            recorder.histogram.record(event.total_time or 0.0)
+            recorder.request_bytes += event.request_bytes
+            recorder.response_bytes += event.response_bytes or 0
+
+    def on_error(self, event: RequestEvent, error: MandolineError) -> None:
+        with self._lock:
+            recorder = self._recorder(event)
+            recorder.errors += 1
+            if event.status_code is None:
+                # No response, so after_response did not record the attempt
+                recorder.histogram.record(event.total_time or 0.0)
+                recorder.request_bytes += event.request_bytes
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        with self._lock:
+            return {key: recorder.stats() for key, recorder in self._recorders.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._recorders.clear()
+
+    def report(self) -> List[str]:
+        """One human-readable line per route, slowest p95 first."""
+        lines = []
+        stats = sorted(
+            self.stats().items(), key=lambda item: item[1].p95 or 0.0, reverse=True
+        )
+        for key, endpoint in stats:
+            lines.append(
+                f"{key}: n={endpoint.count} errors={endpoint.errors} "
+                f"p50={format_latency(endpoint.p50)} "
+                f"p95={format_latency(endpoint.p95)} "
+                f"p99={format_latency(endpoint.p99)}"
+            )
+        return lines
+
+
+def format_latency(latency: Optional[float]) -> str:
+    return "-" if latency is None else f"{latency * 1000:.1f}ms"
@@ -0,0 +1,146 @@
+import json
+from os import PathLike
+from types import TracebackType
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Type, Union
+from uuid import UUID
+
+from mandoline.batch import (
+    BatchResult,
+    EvaluationItem,
+    ProgressCallback,
+    to_evaluation_create,
+)
+from mandoline.client import Mandoline
+from mandoline.concurrency import Concurrency
+from mandoline.config import DEFAULT_BATCH_CONCURRENCY
+from mandoline.errors import MandolineError
+from mandoline.models import EvaluationCreate
+from mandoline.result_cache import make_evaluation_key
+
+ItemKey = Callable[[EvaluationCreate], str]
+
+
+class JobCheckpoint:
+    """
+    Append-only record of finished items, stored as JSON lines at `path`.
+
+    Every line maps an item key to the ID of its evaluation. The file is
+    read into a dict when opened, so checking an item costs O(1)
+    regardless of how many are recorded. A line cut short by a crash is
+    ignored, which at worst re-submits that one item.
+    """
+
+    def __init__(self, *, path: Union[str, "PathLike[str]"]):
+        self.path = path
+        self._completed: Dict[str, UUID] = {}
+        line = "\n"
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                        self._completed[record["key"]] = UUID(record["evaluation_id"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        self._file = open(path, "a", encoding="utf-8")
+        if not line.endswith("\n"):
+            # Terminate a torn last line so the next record starts cleanly
+            self._file.write("\n")
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._completed
+
+    def get(self, key: str) -> Optional[UUID]:
+        return self._completed.get(key)
+
+    def record(self, key: str, evaluation_id: UUID) -> None:
+        line = json.dumps({"key": key, "evaluation_id": str(evaluation_id)})
+        self._file.write(f"{line}\n")
+        self._file.flush()
+        self._completed[key] = evaluation_id
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class EvaluationJob:
+    """
+    Resumable bulk evaluation run on top of `Mandoline.evaluate_many`.
+
+    Items are identified by `key` (by default the content hash used by the
+    result cache, `make_evaluation_key`). Each successful evaluation is
+    written to the checkpoint file at `checkpoint_path` as soon as it
+    completes; running the job again with the same file skips every item
+    already recorded there and submits only the rest. Failed items are not
+    recorded, so they are retried on the next run.
+    """
+
+    def __init__(
+        self,
+        client: Mandoline,
+        *,
+        checkpoint_path: Union[str, "PathLike[str]"],
+        key: ItemKey = make_evaluation_key,
+        max_concurrency: Concurrency = DEFAULT_BATCH_CONCURRENCY,
+        on_progress: Optional[ProgressCallback] = None,
+    ):
+        self.client = client
+        self.key = key
+        self.max_concurrency = max_concurrency
+        self.on_progress = on_progress
+        self.checkpoint = JobCheckpoint(path=checkpoint_path)
+        self.skipped = 0
+
+    def run(self, items: Iterable[EvaluationItem]) -> Iterator[BatchResult]:
+        """
+        Submits every item not yet in the checkpoint and yields its result.
+
+        Results carry the item's position in `items`; skipped items are
+        only counted in `skipped`.
+        """
+        # evaluate_many index -> (position in `items`, item key)
+        submitted: Dict[int, Tuple[int, Optional[str]]] = {}
+
+        def remaining() -> Iterator[EvaluationItem]:
+            submitted_count = 0
+            for index, item in enumerate(items):
+                try:
+                    key: Optional[str] = self.key(to_evaluation_create(item))
+                except MandolineError:
+                    # Submitted anyway so evaluate_many reports the error
+                    key = None
+                if key is not None and key in self.checkpoint:
+                    self.skipped += 1
+                    continue
+                submitted[submitted_count] = (index, key)
+                submitted_count += 1
+                yield item
+
+        for result in self.client.evaluate_many(
+            items=remaining(),
+            max_concurrency=self.max_concurrency,
+            on_progress=self.on_progress,
+        ):
+            index, key = submitted.pop(result.index)
+            if result.evaluation is not None and key is not None:
+                self.checkpoint.record(key, result.evaluation.id)
+            yield result.model_copy(update={"index": index})
+
+    def close(self) -> None:
+        self.checkpoint.close()
+
+    def __enter__(self) -> "EvaluationJob":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,108 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterator,
+    List,
+    TypeVar,
+)
+
+from mandoline.concurrency import submit_in_context
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int, int], List[T]]
+AsyncPageFetcher = Callable[[int, int], Awaitable[List[T]]]
+
+
+def validate_page_args(*, skip: int, page_size: int, max_concurrency: int) -> None:
+    if skip < 0:
+        raise ValueError("skip must not be negative")
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def iterate_pages(
+    *,
+    fetch_page: PageFetcher[T],
+    skip: int,
+    page_size: int,
+    max_concurrency: int = 1,
+) -> Iterator[T]:
+    """
+    Yields every item of a `skip`/`limit` paginated listing, in order.
+
+    `fetch_page(skip, limit)` returns one page. Up to `max_concurrency`
+    consecutive pages are requested ahead of the one being consumed, and
+    they are yielded in `skip` order regardless of which arrives first.
+    With the default of 1 this prefetches the next page while the caller
+    processes the current one. No further pages are requested once a page
+    shorter than `page_size` is seen, and at most `max_concurrency + 1`
+    pages are held in memory at any time.
+    """
+    validate_page_args(skip=skip, page_size=page_size, max_concurrency=max_concurrency)
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    pending: Deque["Future[List[T]]"] = deque()
+    try:
+        for _ in range(max_concurrency):
+            pending.append(submit_in_context(executor, fetch_page, skip, page_size))
+            skip += page_size
+
+        while pending:
+            page = pending.popleft().result()
+            if len(page) < page_size:
+                # Last page: anything requested beyond it is empty
+                for future in pending:
+                    future.cancel()
+                pending.clear()
+            else:
+                pending.append(submit_in_context(executor, fetch_page, skip, page_size))
+                skip += page_size
+            yield from page
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiterate_pages(
+    *,
+    fetch_page: AsyncPageFetcher[T],
+    skip: int,
+    page_size: int,
+    max_concurrency: int = 1,
+) -> AsyncIterator[T]:
+    """Asyncio counterpart of `iterate_pages`."""
+    validate_page_args(skip=skip, page_size=page_size, max_concurrency=max_concurrency)
+
+    pending: Deque["asyncio.Future[List[T]]"] = deque()
+    try:
+        for _ in range(max_concurrency):
+            pending.append(asyncio.ensure_future(fetch_page(skip, page_size)))
+            skip += page_size
+
+        while pending:
+            page = await pending.popleft()
+            if len(page) < page_size:
+                # Last page: anything requested beyond it is empty
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                pending.clear()
+            else:
+                pending.append(asyncio.ensure_future(fetch_page(skip, page_size)))
+                skip += page_size
+            for item in page:
+                yield item
+    finally:
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Client-side token bucket that paces requests to the Mandoline API.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Every
+    request consumes one token and waits for it if the bucket is empty.
+    A single instance can be shared by any number of threads, asyncio
+    tasks and clients; waiting happens outside the internal lock.
+    """
+
+    def __init__(self, *, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long (in seconds) to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            # Tokens may go negative: each caller reserves its own slot in line
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks the current thread until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits (without blocking the event loop) until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
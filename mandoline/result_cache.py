@@ -0,0 +1,162 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from os import PathLike
+from typing import Optional, Union
+
+from mandoline.cache import TTLCache
+from mandoline.config import CACHE_MAXSIZE, RESULT_CACHE_MAXSIZE
+from mandoline.models import Evaluation, EvaluationCreate
+from mandoline.utils import make_serializable
+
+
+def make_cache_namespace(*, api_base_url: str, api_key: Optional[str]) -> str:
+    """Identifies the API and account results came from, without the raw key."""
+    key_digest = hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+    return f"{api_base_url}|{key_digest}"
+
+
+def make_evaluation_key(
+    evaluation_create: EvaluationCreate, *, namespace: str = ""
+) -> str:
+    """
+    Returns a content hash identifying an evaluation request payload.
+
+    Keys made with different `namespace`s (see `make_cache_namespace`)
+    never collide, so a cache shared between environments or API keys
+    does not return another account's evaluations.
+    """
+    payload = make_serializable(data=evaluation_create.model_dump())
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    if namespace:
+        canonical = f"{namespace}\n{canonical}"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResultCache(ABC):
+    """
+    Storage backend for evaluation results, keyed by `make_evaluation_key`.
+
+    Implementations must be safe to call from multiple threads.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Evaluation]: ...
+
+    @abstractmethod
+    def set(self, key: str, evaluation: Evaluation) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryResultCache(ResultCache):
+    """In-process LRU result cache with optional expiry."""
+
+    def __init__(self, *, maxsize: int = CACHE_MAXSIZE, ttl: Optional[float] = None):
+        self._cache: TTLCache[str, Evaluation] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, key: str) -> Optional[Evaluation]:
+        return self._cache.get(key)
+
+    def set(self, key: str, evaluation: Evaluation) -> None:
+        self._cache.set(key, evaluation)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    On-disk result cache stored in a SQLite database.
+
+    Results survive process restarts and can be shared between processes
+    on the same machine. Entries older than `ttl` seconds are ignored and
+    deleted. Once the database holds more than `maxsize` entries, the
+    oldest are evicted; this is checked every `maxsize // 100` writes, so
+    the database can briefly exceed `maxsize` by that many entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Union[str, "PathLike[str]"],
+        ttl: Optional[float] = None,
+        maxsize: int = RESULT_CACHE_MAXSIZE,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Counting rows on every write would scan the table
+        self._prune_interval = max(1, maxsize // 100)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS evaluation_results ("
+                "key TEXT PRIMARY KEY, evaluation TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS evaluation_results_stored_at "
+                "ON evaluation_results (stored_at)"
+            )
+
+    def get(self, key: str) -> Optional[Evaluation]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT evaluation, stored_at FROM evaluation_results WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        evaluation, stored_at = row
+        if self.ttl is not None and time.time() - stored_at > self.ttl:
+            with self._lock, self._connection:
+                # Unless it was replaced since, e.g. by another process
+                self._connection.execute(
+                    "DELETE FROM evaluation_results WHERE key = ? AND stored_at = ?",
+                    (key, stored_at),
+                )
+            return None
+        return Evaluation.model_validate(json.loads(evaluation))
+
+    def set(self, key: str, evaluation: Evaluation) -> None:
+        serialized = json.dumps(evaluation.model_dump(mode="json"))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO evaluation_results (key, evaluation, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, serialized, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self._prune_interval == 0:
+                self._prune()
+
+    def _prune(self) -> None:
+        """Deletes expired entries, then the oldest beyond `maxsize`."""
+        if self.ttl is not None:
+            self._connection.execute(
+                "DELETE FROM evaluation_results WHERE stored_at < ?",
+                (time.time() - self.ttl,),
+            )
+        self._connection.execute(
+            "DELETE FROM evaluation_results WHERE key IN ("
+            "SELECT key FROM evaluation_results "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM evaluation_results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,95 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from mandoline.config import RetryConfig
+from mandoline.errors import HTTPErrorDetails, MandolineError
+
+
+def get_retry_after(*, err: BaseException) -> Optional[float]:
+    """Returns the delay (in seconds) requested by a `Retry-After` header, if any."""
+    if not isinstance(err, httpx.HTTPStatusError):
+        return None
+
+    value = err.response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_retryable(
+    *, error: MandolineError, err: BaseException, method: str, policy: RetryConfig
+) -> bool:
+    # The request never reached the server, so retrying is safe for any method
+    if isinstance(err, httpx.ConnectError):
+        return True
+
+    if method not in policy.retry_methods:
+        return False
+
+    if error.details.type in policy.retry_on:
+        return True
+
+    if isinstance(error.details, HTTPErrorDetails):
+        return error.details.status_code in policy.retry_statuses
+    if isinstance(err, httpx.HTTPStatusError):
+        return err.response.status_code in policy.retry_statuses
+    return False
+
+
+def compute_backoff(
+    *, attempt: int, policy: RetryConfig, retry_after: Optional[float] = None
+) -> float:
+    """Returns the delay (in seconds) before retrying after the given failed attempt."""
+    if retry_after is not None and policy.respect_retry_after:
+        return retry_after
+
+    delay = min(policy.backoff_max, policy.backoff_base * 2 ** (attempt - 1))
+    if policy.jitter:
+        return random.uniform(0, delay)
+    return delay
+
+
+def get_retry_delay(
+    *,
+    error: MandolineError,
+    err: BaseException,
+    method: str,
+    attempt: int,
+    policy: RetryConfig,
+) -> Optional[float]:
+    """
+    Decides whether a failed attempt should be retried.
+
+    Returns the delay (in seconds) to wait before the next attempt, or None
+    when the error should be raised to the caller. A `Retry-After` longer
+    than `policy.backoff_max` is not waited for: the error is raised, as
+    retrying any sooner would only be rejected again.
+    """
+    if attempt >= policy.max_attempts:
+        return None
+    if not is_retryable(error=error, err=err, method=method, policy=policy):
+        return None
+    retry_after = get_retry_after(err=err)
+    if (
+        retry_after is not None
+        and policy.respect_retry_after
+        and retry_after > policy.backoff_max
+    ):
+        return None
+    return compute_backoff(attempt=attempt, policy=policy, retry_after=retry_after)
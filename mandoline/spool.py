@@ -0,0 +1,361 @@
+import json
+import sqlite3
+import threading
+import time
+from os import PathLike
+from types import TracebackType
+from typing import List, Optional, Tuple, Type, Union
+from uuid import UUID
+
+from mandoline.batch import EvaluationItem, to_evaluation_create
+from mandoline.client import Mandoline
+from mandoline.config import (
+    BACKOFF_BASE,
+    MAX_BATCH_SIZE,
+    SPOOL_BACKOFF_MAX,
+    SPOOL_FLUSH_INTERVAL,
+    SPOOL_MAX_ATTEMPTS,
+    SPOOL_MAX_ITEMS,
+    RetryConfig,
+)
+from mandoline.errors import (
+    HTTPErrorDetails,
+    MandolineError,
+    MandolineErrorType,
+    handle_error,
+)
+from mandoline.logger import get_logger
+from mandoline.models import EvaluationCreate
+from mandoline.retry import compute_backoff
+from mandoline.types import NotGiven, NullableSerializableDict
+from mandoline.utils import NOT_GIVEN, make_serializable
+
+logger = get_logger(__name__)
+
+# Client errors worth retrying; other 4xx statuses would fail the same way again
+TRANSIENT_STATUS_CODES = (408, 429)
+
+
+class SpoolFullError(Exception):
+    """Raised when an evaluation is submitted to a spool that is at capacity."""
+
+
+def is_permanent_error(*, error: MandolineError) -> bool:
+    if error.details.type == MandolineErrorType.ValidationError:
+        return True
+    return (
+        isinstance(error.details, HTTPErrorDetails)
+        and 400 <= error.details.status_code < 500
+        and error.details.status_code not in TRANSIENT_STATUS_CODES
+    )
+
+
+class EvaluationSpool:
+    """
+    Write-behind queue that submits evaluations from a background thread.
+
+    `submit()` (or `create_evaluation()`) only appends the evaluation to a
+    SQLite database at `path` and returns; a worker thread sends queued
+    evaluations in batches through `Mandoline.create_evaluations` every
+    `flush_interval` seconds, or sooner once `batch_size` are queued.
+
+    Evaluations that fail with a transient error (timeouts, rate limits,
+    server errors, the API being unreachable) are retried with exponential
+    backoff, starting at `backoff_base` seconds and capped at `backoff_max`.
+    After `max_attempts` attempts, or right away on errors such as
+    validation failures, they are set aside and can be inspected with
+    `failed()`. Queued evaluations survive
+    process restarts: opening a spool on the same path resumes sending
+    them. Delivery is at least once, so an evaluation may be submitted
+    twice if the process dies mid-request.
+
+    At most `max_items` evaluations, queued or set aside, are kept; beyond
+    that `submit()` raises `SpoolFullError` rather than blocking the
+    caller. `clear_failed()` frees the room taken by failed evaluations.
+    """
+
+    def __init__(
+        self,
+        client: Mandoline,
+        *,
+        path: Union[str, "PathLike[str]"],
+        max_items: int = SPOOL_MAX_ITEMS,
+        batch_size: int = MAX_BATCH_SIZE,
+        flush_interval: float = SPOOL_FLUSH_INTERVAL,
+        max_attempts: int = SPOOL_MAX_ATTEMPTS,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = SPOOL_BACKOFF_MAX,
+    ):
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be greater than 0")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.client = client
+        self.max_items = max_items
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        # Only drives compute_backoff; which errors are retried is decided
+        # by is_permanent_error
+        self._backoff = RetryConfig(
+            max_attempts=max_attempts,
+            backoff_base=backoff_base,
+            backoff_max=backoff_max,
+        )
+
+        self._db_lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._db_lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS spooled_evaluations ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, payload TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "next_attempt_at REAL NOT NULL DEFAULT 0, error TEXT)"
+            )
+            (self._pending_count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM spooled_evaluations WHERE error IS NULL"
+            ).fetchone()
+            (self._failed_count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM spooled_evaluations WHERE error IS NOT NULL"
+            ).fetchone()
+
+        self._condition = threading.Condition()
+        self._wakeup = False
+        self._flush_requested = False
+        self._sending = False
+        self._passes = 0
+        # Evaluations delivered or set aside, so drain() can tell if a pass helped
+        self._settled = 0
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="mandoline-spool", daemon=True
+        )
+        self._worker.start()
+
+    def __len__(self) -> int:
+        """The number of evaluations waiting to be sent."""
+        return self._pending_count
+
+    def submit(self, item: EvaluationItem) -> None:
+        """Queues an evaluation for background submission."""
+        evaluation_create = to_evaluation_create(item)
+        payload = json.dumps(make_serializable(data=evaluation_create.model_dump()))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a closed EvaluationSpool")
+            if self._pending_count + self._failed_count >= self.max_items:
+                raise SpoolFullError(
+                    f"The spool already holds {self.max_items} evaluations "
+                    f"({self._failed_count} of them failed)"
+                )
+            with self._db_lock, self._connection:
+                self._connection.execute(
+                    "INSERT INTO spooled_evaluations (payload) VALUES (?)", (payload,)
+                )
+            self._pending_count += 1
+            if self._pending_count >= self.batch_size:
+                self._wakeup = True
+                self._condition.notify_all()
+
+    def create_evaluation(
+        self,
+        *,
+        metric_id: UUID,
+        prompt: str,
+        response: str,
+        properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+    ) -> None:
+        """Fire-and-forget counterpart of `Mandoline.create_evaluation`."""
+        self.submit(
+            EvaluationCreate(
+                metric_id=metric_id,
+                prompt=prompt,
+                response=response,
+                properties=properties,
+            )
+        )
+
+    def flush(self, *, timeout: Optional[float] = None) -> bool:
+        """
+        Sends every queued evaluation once, without waiting for backoff.
+
+        Returns False if `timeout` seconds passed before the pass finished.
+        Evaluations that fail again with a transient error stay queued, and
+        the failure does not count towards `max_attempts`.
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            # A pass that is already running may have missed recent submissions
+            target = self._passes + (2 if self._sending else 1)
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self._passes >= target or self._closed, timeout=timeout
+            )
+
+    def drain(self, *, timeout: Optional[float] = None) -> bool:
+        """
+        Flushes repeatedly until the queue is empty.
+
+        Returns True once every evaluation has been delivered or set aside
+        as failed. Returns False if `timeout` seconds passed first, or as
+        soon as a pass settles nothing (e.g. while the API is unreachable);
+        the remaining evaluations then stay queued.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._pending_count:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            settled = self._settled
+            if not self.flush(timeout=remaining):
+                return False
+            if self._settled == settled:
+                return False
+            if self._pending_count:
+                time.sleep(min(self.flush_interval, remaining or self.flush_interval))
+        return True
+
+    def failed(self) -> List[Tuple[EvaluationCreate, str]]:
+        """Returns the evaluations that were given up on, with their last error."""
+        with self._db_lock:
+            rows = self._connection.execute(
+                "SELECT payload, error FROM spooled_evaluations "
+                "WHERE error IS NOT NULL ORDER BY id"
+            ).fetchall()
+        return [
+            (EvaluationCreate.model_validate(json.loads(payload)), error)
+            for payload, error in rows
+        ]
+
+    def clear_failed(self) -> None:
+        with self._condition, self._db_lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM spooled_evaluations WHERE error IS NOT NULL"
+            )
+            self._failed_count = 0
+
+    def close(self, *, drain_timeout: Optional[float] = 0) -> None:
+        """
+        Stops the worker and closes the database.
+
+        Waits up to `drain_timeout` seconds (forever if None) for queued
+        evaluations to be sent first; whatever is left is kept on disk for
+        the next spool opened on the same path.
+        """
+        if drain_timeout != 0:
+            self.drain(timeout=drain_timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+        with self._db_lock:
+            self._connection.close()
+
+    def __enter__(self) -> "EvaluationSpool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close(drain_timeout=None)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not (self._closed or self._wakeup or self._flush_requested):
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+                force = self._flush_requested
+                self._wakeup = False
+                self._flush_requested = False
+                self._sending = True
+
+            try:
+                self._send_pending(force=force)
+            except Exception as error:
+                logger.error(f"Failed to flush the evaluation spool: {error}")
+            finally:
+                with self._condition:
+                    self._sending = False
+                    self._passes += 1
+                    self._condition.notify_all()
+
+    def _send_pending(self, *, force: bool) -> None:
+        """Sends every due evaluation (all of them with `force`) in batches."""
+        last_id = 0
+        while not self._closed:
+            with self._db_lock:
+                rows = self._connection.execute(
+                    "SELECT id, payload, attempts FROM spooled_evaluations "
+                    "WHERE error IS NULL AND id > ? AND (? OR next_attempt_at <= ?) "
+                    "ORDER BY id LIMIT ?",
+                    (last_id, force, time.time(), self.batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            self._send_batch(rows, force=force)
+
+    def _send_batch(self, rows: List[Tuple[int, str, int]], *, force: bool) -> None:
+        evaluation_creates = [
+            EvaluationCreate.model_validate(json.loads(payload))
+            for _, payload, _ in rows
+        ]
+        try:
+            results = self.client.create_evaluations(
+                evaluations=evaluation_creates, return_exceptions=True
+            )
+        except Exception as error:
+            results = [handle_error(err=error)] * len(rows)
+
+        delivered: List[Tuple[int]] = []
+        retried: List[Tuple[int, float, int]] = []
+        given_up: List[Tuple[str, int]] = []
+        for (row_id, _, attempts), result in zip(rows, results):
+            if not isinstance(result, MandolineError):
+                delivered.append((row_id,))
+                continue
+            permanent = is_permanent_error(error=result)
+            if force and not permanent:
+                # Flushes skip the backoff, so repeated ones (e.g. drain() at
+                # shutdown) must not use up attempts while the API is down
+                continue
+            attempts += 1
+            if permanent or attempts >= self.max_attempts:
+                logger.warning(
+                    f"Giving up on spooled evaluation after {attempts} attempt(s): {result}"
+                )
+                given_up.append((str(result), row_id))
+            else:
+                delay = compute_backoff(attempt=attempts, policy=self._backoff)
+                retried.append((attempts, time.time() + delay, row_id))
+
+        with self._db_lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM spooled_evaluations WHERE id = ?", delivered
+            )
+            self._connection.executemany(
+                "UPDATE spooled_evaluations SET attempts = ?, next_attempt_at = ? "
+                "WHERE id = ?",
+                retried,
+            )
+            self._connection.executemany(
+                "UPDATE spooled_evaluations SET error = ? WHERE id = ?", given_up
+            )
+        with self._condition:
+            self._pending_count -= len(delivered) + len(given_up)
+            self._failed_count += len(given_up)
+            self._settled += len(delivered) + len(given_up)
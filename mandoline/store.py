@@ -0,0 +1,411 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from os import PathLike
+from types import TracebackType
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type, Union
+from uuid import UUID, uuid4
+
+from mandoline.client import Mandoline
+from mandoline.config import MAX_GET_LIMIT
+from mandoline.decoding import (
+    decode_evaluation,
+    decode_evaluations,
+    decode_metric,
+    decode_metrics,
+)
+from mandoline.frame import EvaluationFrame, from_microseconds, to_microseconds
+from mandoline.models import Evaluation, Metric
+from mandoline.types import NotGiven, SerializableDict
+from mandoline.utils import NOT_GIVEN
+
+METRICS_SCOPE = "metrics"
+EVALUATIONS_SCOPE = "evaluations"
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS metrics ("
+    "id TEXT PRIMARY KEY, created_at INTEGER NOT NULL, "
+    "updated_at INTEGER NOT NULL, data TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS evaluations ("
+    "id TEXT PRIMARY KEY, metric_id TEXT NOT NULL, score REAL NOT NULL, "
+    "created_at INTEGER NOT NULL, updated_at INTEGER NOT NULL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS evaluations_metric_created "
+    "ON evaluations (metric_id, created_at)",
+    "CREATE INDEX IF NOT EXISTS evaluations_created ON evaluations (created_at)",
+    "CREATE TABLE IF NOT EXISTS evaluation_properties ("
+    "evaluation_id TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+    "PRIMARY KEY (evaluation_id, key)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS evaluation_properties_lookup "
+    "ON evaluation_properties (key, value, evaluation_id)",
+    "CREATE TABLE IF NOT EXISTS sync_state ("
+    "scope TEXT PRIMARY KEY, watermark INTEGER NOT NULL)",
+)
+
+
+def encode_property_value(value: Any) -> str:
+    """Canonical JSON, so equal property values compare equal in SQL."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def evaluation_scope(metric_id: Union[UUID, NotGiven]) -> str:
+    if isinstance(metric_id, NotGiven):
+        return EVALUATIONS_SCOPE
+    return f"{EVALUATIONS_SCOPE}:{metric_id}"
+
+
+def watermark_filter(watermark: Optional[int]) -> Union[SerializableDict, NotGiven]:
+    """Asks the API for rows updated at or after `watermark` only."""
+    if watermark is None:
+        return NOT_GIVEN
+    # Rows updated at exactly the watermark are fetched again rather than
+    # risking missing ones that share its timestamp; re-storing is harmless
+    return {"updated_at": {"$gte": from_microseconds(watermark).isoformat()}}
+
+
+def as_json_array(rows: Iterable[Tuple[str]]) -> str:
+    return "[" + ",".join(data for (data,) in rows) + "]"
+
+
+class LocalStore:
+    """
+    Local SQLite mirror of metrics and evaluations, stored at `path`.
+
+    `sync_metrics()` and `sync_evaluations()` download what changed since
+    the previous sync, using the largest `updated_at` seen as a watermark,
+    and upsert it; the first sync of a scope downloads everything. The
+    `get_*` methods then answer queries by metric, `properties` values
+    and creation time from indexed local tables without any API calls.
+
+    Incremental syncs cannot see deletions. Pass `full=True` to download
+    the whole scope again and drop local rows that no longer exist.
+    """
+
+    def __init__(self, client: Mandoline, *, path: Union[str, "PathLike[str]"]):
+        self.client = client
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "LocalStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    # Syncing
+
+    def get_watermark(self, scope: str) -> Optional[int]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM sync_state WHERE scope = ?", (scope,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def last_synced(
+        self, *, metric_id: Union[UUID, NotGiven] = NOT_GIVEN
+    ) -> Optional[datetime]:
+        """The latest `updated_at` mirrored for the given evaluation scope."""
+        watermark = self._evaluation_watermark(metric_id=metric_id)
+        return None if watermark is None else from_microseconds(watermark)
+
+    def _evaluation_watermark(
+        self, *, metric_id: Union[UUID, NotGiven]
+    ) -> Optional[int]:
+        watermarks = [self.get_watermark(evaluation_scope(metric_id))]
+        if not isinstance(metric_id, NotGiven):
+            # A sync of all evaluations also covers every single metric
+            watermarks.append(self.get_watermark(EVALUATIONS_SCOPE))
+        known = [watermark for watermark in watermarks if watermark is not None]
+        return max(known) if known else None
+
+    def _set_watermark(self, scope: str, watermark: int) -> None:
+        self._connection.execute(
+            "INSERT INTO sync_state (scope, watermark) VALUES (?, ?) "
+            "ON CONFLICT (scope) DO UPDATE SET "
+            "watermark = MAX(watermark, excluded.watermark)",
+            (scope, watermark),
+        )
+
+    def sync_metrics(
+        self,
+        *,
+        full: bool = False,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+    ) -> int:
+        """Mirrors metrics changed since the last sync; returns how many."""
+        watermark = None if full else self.get_watermark(METRICS_SCOPE)
+        metrics = self.client.iter_metrics(
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            filters=watermark_filter(watermark),
+            # A sync must see the server's current state, not the client's
+            # metric cache
+            bypass_cache=True,
+        )
+        return self._sync(
+            items=metrics,
+            scope=METRICS_SCOPE,
+            page_size=page_size,
+            full=full,
+            store=self._store_metrics,
+            scope_condition=("1", ()),
+            table="metrics",
+        )
+
+    def sync_evaluations(
+        self,
+        *,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        full: bool = False,
+        page_size: int = MAX_GET_LIMIT,
+        max_concurrency: int = 1,
+    ) -> int:
+        """
+        Mirrors evaluations changed since the last sync; returns how many.
+
+        With `metric_id`, only that metric's evaluations are synced.
+        """
+        watermark = None if full else self._evaluation_watermark(metric_id=metric_id)
+        evaluations = self.client.iter_evaluations(
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            metric_id=metric_id,
+            filters=watermark_filter(watermark),
+        )
+        scope_condition: Tuple[str, Tuple[Any, ...]] = (
+            ("1", ())
+            if isinstance(metric_id, NotGiven)
+            else ("metric_id = ?", (str(metric_id),))
+        )
+        return self._sync(
+            items=evaluations,
+            scope=evaluation_scope(metric_id),
+            page_size=page_size,
+            full=full,
+            store=self._store_evaluations,
+            scope_condition=scope_condition,
+            table="evaluations",
+        )
+
+    def _sync(
+        self,
+        *,
+        items: Iterable[Union[Metric, Evaluation]],
+        scope: str,
+        page_size: int,
+        full: bool,
+        store: Callable[[List[Any]], None],
+        scope_condition: Tuple[str, Tuple[Any, ...]],
+        table: str,
+    ) -> int:
+        # Each full sync gets its own table, so concurrent ones (e.g. of two
+        # metrics) cannot clear each other's seen IDs
+        seen_table = f"seen_ids_{uuid4().hex}" if full else None
+        if seen_table is not None:
+            with self._lock:
+                self._connection.execute(
+                    f"CREATE TEMP TABLE {seen_table} (id TEXT PRIMARY KEY)"
+                )
+
+        count = 0
+        watermark: Optional[int] = None
+        page: List[Any] = []
+
+        def write() -> None:
+            with self._lock, self._connection:
+                store(page)
+                if seen_table is not None:
+                    self._connection.executemany(
+                        f"INSERT OR IGNORE INTO {seen_table} (id) VALUES (?)",
+                        [(str(item.id),) for item in page],
+                    )
+            page.clear()
+
+        try:
+            for item in items:
+                page.append(item)
+                updated_at = to_microseconds(item.updated_at)
+                watermark = (
+                    updated_at if watermark is None else max(watermark, updated_at)
+                )
+                count += 1
+                if len(page) >= page_size:
+                    write()
+            if page:
+                write()
+
+            with self._lock, self._connection:
+                if seen_table is not None:
+                    condition, params = scope_condition
+                    self._connection.execute(
+                        f"DELETE FROM {table} WHERE {condition} "
+                        f"AND id NOT IN (SELECT id FROM {seen_table})",
+                        params,
+                    )
+                    if table == "evaluations":
+                        self._connection.execute(
+                            "DELETE FROM evaluation_properties WHERE evaluation_id "
+                            "NOT IN (SELECT id FROM evaluations)"
+                        )
+                if watermark is not None:
+                    self._set_watermark(scope, watermark)
+        finally:
+            if seen_table is not None:
+                with self._lock:
+                    self._connection.execute(f"DROP TABLE IF EXISTS {seen_table}")
+        return count
+
+    def _store_metrics(self, metrics: List[Metric]) -> None:
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO metrics (id, created_at, updated_at, data) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (
+                    str(metric.id),
+                    to_microseconds(metric.created_at),
+                    to_microseconds(metric.updated_at),
+                    json.dumps(metric.model_dump(mode="json")),
+                )
+                for metric in metrics
+            ],
+        )
+
+    def _store_evaluations(self, evaluations: List[Evaluation]) -> None:
+        ids = [(str(evaluation.id),) for evaluation in evaluations]
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO evaluations "
+            "(id, metric_id, score, created_at, updated_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    str(evaluation.id),
+                    str(evaluation.metric_id),
+                    evaluation.score,
+                    to_microseconds(evaluation.created_at),
+                    to_microseconds(evaluation.updated_at),
+                    json.dumps(evaluation.model_dump(mode="json")),
+                )
+                for evaluation in evaluations
+            ],
+        )
+        self._connection.executemany(
+            "DELETE FROM evaluation_properties WHERE evaluation_id = ?", ids
+        )
+        self._connection.executemany(
+            "INSERT INTO evaluation_properties (evaluation_id, key, value) "
+            "VALUES (?, ?, ?)",
+            [
+                (str(evaluation.id), key, encode_property_value(value))
+                for evaluation in evaluations
+                if isinstance(evaluation.properties, dict)
+                for key, value in evaluation.properties.items()
+            ],
+        )
+
+    # Local queries
+
+    def get_metric(self, *, metric_id: UUID) -> Optional[Metric]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM metrics WHERE id = ?", (str(metric_id),)
+            ).fetchone()
+        return None if row is None else decode_metric(row[0])
+
+    def get_metrics(self) -> List[Metric]:
+        """All mirrored metrics, oldest first."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM metrics ORDER BY created_at, id"
+            ).fetchall()
+        return decode_metrics(as_json_array(rows))
+
+    def get_evaluation(self, *, evaluation_id: UUID) -> Optional[Evaluation]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM evaluations WHERE id = ?", (str(evaluation_id),)
+            ).fetchone()
+        return None if row is None else decode_evaluation(row[0])
+
+    def get_evaluations(
+        self,
+        *,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Evaluation]:
+        """
+        Mirrored evaluations matching every given condition, oldest first.
+
+        `properties` matches evaluations whose properties have each given
+        key set to the given value. `created_after` is inclusive and
+        `created_before` exclusive.
+        """
+        conditions = []
+        params: List[Any] = []
+        if not isinstance(metric_id, NotGiven):
+            conditions.append("metric_id = ?")
+            params.append(str(metric_id))
+        if not isinstance(properties, NotGiven):
+            if not isinstance(properties, dict):
+                raise ValueError("properties must be a dictionary")
+            for key, value in properties.items():
+                conditions.append(
+                    "id IN (SELECT evaluation_id FROM evaluation_properties "
+                    "WHERE key = ? AND value = ?)"
+                )
+                params.extend((key, encode_property_value(value)))
+        if created_after is not None:
+            conditions.append("created_at >= ?")
+            params.append(to_microseconds(created_after))
+        if created_before is not None:
+            conditions.append("created_at < ?")
+            params.append(to_microseconds(created_before))
+
+        query = "SELECT data FROM evaluations"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY created_at, id"
+        if limit is not None:
+            if limit < 0:
+                raise ValueError("limit must not be negative")
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return decode_evaluations(as_json_array(rows))
+
+    def get_evaluation_frame(
+        self,
+        *,
+        metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+        properties: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> EvaluationFrame:
+        """Same as `get_evaluations`, as an `EvaluationFrame`. Requires numpy."""
+        return EvaluationFrame.from_evaluations(
+            self.get_evaluations(
+                metric_id=metric_id,
+                properties=properties,
+                created_after=created_after,
+                created_before=created_before,
+            )
+        )
@@ -0,0 +1,178 @@
+import functools
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, TypeVar
+
+from mandoline.errors import MandolineError
+from mandoline.hooks import RequestEvent, RequestHook
+from mandoline.types import NotGiven
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import Span, Status, StatusCode
+except ImportError:
+    trace = None  # type: ignore[assignment]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Call arguments recorded on method spans
+TRACED_ARGUMENTS = ("evaluation_id",)
+
+
+def tracing_available() -> bool:
+    return trace is not None
+
+
+def tracing_configured() -> bool:
+    """
+    Whether OpenTelemetry is installed and a tracer provider has been set;
+    until then every span is a no-op, so nothing is worth tracing.
+    """
+    if trace is None:
+        return False
+    return not isinstance(
+        trace.get_tracer_provider(),
+        (trace.ProxyTracerProvider, trace.NoOpTracerProvider),
+    )
+
+
+def get_tracer() -> "trace.Tracer":
+    return trace.get_tracer(__name__)
+
+
+def is_given(value: Any) -> bool:
+    return value is not None and not isinstance(value, NotGiven)
+
+
+def metric_id_attributes(metric_ids: Iterable[Any]) -> Dict[str, Any]:
+    """`mandoline.metric_id` for one metric, `mandoline.metric_ids` for several."""
+    unique = list(dict.fromkeys(str(metric_id) for metric_id in metric_ids))
+    if not unique:
+        return {}
+    if len(unique) == 1:
+        return {"mandoline.metric_id": unique[0]}
+    return {"mandoline.metric_ids": unique}
+
+
+def call_metric_ids(kwargs: Dict[str, Any]) -> List[Any]:
+    if is_given(kwargs.get("metric_id")):
+        return [kwargs["metric_id"]]
+    if is_given(kwargs.get("metrics")):
+        return [metric.id for metric in kwargs["metrics"]]
+    if is_given(kwargs.get("evaluations")):
+        return [evaluation.metric_id for evaluation in kwargs["evaluations"]]
+    return []
+
+
+def method_attributes(
+    func: Callable[..., Any], kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {"mandoline.method": func.__name__}
+    attributes.update(metric_id_attributes(call_metric_ids(kwargs)))
+    for name in TRACED_ARGUMENTS:
+        if is_given(kwargs.get(name)):
+            attributes[f"mandoline.{name}"] = str(kwargs[name])
+    return attributes
+
+
+def is_traced(client: Any) -> bool:
+    # Checked per call, so a tracer provider set after the client was
+    # created still applies
+    return client.tracing and tracing_configured()
+
+
+def traced(func: F) -> F:
+    """
+    Runs a client method inside a span named after it, if OpenTelemetry is
+    installed, a tracer provider is set and the client has `tracing`
+    enabled. Request attempts made by the method become child spans (see
+    `TracingHook`). Without OpenTelemetry the method is returned unchanged.
+    """
+    if trace is None:
+        return func
+
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not is_traced(self):
+                return await func(self, *args, **kwargs)
+            with get_tracer().start_as_current_span(
+                name, attributes=method_attributes(func, kwargs)
+            ):
+                return await func(self, *args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not is_traced(self):
+            return func(self, *args, **kwargs)
+        with get_tracer().start_as_current_span(
+            name, attributes=method_attributes(func, kwargs)
+        ):
+            return func(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+class TracingHook(RequestHook):
+    """
+    Records every request attempt as an OpenTelemetry client span.
+
+    The span is a child of the current span (normally the client method's)
+    and its context is injected into the request headers, so the API's own
+    spans join the caller's trace. The parent span gets the retry count.
+    """
+
+    def __init__(self) -> None:
+        if trace is None:
+            raise ImportError(
+                "Tracing requires the `opentelemetry-api` package: "
+                "pip install opentelemetry-api"
+            )
+        # Keyed by event identity: the same event is passed for a whole attempt
+        self._spans: Dict[int, "Span"] = {}
+
+    def before_request(self, event: RequestEvent) -> None:
+        parent = trace.get_current_span()
+        if event.attempt > 1:
+            parent.set_attribute("mandoline.retry_count", event.attempt - 1)
+
+        span = get_tracer().start_span(
+            f"{event.method} {event.route}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "mandoline.endpoint": event.endpoint,
+                "mandoline.route": event.route,
+                "mandoline.attempt": event.attempt,
+                "http.request.resend_count": event.attempt - 1,
+                "http.request.body.size": event.request_bytes,
+                **metric_id_attributes(event.metric_ids),
+            },
+        )
+        self._spans[id(event)] = span
+        propagate.inject(event.headers, context=trace.set_span_in_context(span))
+
+    def after_response(self, event: RequestEvent) -> None:
+        span = self._spans.get(id(event))
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", event.status_code or 0)
+        if event.response_bytes is not None:
+            span.set_attribute("http.response.body.size", event.response_bytes)
+        if event.ttfb is not None:
+            span.set_attribute("mandoline.ttfb", event.ttfb)
+        if event.status_code is not None and 200 <= event.status_code < 300:
+            del self._spans[id(event)]
+            span.end()
+
+    def on_error(self, event: RequestEvent, error: MandolineError) -> None:
+        span = self._spans.pop(id(event), None)
+        if span is None:
+            return
+        span.set_status(Status(StatusCode.ERROR, error.details.message))
+        span.set_attribute("error.type", error.details.type.value)
+        span.end()
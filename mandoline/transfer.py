@@ -0,0 +1,131 @@
+import gzip
+from os import PathLike, fspath
+from typing import IO, Callable, Iterator, Mapping, Optional, Union
+from uuid import UUID
+
+from mandoline.batch import BatchResult, EvaluationItem, ProgressCallback
+from mandoline.client import Mandoline
+from mandoline.concurrency import Concurrency
+from mandoline.config import DEFAULT_BATCH_CONCURRENCY, MAX_GET_LIMIT
+from mandoline.types import NotGiven, NullableSerializableDict, SerializableDict
+from mandoline.utils import NOT_GIVEN
+
+Path = Union[str, "PathLike[str]"]
+ExportProgressCallback = Callable[[int], None]
+
+
+def is_gzip_path(path: Path) -> bool:
+    return fspath(path).endswith(".gz")
+
+
+def open_jsonl(path: Path, mode: str, *, compress: Optional[bool] = None) -> IO[bytes]:
+    """Opens a JSONL file in binary mode, gzipped if `compress` or a `.gz` path."""
+    if compress is None:
+        compress = is_gzip_path(path)
+    if compress:
+        return gzip.open(path, f"{mode}b")  # type: ignore[return-value]
+    return open(path, f"{mode}b")
+
+
+def export_evaluations(
+    client: Mandoline,
+    *,
+    path: Path,
+    compress: Optional[bool] = None,
+    page_size: int = MAX_GET_LIMIT,
+    max_concurrency: int = 1,
+    metric_id: Union[UUID, NotGiven] = NOT_GIVEN,
+    properties: Union[NullableSerializableDict, NotGiven] = NOT_GIVEN,
+    filters: Union[SerializableDict, NotGiven] = NOT_GIVEN,
+    on_progress: Optional[ExportProgressCallback] = None,
+) -> int:
+    """
+    Writes all matching evaluations to `path`, one JSON object per line.
+
+    Evaluations are streamed page by page through `iter_evaluations` and
+    written as they arrive, so memory use does not grow with the export
+    size. The file is gzipped when `compress` is set or, by default, when
+    `path` ends in `.gz`. `on_progress` receives the number of
+    evaluations written so far. Returns the total.
+    """
+    count = 0
+    with open_jsonl(path, "w", compress=compress) as file:
+        for evaluation in client.iter_evaluations(
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            metric_id=metric_id,
+            properties=properties,
+            filters=filters,
+        ):
+            file.write(client.json_codec.dumps(evaluation.model_dump(mode="json")))
+            file.write(b"\n")
+            count += 1
+            if on_progress is not None:
+                on_progress(count)
+    return count
+
+
+def import_evaluations(
+    client: Mandoline,
+    *,
+    path: Path,
+    compress: Optional[bool] = None,
+    metric_ids: Optional[Mapping[UUID, UUID]] = None,
+    max_concurrency: Concurrency = DEFAULT_BATCH_CONCURRENCY,
+    on_progress: Optional[ProgressCallback] = None,
+    bypass_cache: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Creates an evaluation for every line of a JSONL file at `path`.
+
+    Lines are read lazily and submitted through `evaluate_many`, so at
+    most `max_concurrency` requests are in flight and only those lines
+    are held in memory. Only `metric_id`, `prompt`, `response` and
+    `properties` are read from each line; files written by
+    `export_evaluations` can be imported as they are. Use `metric_ids` to
+    map metric IDs of the source environment to those of the target.
+    A result is yielded per line as it completes, with `index` counting
+    the evaluations in the file; blank lines are skipped. Lines missing
+    a field or holding an invalid one fail individually, with the error
+    in their result, while a line that is not a JSON object aborts the
+    import with a `ValueError` giving its line number.
+    """
+
+    def items() -> Iterator[EvaluationItem]:
+        with open_jsonl(path, "r", compress=compress) as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = client.json_codec.loads(line)
+                except ValueError as error:
+                    raise ValueError(
+                        f"{fspath(path)}:{line_number}: invalid JSON: {error}"
+                    ) from error
+                if not isinstance(data, dict):
+                    raise ValueError(
+                        f"{fspath(path)}:{line_number}: expected a JSON object"
+                    )
+
+                # Missing or invalid fields are left for evaluate_many to
+                # report in the line's result, so one bad line does not
+                # abort the import
+                metric_id = data.get("metric_id")
+                if metric_ids is not None:
+                    try:
+                        metric_id = metric_ids.get(UUID(str(metric_id)), metric_id)
+                    except ValueError:
+                        pass
+                yield (
+                    metric_id,
+                    data.get("prompt"),
+                    data.get("response"),
+                    data.get("properties", NOT_GIVEN),
+                )
+
+    return client.evaluate_many(
+        items=items(),
+        max_concurrency=max_concurrency,
+        on_progress=on_progress,
+        bypass_cache=bypass_cache,
+    )
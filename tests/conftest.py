@@ -0,0 +1,40 @@
+import pytest
+from stub_server import StubServer
+
+from mandoline import Mandoline, RetryConfig
+
+
+@pytest.fixture
+def server():
+    with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+def legacy_server():
+    """A stub API without the batch endpoint, as served by older deployments."""
+    with StubServer(batch_supported=False) as server:
+        yield server
+
+
+@pytest.fixture
+def make_client():
+    """
+    Returns a factory for clients of a stub server.
+
+    Failed requests are not retried unless `retry` is passed.
+    """
+
+    def make(server, client_class=Mandoline, **kwargs):
+        kwargs.setdefault("retry", RetryConfig(max_attempts=1))
+        return client_class(
+            api_key="test_api_key", api_base_url=server.api_base_url, **kwargs
+        )
+
+    return make
+
+
+@pytest.fixture
+def client(server, make_client):
+    with make_client(server) as client:
+        yield client
@@ -0,0 +1,335 @@
+"""
+A minimal in-process stand-in for the Mandoline API.
+
+Used by the tests, and by the benchmarks with added latency and injected
+failures.
+"""
+
+import gzip
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+
+# Seconds between shutdown checks of the serving loop
+POLL_INTERVAL = 0.01
+
+
+class StubConfig:
+    """
+    Latency and failures of the stub.
+
+    `latency` (seconds) is added to every request, plus a uniformly random
+    `latency_jitter`. A request fails with a 500 with probability
+    `error_rate`, or with a 429 carrying `Retry-After: retry_after` with
+    probability `rate_limit_rate`. Responses over 1 KiB are gzipped for
+    clients that accept it, unless `compress_responses` is False.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 0.0,
+        compress_responses: bool = True,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.compress_responses = compress_responses
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def delay(self) -> float:
+        if not self.latency_jitter:
+            return self.latency
+        with self.lock:
+            return self.latency + self.random.uniform(0, self.latency_jitter)
+
+    def failure(self) -> Optional[int]:
+        if not (self.error_rate or self.rate_limit_rate):
+            return None
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return 500
+        return None
+
+
+class StubState:
+    def __init__(self, *, batch_supported: bool):
+        self.batch_supported = batch_supported
+        # Truncates batch responses, to simulate a misbehaving server
+        self.batch_response_limit: Optional[int] = None
+        self.lock = threading.Lock()
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self.evaluations: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.request_encodings: List[Optional[str]] = []
+        self.compressed_responses = 0
+        self.injected_failures = 0
+        # Encoded once per evaluation, so large listings do not dominate
+        # benchmark measurements
+        self._encoded_evaluations: Dict[str, bytes] = {}
+
+    def create_metric(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        metric = {"id": str(uuid4()), "created_at": now, "updated_at": now}
+        metric.update(payload)
+        with self.lock:
+            self.metrics[metric["id"]] = metric
+        return metric
+
+    def create_evaluation(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc).isoformat()
+        evaluation = {
+            "id": str(uuid4()),
+            "metric_id": payload["metric_id"],
+            "prompt": payload["prompt"],
+            "response": payload["response"],
+            "properties": payload.get("properties"),
+            "score": (len(payload["response"]) % 100) / 100,
+            "created_at": now,
+            "updated_at": now,
+        }
+        with self.lock:
+            self.evaluations[evaluation["id"]] = evaluation
+        return evaluation
+
+    def encode_evaluations(self, evaluations: List[Dict[str, Any]]) -> bytes:
+        parts = []
+        with self.lock:
+            for evaluation in evaluations:
+                encoded = self._encoded_evaluations.get(evaluation["id"])
+                if encoded is None:
+                    encoded = json.dumps(evaluation).encode("utf-8")
+                    self._encoded_evaluations[evaluation["id"]] = encoded
+                parts.append(encoded)
+        return b"[" + b",".join(parts) + b"]"
+
+    def forget_encoding(self, evaluation_id: str) -> None:
+        with self.lock:
+            self._encoded_evaluations.pop(evaluation_id, None)
+
+
+def make_handler(config: StubConfig, state: StubState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm and delayed ACKs add ~40ms to every response
+        disable_nagle_algorithm = True
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def _path(self) -> Tuple[List[str], Dict[str, List[str]]]:
+            url = urlparse(self.path)
+            # Paths look like /v1/<resource>/[<id>]
+            parts = [part for part in url.path.split("/") if part][1:]
+            return parts, parse_qs(url.query)
+
+        def _read_json(self) -> Any:
+            length = int(self.headers.get("Content-Length") or 0)
+            content = self.rfile.read(length)
+            encoding = self.headers.get("Content-Encoding")
+            with state.lock:
+                state.request_encodings.append(encoding)
+            if encoding == "gzip":
+                content = gzip.decompress(content)
+            return json.loads(content) if content else None
+
+        def _send_bytes(
+            self, status: int, payload: bytes, headers: Optional[Dict[str, str]] = None
+        ) -> None:
+            accept_encoding = self.headers.get("Accept-Encoding") or ""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            if (
+                config.compress_responses
+                and len(payload) > 1024
+                and "gzip" in accept_encoding
+            ):
+                payload = gzip.compress(payload)
+                self.send_header("Content-Encoding", "gzip")
+                with state.lock:
+                    state.compressed_responses += 1
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _send(self, status: int, body: Optional[Any] = None) -> None:
+            payload = b"" if body is None else json.dumps(body).encode("utf-8")
+            self._send_bytes(status, payload)
+
+        def _begin(self) -> bool:
+            """Records the request and applies latency and failure injection."""
+            with state.lock:
+                state.requests.append((self.command, urlparse(self.path).path))
+            delay = config.delay()
+            if delay:
+                time.sleep(delay)
+
+            status = config.failure()
+            if status is None:
+                return True
+            with state.lock:
+                state.injected_failures += 1
+            if status == 429:
+                detail = {"type": "RateLimitExceeded", "message": "Slow down"}
+                payload = json.dumps({"detail": detail}).encode("utf-8")
+                headers = {"Retry-After": str(config.retry_after)}
+                self._send_bytes(429, payload, headers)
+            else:
+                self._send(500, {"detail": "Injected failure"})
+            return False
+
+        def do_GET(self) -> None:
+            if not self._begin():
+                return
+            parts, query = self._path()
+            resource = state.metrics if parts[0] == "metrics" else state.evaluations
+            if len(parts) == 2:
+                item = resource.get(parts[1])
+                (
+                    self._send(200, item)
+                    if item
+                    else self._send(404, {"detail": "Not found"})
+                )
+                return
+
+            skip = int(query.get("skip", ["0"])[0])
+            limit = int(query.get("limit", ["100"])[0])
+            filters = json.loads(query.get("filters", ["{}"])[0])
+            with state.lock:
+                items = list(resource.values())
+            if "metric_id" in filters:
+                items = [i for i in items if i["metric_id"] == filters["metric_id"]]
+            if "updated_at" in filters:
+                since = datetime.fromisoformat(filters["updated_at"]["$gte"])
+                items = [
+                    i for i in items if datetime.fromisoformat(i["updated_at"]) >= since
+                ]
+            if resource is state.evaluations:
+                self._send_bytes(
+                    200, state.encode_evaluations(items[skip : skip + limit])
+                )
+            else:
+                self._send(200, items[skip : skip + limit])
+
+        def do_POST(self) -> None:
+            # The body is read first so the connection can be reused after a failure
+            payload = self._read_json()
+            if not self._begin():
+                return
+            parts, _ = self._path()
+            if parts == ["metrics"]:
+                self._send(200, state.create_metric(payload))
+            elif parts == ["evaluations"] and payload["prompt"] == "invalid":
+                detail = {"type": "ValidationError", "message": "Invalid prompt"}
+                self._send(422, {"detail": detail})
+            elif parts == ["evaluations"]:
+                self._send(200, state.create_evaluation(payload))
+            elif parts == ["evaluations", "batch"] and state.batch_supported:
+                created = [
+                    state.create_evaluation(item) for item in payload["evaluations"]
+                ]
+                self._send(200, created[: state.batch_response_limit])
+            else:
+                self._send(404, {"detail": "Not found"})
+
+        def do_PUT(self) -> None:
+            payload = self._read_json()
+            if not self._begin():
+                return
+            parts, _ = self._path()
+            resource = state.metrics if parts[0] == "metrics" else state.evaluations
+            with state.lock:
+                item = resource.get(parts[1])
+                if item is not None:
+                    item.update(payload)
+                    item["updated_at"] = datetime.now(timezone.utc).isoformat()
+            state.forget_encoding(parts[1])
+            (
+                self._send(200, item)
+                if item
+                else self._send(404, {"detail": "Not found"})
+            )
+
+        def do_DELETE(self) -> None:
+            if not self._begin():
+                return
+            parts, _ = self._path()
+            resource = state.metrics if parts[0] == "metrics" else state.evaluations
+            with state.lock:
+                resource.pop(parts[1], None)
+            state.forget_encoding(parts[1])
+            self._send(204)
+
+    return Handler
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        # Clients dropping connections (e.g. cancelled prefetches) is expected
+        pass
+
+
+class StubServer:
+    """Serves the stub API on a random local port until `stop()` is called."""
+
+    def __init__(
+        self, *, batch_supported: bool = True, config: Optional[StubConfig] = None
+    ):
+        self.config = config or StubConfig()
+        self.state = StubState(batch_supported=batch_supported)
+        self._server = QuietHTTPServer(
+            ("127.0.0.1", 0), make_handler(self.config, self.state)
+        )
+        # stop() waits for the serving loop to notice, up to one poll interval
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": POLL_INTERVAL},
+            daemon=True,
+        )
+
+    @property
+    def api_base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def count(self, method: str, path: str) -> int:
+        with self.state.lock:
+            return sum(
+                1 for request in self.state.requests if request == (method, path)
+            )
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
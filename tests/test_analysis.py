@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from mandoline import Evaluation, EvaluationFrame
+from mandoline.analysis import summarize
+
+np = pytest.importorskip("numpy")
+
+METRIC_IDS = [uuid4(), uuid4()]
+TIMESTAMP = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_evaluation(*, score, metric=0, properties=None):
+    return Evaluation(
+        id=uuid4(),
+        metric_id=METRIC_IDS[metric],
+        prompt="p",
+        response="r",
+        properties=properties,
+        score=score,
+        created_at=TIMESTAMP,
+        updated_at=TIMESTAMP,
+    )
+
+
+@pytest.fixture
+def evaluations():
+    return [
+        make_evaluation(score=0.2, properties={"model": "a", "size": "s"}),
+        make_evaluation(score=0.4, properties={"model": "a", "size": "l"}),
+        make_evaluation(score=0.6, properties={"model": "a", "size": "l"}),
+        make_evaluation(score=0.9, metric=1, properties={"model": "b"}),
+        make_evaluation(score=0.7, metric=1, properties={"model": "b"}),
+        make_evaluation(score=0.5, metric=1),
+    ]
+
+
+def test_summarize_groups_by_property(evaluations):
+    summaries = summarize(evaluations, by="model", seed=0)
+
+    by_model = {summary.group["model"]: summary for summary in summaries}
+    assert set(by_model) == {"a", "b", None}
+
+    a = by_model["a"]
+    assert a.count == 3
+    assert a.mean == pytest.approx(0.4)
+    assert a.std == pytest.approx(np.std([0.2, 0.4, 0.6], ddof=1))
+    assert (a.min, a.max) == (0.2, 0.6)
+    assert a.quantiles == pytest.approx({0.25: 0.3, 0.5: 0.4, 0.75: 0.5})
+    assert 0.2 <= a.ci_low <= a.mean <= a.ci_high <= 0.6
+
+    single = by_model[None]
+    assert single.count == 1
+    assert single.std is None
+    assert single.ci_low == single.ci_high == 0.5
+
+
+def test_summarize_groups_by_several_keys(evaluations):
+    frame = EvaluationFrame.from_evaluations(evaluations)
+
+    summaries = summarize(frame, by=["metric_id", "size"], bootstrap_samples=0)
+
+    groups = {
+        (summary.group["metric_id"], summary.group["size"]): summary.count
+        for summary in summaries
+    }
+    assert groups == {
+        (METRIC_IDS[0], "s"): 1,
+        (METRIC_IDS[0], "l"): 2,
+        (METRIC_IDS[1], None): 3,
+    }
+    assert all(summary.ci_low is None for summary in summaries)
+
+
+def test_summarize_orders_groups_by_first_appearance():
+    evaluations = [
+        make_evaluation(score=0.1, properties={"x": 1, "y": 1}),
+        make_evaluation(score=0.2, properties={"x": 2, "y": 2}),
+        make_evaluation(score=0.3, properties={"x": 1, "y": 2}),
+        make_evaluation(score=0.4, properties={"x": 2, "y": 2}),
+    ]
+
+    summaries = summarize(evaluations, by=["x", "y"], bootstrap_samples=0)
+
+    assert [summary.group for summary in summaries] == [
+        {"x": 1, "y": 1},
+        {"x": 2, "y": 2},
+        {"x": 1, "y": 2},
+    ]
+    assert [summary.count for summary in summaries] == [1, 2, 1]
+    assert summaries[1].mean == pytest.approx(0.3)
+
+
+def test_summarize_without_grouping(evaluations):
+    [summary] = summarize(evaluations, quantiles=[0.5], seed=1)
+
+    assert summary.group == {}
+    assert summary.count == 6
+    assert summary.quantiles == {0.5: pytest.approx(0.55)}
+
+
+def test_summarize_bootstrap_is_reproducible(evaluations):
+    first = summarize(evaluations, by="model", seed=42)
+    second = summarize(evaluations, by="model", seed=42)
+
+    assert first == second
+
+
+def test_summarize_matches_numpy_on_large_input():
+    rng = np.random.default_rng(0)
+    scores = rng.random(20_000)
+    models = rng.integers(0, 4, size=20_000)
+    evaluations = [
+        make_evaluation(score=float(score), properties={"model": int(model)})
+        for score, model in zip(scores, models)
+    ]
+
+    summaries = summarize(evaluations, by="model", bootstrap_samples=200, seed=0)
+
+    for summary in summaries:
+        expected = scores[models == summary.group["model"]]
+        assert summary.count == len(expected)
+        assert summary.mean == pytest.approx(expected.mean())
+        assert summary.std == pytest.approx(expected.std(ddof=1))
+        assert summary.quantiles[0.75] == pytest.approx(np.quantile(expected, 0.75))
+        assert summary.ci_low < expected.mean() < summary.ci_high
+
+
+def test_summarize_validates_arguments(evaluations):
+    assert summarize([]) == []
+    with pytest.raises(ValueError):
+        summarize(evaluations, confidence=1.5)
+    with pytest.raises(ValueError):
+        summarize(evaluations, quantiles=[2])
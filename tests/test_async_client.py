@@ -0,0 +1,191 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import AsyncMandoline
+from mandoline.errors import MandolineError, MandolineErrorType
+from mandoline.models import Evaluation, Metric
+
+
+@pytest.fixture
+def api_key():
+    return "test_api_key"
+
+
+@pytest.fixture
+def mandoline_client(api_key):
+    return AsyncMandoline(api_key=api_key)
+
+
+@pytest.fixture
+def mock_metric_data():
+    return {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "name": "Test Metric",
+        "description": "A test metric",
+        "tags": ["test"],
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def mock_evaluation_data():
+    return {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "metric_id": "234e5678-e89b-12d3-a456-426614174000",
+        "prompt": "Test prompt",
+        "response": "Test response",
+        "properties": {"key": "value"},
+        "score": 0.42,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+
+
+def make_response(*, method, json=None, status_code=200):
+    return httpx.Response(
+        status_code=status_code,
+        json=json,
+        request=httpx.Request(method, "https://test.api.com/"),
+    )
+
+
+def test_async_context_manager_closes_pool(api_key):
+    async def run():
+        async with AsyncMandoline(api_key=api_key) as client:
+            assert not client._http_client.is_closed
+        return client
+
+    client = asyncio.run(run())
+    assert client._http_client.is_closed
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_create_metric(mock_make_request, mandoline_client, mock_metric_data):
+    mock_make_request.return_value = make_response(method="POST", json=mock_metric_data)
+
+    metric = asyncio.run(
+        mandoline_client.create_metric(
+            name="Test Metric", description="A test metric", tags=["test"]
+        )
+    )
+
+    assert isinstance(metric, Metric)
+    assert metric.name == mock_metric_data["name"]
+    mock_make_request.assert_awaited_once()
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_get_metrics(mock_make_request, mandoline_client, mock_metric_data):
+    mock_make_request.return_value = make_response(
+        method="GET", json=[mock_metric_data, mock_metric_data]
+    )
+
+    metrics = asyncio.run(mandoline_client.get_metrics(tags=["test"]))
+
+    assert len(metrics) == 2
+    assert all(isinstance(metric, Metric) for metric in metrics)
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_evaluate(mock_make_request, mandoline_client, mock_evaluation_data):
+    mock_make_request.return_value = make_response(
+        method="POST", json=mock_evaluation_data
+    )
+    metrics = [
+        Metric(
+            id=UUID(f"234e5678-e89b-12d3-a456-42661417400{i}"),
+            name=f"Metric {i}",
+            description="Test metric",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        for i in range(2)
+    ]
+
+    evaluations = asyncio.run(
+        mandoline_client.evaluate(
+            metrics=metrics, prompt="Test prompt", response="Test response"
+        )
+    )
+
+    assert len(evaluations) == 2
+    assert all(isinstance(eval, Evaluation) for eval in evaluations)
+    assert mock_make_request.await_count == 2
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_get_evaluations(mock_make_request, mandoline_client, mock_evaluation_data):
+    mock_make_request.return_value = make_response(
+        method="GET", json=[mock_evaluation_data]
+    )
+
+    evaluations = asyncio.run(
+        mandoline_client.get_evaluations(
+            metric_id=UUID(mock_evaluation_data["metric_id"])
+        )
+    )
+
+    assert len(evaluations) == 1
+    assert evaluations[0].score == mock_evaluation_data["score"]
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_delete_evaluation(mock_make_request, mandoline_client):
+    mock_make_request.return_value = make_response(method="DELETE", status_code=204)
+
+    result = asyncio.run(
+        mandoline_client.delete_evaluation(
+            evaluation_id=UUID("123e4567-e89b-12d3-a456-426614174000")
+        )
+    )
+
+    assert result is None
+    mock_make_request.assert_awaited_once()
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_rate_limit_error_handling(mock_make_request, mandoline_client):
+    mock_response = make_response(
+        method="GET",
+        status_code=429,
+        json={"detail": {"type": "RateLimitExceeded", "message": "Slow down"}},
+    )
+    mock_make_request.side_effect = httpx.HTTPStatusError(
+        "Rate limit exceeded", request=mock_response.request, response=mock_response
+    )
+
+    with pytest.raises(MandolineError) as exc_info:
+        asyncio.run(mandoline_client.get_metrics())
+
+    assert exc_info.value.details.type == MandolineErrorType.RateLimitExceeded
+
+
+def test_get_with_limit_exceeding_max(mandoline_client):
+    with pytest.raises(ValueError):
+        asyncio.run(
+            mandoline_client._get(endpoint="test_endpoint", params={"limit": 1000000})
+        )
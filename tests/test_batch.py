@@ -0,0 +1,113 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import AsyncMandoline, BatchResult, Mandoline
+from mandoline.models import EvaluationCreate
+
+METRIC_ID = UUID("234e5678-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def api_key():
+    return "test_api_key"
+
+
+def respond(*, body, **_):
+    payload = json.loads(body["content"])
+    if payload["prompt"] == "fail":
+        response = httpx.Response(
+            status_code=500,
+            request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+        )
+        raise httpx.HTTPStatusError(
+            "Server error", request=response.request, response=response
+        )
+    return httpx.Response(
+        status_code=200,
+        json={
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "score": 0.5,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-01-01T00:00:00Z",
+            **payload,
+        },
+        request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+    )
+
+
+async def async_respond(**kwargs):
+    return respond(**kwargs)
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_evaluate_many_reports_per_item_errors(mock_make_request, api_key):
+    mock_make_request.side_effect = respond
+    items = [
+        EvaluationCreate(metric_id=METRIC_ID, prompt="ok 0", response="r"),
+        (METRIC_ID, "fail", "r"),
+        (METRIC_ID, "ok 2", "r", {"model": "a"}),
+        ("not-a-uuid", "ok 3", "r"),
+    ]
+    progress = []
+
+    results = list(
+        Mandoline(api_key=api_key).evaluate_many(
+            items=items, max_concurrency=2, on_progress=progress.append
+        )
+    )
+
+    assert all(isinstance(result, BatchResult) for result in results)
+    by_index = {result.index: result for result in results}
+    assert by_index[0].ok and by_index[0].evaluation.prompt == "ok 0"
+    assert not by_index[1].ok
+    assert by_index[2].evaluation.properties == {"model": "a"}
+    assert not by_index[3].ok
+    assert mock_make_request.call_count == 3
+
+    assert [p.completed for p in progress] == [1, 2, 3, 4]
+    assert progress[-1].succeeded == 2
+    assert progress[-1].failed == 2
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_evaluate_many_pulls_items_lazily(mock_make_request, api_key):
+    mock_make_request.side_effect = respond
+    pulled = 0
+
+    def items():
+        nonlocal pulled
+        for i in range(1000):
+            pulled += 1
+            yield (METRIC_ID, f"ok {i}", "r")
+
+    results = Mandoline(api_key=api_key).evaluate_many(items=items(), max_concurrency=4)
+    next(results)
+    results.close()
+
+    assert pulled <= 5
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_async_evaluate_many(mock_make_request, api_key):
+    mock_make_request.side_effect = async_respond
+    items = [(METRIC_ID, "fail" if i == 3 else f"ok {i}", "r") for i in range(10)]
+
+    async def run():
+        client = AsyncMandoline(api_key=api_key)
+        return [
+            result
+            async for result in client.evaluate_many(items=items, max_concurrency=3)
+        ]
+
+    results = asyncio.run(run())
+
+    assert sorted(result.index for result in results) == list(range(10))
+    assert [result.index for result in results if not result.ok] == [3]
@@ -0,0 +1,142 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from mandoline import (
+    AsyncMandoline,
+    EvaluationBatcher,
+    MandolineError,
+    MemoryResultCache,
+)
+from mandoline.models import EvaluationCreate
+
+METRIC_ID = uuid4()
+
+
+def make_creates(count):
+    return [
+        EvaluationCreate(metric_id=METRIC_ID, prompt=f"p{i}", response="r" * i)
+        for i in range(count)
+    ]
+
+
+def test_create_evaluations_uses_batch_endpoint(server, make_client):
+    with make_client(server) as client:
+        evaluations = client.create_evaluations(evaluations=make_creates(5))
+
+    assert [evaluation.prompt for evaluation in evaluations] == [
+        f"p{i}" for i in range(5)
+    ]
+    assert server.count("POST", "/v1/evaluations/batch") == 1
+    assert server.count("POST", "/v1/evaluations/") == 0
+
+
+def test_create_evaluations_falls_back_without_batch_endpoint(
+    legacy_server, make_client
+):
+    with make_client(legacy_server) as client:
+        first = client.create_evaluations(evaluations=make_creates(3))
+        second = client.create_evaluations(evaluations=make_creates(2))
+
+    assert [evaluation.prompt for evaluation in first] == ["p0", "p1", "p2"]
+    assert len(second) == 2
+    # Support is probed once and remembered
+    assert legacy_server.count("POST", "/v1/evaluations/batch") == 1
+    assert legacy_server.count("POST", "/v1/evaluations/") == 5
+
+
+def test_create_evaluations_serves_cached_items(server, make_client):
+    with make_client(server, result_cache=MemoryResultCache()) as client:
+        client.create_evaluations(evaluations=make_creates(2))
+        evaluations = client.create_evaluations(evaluations=make_creates(3))
+
+    assert [evaluation.prompt for evaluation in evaluations] == ["p0", "p1", "p2"]
+    assert server.count("POST", "/v1/evaluations/batch") == 2
+    assert len(server.state.evaluations) == 3
+
+
+def test_create_evaluations_rejects_oversized_batch(server, make_client):
+    with make_client(server) as client:
+        with pytest.raises(ValueError):
+            client.create_evaluations(evaluations=make_creates(101))
+
+
+def test_create_evaluations_reports_batch_failure(server, make_client):
+    bad = EvaluationCreate(metric_id=METRIC_ID, prompt="p", response="r")
+    with make_client(server) as client:
+        server.stop()
+        results = client.create_evaluations(
+            evaluations=[bad, bad], return_exceptions=True
+        )
+
+    assert all(isinstance(result, MandolineError) for result in results)
+
+
+def test_create_evaluations_rejects_short_batch_response(server, make_client):
+    server.state.batch_response_limit = 1
+    with make_client(server) as client:
+        with pytest.raises(MandolineError):
+            client.create_evaluations(evaluations=make_creates(3))
+        results = client.create_evaluations(
+            evaluations=make_creates(3), return_exceptions=True
+        )
+
+    assert all(isinstance(result, MandolineError) for result in results)
+
+
+def test_batcher_groups_by_size(server, make_client):
+    with make_client(server) as client:
+        with EvaluationBatcher(client, max_batch_size=10, max_wait=5) as batcher:
+            futures = [batcher.submit(item) for item in make_creates(25)]
+            results = [future.result(timeout=5) for future in futures[:20]]
+
+    assert [evaluation.prompt for evaluation in results] == [f"p{i}" for i in range(20)]
+    assert futures[-1].result().prompt == "p24"
+    assert server.count("POST", "/v1/evaluations/batch") == 3
+
+
+def test_batcher_sends_partial_batch_after_max_wait(server, make_client):
+    with make_client(server) as client:
+        with EvaluationBatcher(client, max_batch_size=50, max_wait=0.05) as batcher:
+            started_at = time.monotonic()
+            future = batcher.submit((METRIC_ID, "prompt", "response"))
+            evaluation = future.result(timeout=5)
+
+            assert evaluation.prompt == "prompt"
+            assert time.monotonic() - started_at < 2
+
+    assert server.count("POST", "/v1/evaluations/batch") == 1
+
+
+def test_batcher_flush_and_fallback(legacy_server, make_client):
+    with make_client(legacy_server) as client:
+        batcher = EvaluationBatcher(client, max_batch_size=50, max_wait=60)
+        futures = [batcher.submit(item) for item in make_creates(4)]
+        batcher.flush()
+
+        assert all(future.done() for future in futures)
+        assert legacy_server.count("POST", "/v1/evaluations/") == 4
+
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit((METRIC_ID, "late", "r"))
+
+
+def test_batcher_reports_invalid_items_on_submit(server, make_client):
+    with make_client(server) as client:
+        with EvaluationBatcher(client) as batcher:
+            with pytest.raises(MandolineError):
+                batcher.submit(("not-a-uuid", "p", "r"))
+
+
+def test_async_create_evaluations(legacy_server, make_client):
+    async def run():
+        async with make_client(legacy_server, client_class=AsyncMandoline) as client:
+            return await client.create_evaluations(evaluations=make_creates(3))
+
+    evaluations = asyncio.run(run())
+
+    assert [evaluation.prompt for evaluation in evaluations] == ["p0", "p1", "p2"]
+    assert legacy_server.count("POST", "/v1/evaluations/") == 3
@@ -0,0 +1,124 @@
+from unittest.mock import patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import Mandoline
+from mandoline.cache import TTLCache
+
+METRIC_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def mock_metric_data():
+    return {
+        "id": str(METRIC_ID),
+        "name": "Test Metric",
+        "description": "A test metric",
+        "tags": ["test"],
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def cached_client():
+    return Mandoline(api_key="test_api_key", metric_cache_ttl=60)
+
+
+def respond_with(data, method="GET", status_code=200):
+    return lambda **_: httpx.Response(
+        status_code=status_code,
+        json=data,
+        request=httpx.Request(method, "https://test.api.com/metrics/"),
+    )
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("mandoline.cache.time.monotonic", return_value=100.0):
+        cache.set("a", 1)
+    with patch("mandoline.cache.time.monotonic", return_value=104.0):
+        assert cache.get("a") == 1
+    with patch("mandoline.cache.time.monotonic", return_value=106.0):
+        assert cache.get("a") is None
+
+
+def test_metric_cache_is_disabled_by_default():
+    assert Mandoline(api_key="test_api_key").metric_cache is None
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_get_metric_is_cached(mock_make_request, cached_client, mock_metric_data):
+    mock_make_request.side_effect = respond_with(mock_metric_data)
+
+    first = cached_client.get_metric(metric_id=METRIC_ID)
+    second = cached_client.get_metric(metric_id=METRIC_ID)
+
+    assert first.id == second.id == METRIC_ID
+    assert mock_make_request.call_count == 1
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_get_metrics_is_cached_per_query(
+    mock_make_request, cached_client, mock_metric_data
+):
+    mock_make_request.side_effect = respond_with([mock_metric_data])
+
+    cached_client.get_metrics(tags=["test"])
+    cached_client.get_metrics(tags=["test"])
+    assert mock_make_request.call_count == 1
+
+    cached_client.get_metrics(tags=["other"])
+    assert mock_make_request.call_count == 2
+
+    # Listed metrics are also served by get_metric
+    cached_client.get_metric(metric_id=METRIC_ID)
+    assert mock_make_request.call_count == 2
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_update_metric_invalidates_cache(
+    mock_make_request, cached_client, mock_metric_data
+):
+    mock_make_request.side_effect = respond_with([mock_metric_data])
+    cached_client.get_metrics(tags=["test"])
+
+    updated_data = {**mock_metric_data, "name": "Updated Metric"}
+    mock_make_request.side_effect = respond_with(updated_data, method="PUT")
+    cached_client.update_metric(metric_id=METRIC_ID, name="Updated Metric")
+    assert cached_client.get_metric(metric_id=METRIC_ID).name == "Updated Metric"
+
+    mock_make_request.side_effect = respond_with([updated_data])
+    metrics = cached_client.get_metrics(tags=["test"])
+    assert metrics[0].name == "Updated Metric"
+    assert mock_make_request.call_count == 3
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_delete_metric_invalidates_cache(
+    mock_make_request, cached_client, mock_metric_data
+):
+    mock_make_request.side_effect = respond_with(mock_metric_data)
+    cached_client.get_metric(metric_id=METRIC_ID)
+
+    mock_make_request.side_effect = respond_with(None, "DELETE", status_code=204)
+    cached_client.delete_metric(metric_id=METRIC_ID)
+
+    mock_make_request.side_effect = respond_with(mock_metric_data)
+    cached_client.get_metric(metric_id=METRIC_ID)
+    assert mock_make_request.call_count == 3
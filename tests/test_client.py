@@ -1,3 +1,5 @@
+import json
+import time
 from datetime import datetime, timezone
 from unittest.mock import patch
 from uuid import UUID
@@ -5,8 +7,15 @@ from uuid import UUID
 import httpx
 import pytest
 
-from mandoline import Mandoline
-from mandoline.config import CONNECT_TIMEOUT, MANDOLINE_API_BASE_URL, RWP_TIMEOUT
+from mandoline import Mandoline, MandolineError
+from mandoline.config import (
+    CONNECT_TIMEOUT,
+    KEEPALIVE_EXPIRY,
+    MANDOLINE_API_BASE_URL,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    RWP_TIMEOUT,
+)
 from mandoline.models import Evaluation, Metric
 
 
@@ -76,6 +85,50 @@ def test_mandoline_client_default_config(mandoline_client):
     assert mandoline_client.request_config.api_base_url == MANDOLINE_API_BASE_URL
     assert mandoline_client.request_config.connect_timeout == CONNECT_TIMEOUT
     assert mandoline_client.request_config.rwp_timeout == RWP_TIMEOUT
+    assert mandoline_client.request_config.max_connections == MAX_CONNECTIONS
+    assert (
+        mandoline_client.request_config.max_keepalive_connections
+        == MAX_KEEPALIVE_CONNECTIONS
+    )
+    assert mandoline_client.request_config.keepalive_expiry == KEEPALIVE_EXPIRY
+    assert mandoline_client.request_config.http2 is False
+
+
+def test_mandoline_client_pool_config(api_key):
+    client = Mandoline(
+        api_key=api_key,
+        max_connections=8,
+        max_keepalive_connections=4,
+        keepalive_expiry=60.0,
+    )
+    assert client.request_config.max_connections == 8
+    assert client.request_config.max_keepalive_connections == 4
+    assert client.request_config.keepalive_expiry == 60.0
+    client.close()
+
+
+def test_mandoline_client_context_manager_closes_pool(api_key):
+    with Mandoline(api_key=api_key) as client:
+        assert not client._http_client.is_closed
+    assert client._http_client.is_closed
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_requests_reuse_pooled_client(
+    mock_make_request, mandoline_client, mock_metric_data
+):
+    mock_make_request.side_effect = lambda **_: httpx.Response(
+        status_code=200,
+        json=mock_metric_data,
+        request=httpx.Request("GET", "https://test.api.com/metrics/"),
+    )
+
+    metric_id = UUID(mock_metric_data["id"])
+    mandoline_client.get_metric(metric_id=metric_id)
+    mandoline_client.get_metric(metric_id=metric_id)
+
+    clients = [call.kwargs["client"] for call in mock_make_request.call_args_list]
+    assert clients[0] is clients[1] is mandoline_client._http_client
 
 
 def test_mandoline_client_initialization_with_env_vars(monkeypatch):
@@ -265,6 +318,81 @@ def test_evaluate(mock_make_request, mandoline_client):
     assert mock_make_request.call_count == 2
 
 
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_evaluate_keeps_metric_order(mock_make_request, mandoline_client):
+    def respond(*, body, **_):
+        metric_id = json.loads(body["content"])["metric_id"]
+        time.sleep(0.05 if metric_id.endswith("0") else 0)
+        return httpx.Response(
+            status_code=200,
+            json={
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "metric_id": metric_id,
+                "prompt": "Test prompt",
+                "response": "Test response",
+                "score": 0.42,
+                "created_at": "2023-01-01T00:00:00Z",
+                "updated_at": "2023-01-01T00:00:00Z",
+            },
+            request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+        )
+
+    mock_make_request.side_effect = respond
+
+    metrics = [
+        Metric(
+            id=UUID(f"234e5678-e89b-12d3-a456-42661417400{i}"),
+            name=f"Metric {i}",
+            description="Test metric",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        for i in range(3)
+    ]
+
+    evaluations = mandoline_client.evaluate(
+        metrics=metrics, prompt="Test prompt", response="Test response"
+    )
+
+    assert [e.metric_id for e in evaluations] == [m.id for m in metrics]
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_evaluate_return_exceptions(mock_make_request, mandoline_client):
+    error_response = httpx.Response(
+        status_code=500,
+        request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+    )
+    mock_make_request.side_effect = httpx.HTTPStatusError(
+        "Server error", request=error_response.request, response=error_response
+    )
+
+    metrics = [
+        Metric(
+            id=UUID(f"234e5678-e89b-12d3-a456-42661417400{i}"),
+            name=f"Metric {i}",
+            description="Test metric",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        for i in range(2)
+    ]
+
+    results = mandoline_client.evaluate(
+        metrics=metrics,
+        prompt="Test prompt",
+        response="Test response",
+        return_exceptions=True,
+    )
+    assert len(results) == 2
+    assert all(isinstance(result, MandolineError) for result in results)
+
+    with pytest.raises(MandolineError):
+        mandoline_client.evaluate(
+            metrics=metrics, prompt="Test prompt", response="Test response"
+        )
+
+
 @patch("mandoline.connection_manager.make_request_with_timeout")
 def test_create_evaluation(mock_make_request, mandoline_client, mock_evaluation_data):
     mock_response = httpx.Response(
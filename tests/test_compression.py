@@ -0,0 +1,70 @@
+import gzip
+from uuid import UUID
+
+import pytest
+
+from mandoline import Mandoline
+from mandoline.compression import compress, compress_body
+
+METRIC_ID = UUID("234e5678-e89b-12d3-a456-426614174000")
+
+
+def test_compress_body_skips_small_bodies():
+    content = b'{"prompt": "short"}'
+
+    assert compress_body(content=content, encoding="gzip", threshold=1024) == (
+        content,
+        {},
+    )
+
+
+def test_compress_body_gzip():
+    content = b'{"prompt": "%s"}' % (b"long " * 1000)
+
+    compressed, headers = compress_body(content=content, encoding="gzip", threshold=10)
+
+    assert headers == {"Content-Encoding": "gzip"}
+    assert len(compressed) < len(content)
+    assert gzip.decompress(compressed) == content
+
+
+def test_compress_zstd():
+    zstandard = pytest.importorskip("zstandard")
+    content = b"long " * 1000
+
+    compressed = compress(content=content, encoding="zstd")
+
+    assert zstandard.ZstdDecompressor().decompress(compressed) == content
+
+
+def test_zstd_requires_zstandard():
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            Mandoline(api_key="test_api_key", compression="zstd")
+    else:
+        pytest.skip("zstandard is installed")
+
+
+def test_client_compresses_large_request_bodies(server, make_client):
+    with make_client(server, compression="gzip", compression_threshold=512) as client:
+        small = client.create_evaluation(metric_id=METRIC_ID, prompt="p", response="r")
+        large = client.create_evaluation(
+            metric_id=METRIC_ID, prompt="context " * 1000, response="r"
+        )
+
+    assert small.prompt == "p"
+    assert large.prompt == "context " * 1000
+    assert server.state.request_encodings == [None, "gzip"]
+
+
+def test_client_accepts_compressed_responses(client, server):
+    for i in range(10):
+        client.create_evaluation(
+            metric_id=METRIC_ID, prompt=f"p{i}", response="r" * 200
+        )
+    evaluations = client.get_evaluations()
+
+    assert len(evaluations) == 10
+    assert server.state.compressed_responses >= 1
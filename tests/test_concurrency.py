@@ -0,0 +1,164 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mandoline.concurrency import (
+    AdaptiveConcurrency,
+    amap_concurrently,
+    map_concurrently,
+)
+from mandoline.errors import (
+    GenericErrorDetails,
+    MandolineError,
+    RateLimitExceededErrorDetails,
+)
+
+
+def fail_on(value):
+    def func(item):
+        if item == value:
+            raise MandolineError(details=GenericErrorDetails(message=f"bad {item}"))
+        time.sleep(0.01 * (5 - item))
+        return item * 10
+
+    return func
+
+
+def test_map_concurrently_preserves_order():
+    results = map_concurrently(
+        func=fail_on(None), items=[0, 1, 2, 3, 4], max_concurrency=5
+    )
+    assert results == [0, 10, 20, 30, 40]
+
+
+def test_map_concurrently_bounds_concurrency():
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def func(item):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return item
+
+    map_concurrently(func=func, items=list(range(10)), max_concurrency=3)
+    assert peak <= 3
+
+
+def test_map_concurrently_fail_fast():
+    with pytest.raises(MandolineError, match="bad 2"):
+        map_concurrently(func=fail_on(2), items=[0, 1, 2, 3], max_concurrency=4)
+
+
+def test_map_concurrently_return_exceptions():
+    results = map_concurrently(
+        func=fail_on(2), items=[0, 1, 2, 3], max_concurrency=4, return_exceptions=True
+    )
+    assert results[:2] == [0, 10]
+    assert isinstance(results[2], MandolineError)
+    assert results[3] == 30
+
+
+def test_amap_concurrently():
+    async def func(item):
+        if item == 2:
+            raise MandolineError(details=GenericErrorDetails(message="bad 2"))
+        await asyncio.sleep(0.01 * (5 - item))
+        return item * 10
+
+    results = asyncio.run(
+        amap_concurrently(
+            func=func, items=[0, 1, 2, 3], max_concurrency=2, return_exceptions=True
+        )
+    )
+    assert results[:2] == [0, 10]
+    assert isinstance(results[2], MandolineError)
+    assert results[3] == 30
+
+    with pytest.raises(MandolineError, match="bad 2"):
+        asyncio.run(amap_concurrently(func=func, items=[0, 1, 2], max_concurrency=3))
+
+
+def rate_limit_error():
+    return MandolineError(
+        details=RateLimitExceededErrorDetails(message="Rate limit exceeded")
+    )
+
+
+def test_adaptive_concurrency_increases_additively():
+    controller = AdaptiveConcurrency(initial_limit=4, max_limit=6)
+
+    for _ in range(5):
+        controller.record_success(latency=0.01)
+    assert controller.limit == 5
+
+    for _ in range(100):
+        controller.record_success(latency=0.01)
+    assert controller.limit == 6
+
+
+def test_adaptive_concurrency_decreases_once_per_congestion_event():
+    controller = AdaptiveConcurrency(initial_limit=16, max_limit=32)
+
+    # Five calls sent together all fail: the limit is only cut once
+    for _ in range(5):
+        controller.record_failure(error=rate_limit_error(), latency=1.0)
+    assert controller.limit == 8
+
+    time.sleep(0.01)
+    controller.record_failure(error=rate_limit_error(), latency=0.0)
+    assert controller.limit == 4
+
+
+def test_adaptive_concurrency_ignores_non_congestion_errors():
+    controller = AdaptiveConcurrency(initial_limit=8)
+    controller.record_failure(
+        error=MandolineError(details=GenericErrorDetails(message="bad")), latency=0.1
+    )
+    assert controller.limit == 8
+
+
+def test_adaptive_concurrency_latency_target_and_floor():
+    controller = AdaptiveConcurrency(initial_limit=2, min_limit=2, latency_target=0.1)
+    controller.record_success(latency=0.5)
+    assert controller.limit == 2
+
+
+def test_adaptive_concurrency_validates_arguments():
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrency(decrease_factor=1.5)
+
+
+def test_map_concurrently_with_adaptive_limit_backs_off():
+    controller = AdaptiveConcurrency(initial_limit=8, max_limit=8)
+    limits = []
+    # The first eight calls are in flight together, however late their
+    # threads start, so they are one congestion event
+    first_wave = threading.Barrier(8)
+
+    def func(item):
+        limits.append(controller.limit)
+        if item < 8:
+            first_wave.wait(timeout=10)
+            raise rate_limit_error()
+        time.sleep(0.01)
+        return item
+
+    results = map_concurrently(
+        func=func,
+        items=list(range(40)),
+        max_concurrency=controller,
+        return_exceptions=True,
+    )
+
+    assert results[8:] == list(range(8, 40))
+    assert min(limits[8:]) == 4
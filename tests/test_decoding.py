@@ -0,0 +1,102 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from mandoline import AsyncMandoline, Evaluation, Mandoline, Metric
+from mandoline.decoding import (
+    decode_evaluation,
+    decode_evaluations,
+    decode_metric,
+    decode_metrics,
+)
+
+EVALUATION_DATA = {
+    "id": "123e4567-e89b-12d3-a456-426614174000",
+    "metric_id": "234e5678-e89b-12d3-a456-426614174000",
+    "prompt": "Test prompt",
+    "response": "Test response",
+    "properties": {"model": "a"},
+    "score": 0.5,
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00.123456+00:00",
+}
+
+METRIC_DATA = {
+    "id": "234e5678-e89b-12d3-a456-426614174000",
+    "name": "Test Metric",
+    "description": "A test metric",
+    "tags": ["test"],
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+
+@pytest.mark.parametrize(
+    "decode, decode_list, data",
+    [
+        (decode_evaluation, decode_evaluations, EVALUATION_DATA),
+        (decode_metric, decode_metrics, METRIC_DATA),
+    ],
+)
+def test_raw_json_decodes_like_parsed_json(decode, decode_list, data):
+    raw_item = json.dumps(data).encode("utf-8")
+    raw_list = json.dumps([data, data]).encode("utf-8")
+
+    assert decode(raw_item) == decode(data)
+    assert decode_list(raw_list) == decode_list([data, data])
+
+
+def test_raw_json_is_still_validated():
+    raw = json.dumps([{**EVALUATION_DATA, "id": "not-a-uuid"}]).encode("utf-8")
+
+    with pytest.raises(ValidationError):
+        decode_evaluations(raw)
+
+
+def test_missing_properties_stay_not_given():
+    data = {k: v for k, v in EVALUATION_DATA.items() if k != "properties"}
+
+    evaluation = decode_evaluation(json.dumps(data).encode("utf-8"))
+
+    assert evaluation.model_dump() == Evaluation.model_validate(data).model_dump()
+
+
+def list_response(data):
+    return httpx.Response(
+        status_code=200,
+        json=data,
+        request=httpx.Request("GET", "https://test.api.com/"),
+    )
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_client_fast_decode(mock_make_request):
+    mock_make_request.side_effect = lambda *, url, **_: list_response(
+        [METRIC_DATA] if "metrics" in url else [EVALUATION_DATA] * 3
+    )
+    client = Mandoline(api_key="test_api_key", fast_decode=True)
+
+    with patch.object(Evaluation, "model_validate") as model_validate:
+        evaluations = client.get_evaluations()
+    metrics = client.get_metrics()
+
+    model_validate.assert_not_called()
+    assert evaluations == [Evaluation.model_validate(EVALUATION_DATA)] * 3
+    assert metrics == [Metric.model_validate(METRIC_DATA)]
+
+
+@patch("mandoline.connection_manager.make_async_request_with_timeout")
+def test_async_client_fast_decode(mock_make_request):
+    mock_make_request.side_effect = AsyncMock(
+        return_value=list_response([EVALUATION_DATA])
+    )
+
+    async def run():
+        async with AsyncMandoline(api_key="test_api_key", fast_decode=True) as client:
+            return await client.get_evaluations()
+
+    assert asyncio.run(run()) == [Evaluation.model_validate(EVALUATION_DATA)]
@@ -0,0 +1,145 @@
+import asyncio
+import subprocess
+import sys
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from mandoline import AsyncMandoline, Evaluation, EvaluationFrame
+
+np = pytest.importorskip("numpy")
+
+METRIC_IDS = [uuid4(), uuid4()]
+
+
+def make_evaluation(i, properties):
+    timestamp = datetime(2024, 1, 1, 12, 0, i, 123456, tzinfo=timezone.utc)
+    return Evaluation(
+        id=uuid4(),
+        metric_id=METRIC_IDS[i % 2],
+        prompt="shared prompt",
+        response=f"response {i % 3}",
+        properties=properties,
+        score=i / 10,
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+@pytest.fixture
+def evaluations():
+    return [
+        make_evaluation(0, {"model": "a", "temperature": 0.5}),
+        make_evaluation(1, {"model": "b", "tags": ["x", "y"]}),
+        make_evaluation(2, None),
+        make_evaluation(3, {"model": "a", "temperature": 1.0}),
+    ] + [make_evaluation(4, {})]
+
+
+def test_frame_round_trips_evaluations(evaluations):
+    frame = EvaluationFrame.from_evaluations(evaluations)
+
+    assert len(frame) == 5
+    assert list(frame) == evaluations
+    assert frame[-1] == evaluations[-1]
+    assert frame.ids == [evaluation.id for evaluation in evaluations]
+    with pytest.raises(IndexError):
+        frame[5]
+
+
+def test_frame_missing_properties_round_trip():
+    evaluation = Evaluation.model_validate(
+        {
+            "id": str(uuid4()),
+            "metric_id": str(METRIC_IDS[0]),
+            "prompt": "p",
+            "response": "r",
+            "score": 1.0,
+            "created_at": "2024-01-01T00:00:00Z",
+            "updated_at": "2024-01-01T00:00:00Z",
+        }
+    )
+
+    frame = EvaluationFrame.from_evaluations([evaluation])
+
+    assert frame[0].model_dump() == evaluation.model_dump()
+
+
+def test_frame_columns(evaluations):
+    frame = EvaluationFrame.from_evaluations(evaluations)
+
+    assert frame.scores.dtype == np.float64
+    np.testing.assert_allclose(frame.scores, [0.0, 0.1, 0.2, 0.3, 0.4])
+    assert frame.created_at.dtype == np.dtype("datetime64[us]")
+    assert list(frame.metric_ids) == [METRIC_IDS[i % 2] for i in range(5)]
+    assert list(frame.prompts) == ["shared prompt"] * 5
+    assert list(frame.property("model")) == ["a", "b", None, "a", None]
+    assert list(frame.property("tags"))[1] == ["x", "y"]
+    assert frame.property("temperature", default=0.0).dtype == np.float64
+    assert set(frame.property_keys) == {"model", "temperature", "tags"}
+    # Repeated texts are stored once
+    assert len(frame._prompts) == 1
+    assert len(frame._responses) == 3
+
+
+def test_frame_filtering(evaluations):
+    frame = EvaluationFrame.from_evaluations(evaluations)
+
+    high = frame[frame.scores >= 0.2]
+    assert [evaluation.score for evaluation in high] == [0.2, 0.3, 0.4]
+    assert list(frame[1:3]) == evaluations[1:3]
+    assert list(frame[[4, 0]]) == [evaluations[4], evaluations[0]]
+
+
+def test_frame_to_pandas(evaluations):
+    pytest.importorskip("pandas")
+
+    df = EvaluationFrame.from_evaluations(evaluations).to_pandas()
+
+    assert len(df) == 5
+    assert df["prompt"].dtype == "category"
+    assert list(df["properties.model"].isna()) == [False, False, True, False, True]
+    assert list(df["properties.model"].dropna()) == ["a", "b", "a"]
+    assert str(df["created_at"].dt.tz) == "UTC"
+    assert df["id"][0] == str(evaluations[0].id)
+
+
+def test_frame_to_arrow(evaluations):
+    pa = pytest.importorskip("pyarrow")
+
+    table = EvaluationFrame.from_evaluations(evaluations).to_arrow()
+
+    assert table.num_rows == 5
+    assert pa.types.is_dictionary(table.schema.field("response").type)
+    assert table.column("score").to_pylist() == [0.0, 0.1, 0.2, 0.3, 0.4]
+
+
+def test_client_get_evaluation_frame(client, server, make_client):
+    for i in range(7):
+        client.create_evaluation(
+            metric_id=METRIC_IDS[0],
+            prompt="p",
+            response=f"r{i}",
+            properties={"i": i},
+        )
+    frame = client.get_evaluation_frame(page_size=3)
+
+    async def run():
+        async with make_client(server, client_class=AsyncMandoline) as async_client:
+            return await async_client.get_evaluation_frame(page_size=3)
+
+    async_frame = asyncio.run(run())
+
+    assert len(frame) == len(async_frame) == 7
+    assert list(frame.property("i")) == list(range(7))
+    assert isinstance(frame[0].id, UUID)
+
+
+def test_importing_mandoline_does_not_import_numpy():
+    code = "import sys, mandoline; print('numpy' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,138 @@
+import asyncio
+import random
+
+import pytest
+
+from mandoline import (
+    AsyncMandoline,
+    MandolineError,
+    RequestHook,
+    StatsCollector,
+)
+from mandoline.hooks import LatencyHistogram, endpoint_route
+
+METRIC_ID = "234e5678-e89b-12d3-a456-426614174000"
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def before_request(self, event):
+        self.events.append(("before", event.model_copy()))
+
+    def after_response(self, event):
+        self.events.append(("after", event.model_copy()))
+
+    def on_error(self, event, error):
+        self.events.append(("error", event.model_copy(), error))
+
+
+class FailingHook(RequestHook):
+    def before_request(self, event):
+        raise RuntimeError("broken hook")
+
+
+def test_hooks_receive_request_events(server, make_client):
+    hook = RecordingHook()
+    with make_client(server, hooks=[hook, FailingHook()]) as client:
+        evaluation = client.create_evaluation(
+            metric_id=METRIC_ID, prompt="p", response="r"
+        )
+        client.get_evaluation(evaluation_id=evaluation.id)
+
+    names = [event[0] for event in hook.events]
+    assert names == ["before", "after", "before", "after"]
+
+    _, created = hook.events[1]
+    assert (created.method, created.route, created.status_code) == (
+        "POST",
+        "evaluations",
+        200,
+    )
+    assert created.request_bytes > 0
+    assert created.response_bytes > 0
+    assert created.connect_time is not None
+    assert 0 < created.ttfb <= created.total_time
+
+    _, fetched = hook.events[3]
+    assert fetched.route == "evaluations/{id}"
+    assert fetched.endpoint == f"evaluations/{evaluation.id}"
+    # The second request reuses the pooled connection
+    assert fetched.connect_time is None
+
+
+def test_hooks_receive_errors(server, make_client):
+    hook = RecordingHook()
+    with make_client(server, hooks=[hook]) as client:
+        with pytest.raises(MandolineError):
+            client.create_evaluation(
+                metric_id=METRIC_ID, prompt="invalid", response="r"
+            )
+
+    names = [event[0] for event in hook.events]
+    assert names == ["before", "after", "error"]
+    _, event, error = hook.events[2]
+    assert event.status_code == 422
+    assert isinstance(error, MandolineError)
+
+
+def test_hooks_with_async_client(server, make_client):
+    hook = RecordingHook()
+
+    async def run():
+        async with make_client(
+            server, client_class=AsyncMandoline, hooks=[hook]
+        ) as client:
+            await client.create_evaluation(
+                metric_id=METRIC_ID, prompt="p", response="r"
+            )
+
+    asyncio.run(run())
+
+    _, event = hook.events[-1]
+    assert event.status_code == 200
+    assert event.ttfb is not None
+
+
+def test_stats_collector(server, make_client):
+    stats = StatsCollector()
+    with make_client(server, hooks=[stats]) as client:
+        for i in range(5):
+            client.create_evaluation(metric_id=METRIC_ID, prompt=f"p{i}", response="r")
+        with pytest.raises(MandolineError):
+            client.create_evaluation(
+                metric_id=METRIC_ID, prompt="invalid", response="r"
+            )
+        client.get_evaluations()
+
+    report = stats.stats()
+    assert set(report) == {"POST evaluations", "GET evaluations"}
+    posts = report["POST evaluations"]
+    assert (posts.count, posts.errors) == (6, 1)
+    assert 0 < posts.p50 <= posts.p95 <= posts.p99 <= posts.max
+    assert len(stats.report()) == 2
+
+    stats.reset()
+    assert stats.stats() == {}
+
+
+def test_latency_histogram_percentiles():
+    rng = random.Random(0)
+    latencies = [rng.lognormvariate(-4, 1) for _ in range(10_000)]
+    histogram = LatencyHistogram()
+    for latency in latencies:
+        histogram.record(latency)
+
+    latencies.sort()
+    for q in (50, 95, 99):
+        exact = latencies[int(len(latencies) * q / 100) - 1]
+        assert histogram.percentile(q) == pytest.approx(exact, rel=0.03)
+    assert histogram.percentile(100) == latencies[-1]
+    assert LatencyHistogram().percentile(50) is None
+
+
+def test_endpoint_route():
+    assert endpoint_route("metrics/") == "metrics"
+    assert endpoint_route(f"metrics/{METRIC_ID}") == "metrics/{id}"
+    assert endpoint_route("evaluations/batch") == "evaluations/batch"
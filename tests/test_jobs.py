@@ -0,0 +1,64 @@
+import json
+from uuid import UUID
+
+from mandoline import EvaluationJob, JobCheckpoint
+
+METRIC_ID = UUID("234e5678-e89b-12d3-a456-426614174000")
+
+
+def make_items(count):
+    return [(METRIC_ID, f"p{i}", "r") for i in range(count)]
+
+
+def test_job_resumes_from_checkpoint(server, make_client, tmp_path):
+    path = tmp_path / "job.jsonl"
+    with make_client(server) as client:
+        with EvaluationJob(client, checkpoint_path=path, max_concurrency=2) as job:
+            # Simulate a crash after the first three results
+            results = job.run(make_items(10))
+            first_run = [next(results) for _ in range(3)]
+            results.close()
+
+        with EvaluationJob(client, checkpoint_path=path) as job:
+            second_run = list(job.run(make_items(10)))
+
+            assert job.skipped == 3
+            assert len(job.checkpoint) == 10
+
+    assert all(result.ok for result in first_run + second_run)
+    indexes = {result.index for result in first_run} | {
+        result.index for result in second_run
+    }
+    assert indexes == set(range(10))
+    assert server.count("POST", "/v1/evaluations/") <= 10 + 2
+
+
+def test_job_does_not_checkpoint_failures(server, make_client, tmp_path):
+    path = tmp_path / "job.jsonl"
+    items = [(METRIC_ID, "p0", "r"), ("not-a-uuid", "p1", "r")]
+    with make_client(server) as client:
+        with EvaluationJob(client, checkpoint_path=path) as job:
+            results = sorted(job.run(items), key=lambda result: result.index)
+
+    assert [result.ok for result in results] == [True, False]
+    assert len(path.read_text().splitlines()) == 1
+
+
+def test_checkpoint_ignores_torn_lines(tmp_path):
+    path = tmp_path / "job.jsonl"
+    evaluation_id = UUID("123e4567-e89b-12d3-a456-426614174000")
+    path.write_text(
+        json.dumps({"key": "a", "evaluation_id": str(evaluation_id)})
+        + '\n{"key": "b", "evalu'
+    )
+
+    checkpoint = JobCheckpoint(path=path)
+    assert "a" in checkpoint
+    assert "b" not in checkpoint
+    checkpoint.record("c", evaluation_id)
+    checkpoint.close()
+
+    reopened = JobCheckpoint(path=path)
+    assert reopened.get("c") == evaluation_id
+    assert len(reopened) == 2
+    reopened.close()
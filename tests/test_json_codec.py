@@ -0,0 +1,107 @@
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mandoline import JSONCodec, Mandoline, MandolineError
+from mandoline.client import process_get_options
+from mandoline.json_codec import (
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_json_codec,
+)
+
+PAYLOAD = {"prompt": "héllo " * 100, "score": 0.5, "tags": ["a", None], "n": 3}
+
+
+@pytest.mark.parametrize(
+    "codec_class, module",
+    [(StdlibJSONCodec, None), (OrjsonCodec, "orjson"), (MsgspecCodec, "msgspec")],
+)
+def test_codecs_round_trip(codec_class, module):
+    if module is not None:
+        pytest.importorskip(module)
+    codec = codec_class()
+
+    encoded = codec.dumps(PAYLOAD)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode("utf-8")) == PAYLOAD
+
+
+def test_get_json_codec():
+    codec = StdlibJSONCodec()
+
+    assert get_json_codec(codec) is codec
+    assert isinstance(get_json_codec("json"), StdlibJSONCodec)
+    assert isinstance(get_json_codec(), JSONCodec)
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, data):
+        self.calls.append("dumps")
+        return super().dumps(data)
+
+    def loads(self, content):
+        self.calls.append("loads")
+        return super().loads(content)
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_client_uses_codec_for_bodies(mock_make_request):
+    metric = {
+        "id": "234e5678-e89b-12d3-a456-426614174000",
+        "name": "Test Metric",
+        "description": "A test metric",
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+    mock_make_request.return_value = httpx.Response(
+        status_code=200,
+        json=metric,
+        request=httpx.Request("POST", "https://test.api.com/metrics/"),
+    )
+    codec = RecordingCodec()
+    client = Mandoline(api_key="test_api_key", json_codec=codec)
+
+    client.create_metric(name="Test Metric", description="A test metric")
+
+    body = mock_make_request.call_args.kwargs["body"]
+    assert json.loads(body["content"]) == {
+        "name": "Test Metric",
+        "description": "A test metric",
+    }
+    assert codec.calls == ["dumps", "loads"]
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_unserializable_bodies_raise_mandoline_error(mock_make_request, codec):
+    pytest.importorskip(codec)
+    client = Mandoline(api_key="test_api_key", json_codec=codec)
+
+    with pytest.raises(MandolineError):
+        client.create_evaluation(
+            metric_id="234e5678-e89b-12d3-a456-426614174000",
+            prompt="p",
+            response="r",
+            properties={"s": {1, 2}},
+        )
+    mock_make_request.assert_not_called()
+
+
+def test_process_get_options_encodes_filters_with_codec():
+    params = process_get_options(
+        skip=0, limit=10, tags=["a"], json_codec=StdlibJSONCodec()
+    )
+
+    assert params["filters"] == '{"tags":["a"]}'
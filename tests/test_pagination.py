@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlparse
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import AsyncMandoline, Mandoline
+from mandoline.pagination import aiterate_pages, iterate_pages
+
+
+def make_fetcher(total):
+    calls = []
+
+    def fetch_page(skip, limit):
+        calls.append((skip, limit))
+        return list(range(skip, min(skip + limit, total)))
+
+    return fetch_page, calls
+
+
+def test_iterate_pages_yields_everything_and_stops_on_short_page():
+    fetch_page, calls = make_fetcher(25)
+
+    assert list(iterate_pages(fetch_page=fetch_page, skip=0, page_size=10)) == list(
+        range(25)
+    )
+    assert calls == [(0, 10), (10, 10), (20, 10)]
+
+
+def test_iterate_pages_stops_on_empty_page():
+    fetch_page, calls = make_fetcher(20)
+
+    assert len(list(iterate_pages(fetch_page=fetch_page, skip=0, page_size=10))) == 20
+    assert calls[-1] == (20, 10)
+
+
+def test_iterate_pages_prefetches_next_page():
+    fetched = threading.Event()
+
+    def fetch_page(skip, limit):
+        if skip == 10:
+            fetched.set()
+        return list(range(skip, skip + limit)) if skip < 20 else []
+
+    items = iterate_pages(fetch_page=fetch_page, skip=0, page_size=10)
+    assert next(items) == 0
+    # The second page is requested while the first one is still being consumed
+    assert fetched.wait(timeout=1)
+    items.close()
+
+
+def test_iterate_pages_concurrently_keeps_order():
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    calls = []
+
+    def fetch_page(skip, limit):
+        nonlocal active, peak
+        with lock:
+            calls.append(skip)
+            active += 1
+            peak = max(peak, active)
+        # Later pages answer first
+        time.sleep(0.02 if (skip // limit) % 2 == 0 else 0.005)
+        with lock:
+            active -= 1
+        return list(range(skip, min(skip + limit, 95)))
+
+    items = list(
+        iterate_pages(fetch_page=fetch_page, skip=0, page_size=10, max_concurrency=4)
+    )
+
+    assert items == list(range(95))
+    assert 1 < peak <= 4
+    # Stops scheduling once the short page at skip=90 is seen
+    assert max(calls) < 90 + 4 * 10
+
+
+def test_iterate_pages_validates_arguments():
+    fetch_page, _ = make_fetcher(1)
+    with pytest.raises(ValueError):
+        list(iterate_pages(fetch_page=fetch_page, skip=0, page_size=0))
+    with pytest.raises(ValueError):
+        list(
+            iterate_pages(fetch_page=fetch_page, skip=0, page_size=1, max_concurrency=0)
+        )
+
+
+def test_aiterate_pages():
+    async def fetch_page(skip, limit):
+        return list(range(skip, min(skip + limit, 25)))
+
+    async def run(max_concurrency):
+        return [
+            item
+            async for item in aiterate_pages(
+                fetch_page=fetch_page,
+                skip=5,
+                page_size=10,
+                max_concurrency=max_concurrency,
+            )
+        ]
+
+    assert asyncio.run(run(1)) == list(range(5, 25))
+    assert asyncio.run(run(3)) == list(range(5, 25))
+
+
+def evaluation_page(request_url, total):
+    params = parse_qs(urlparse(request_url).query)
+    skip, limit = int(params["skip"][0]), int(params["limit"][0])
+    return [
+        {
+            "id": str(UUID(int=index)),
+            "metric_id": "234e5678-e89b-12d3-a456-426614174000",
+            "prompt": "Test prompt",
+            "response": "Test response",
+            "score": 0.5,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-01-01T00:00:00Z",
+        }
+        for index in range(skip, min(skip + limit, total))
+    ]
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_iter_evaluations(mock_make_request):
+    mock_make_request.side_effect = lambda *, url, **_: httpx.Response(
+        status_code=200,
+        json=evaluation_page(url, total=7),
+        request=httpx.Request("GET", url),
+    )
+    client = Mandoline(api_key="test_api_key")
+
+    evaluations = list(
+        client.iter_evaluations(
+            page_size=3, metric_id=UUID("234e5678-e89b-12d3-a456-426614174000")
+        )
+    )
+
+    assert [evaluation.id.int for evaluation in evaluations] == list(range(7))
+    assert mock_make_request.call_count == 3
+
+    evaluations = list(client.iter_evaluations(page_size=2, max_concurrency=3))
+    assert [evaluation.id.int for evaluation in evaluations] == list(range(7))
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_async_iter_evaluations(mock_make_request):
+    async def respond(*, url, **_):
+        return httpx.Response(
+            status_code=200,
+            json=evaluation_page(url, total=4),
+            request=httpx.Request("GET", url),
+        )
+
+    mock_make_request.side_effect = respond
+    client = AsyncMandoline(api_key="test_api_key")
+
+    async def run():
+        return [evaluation async for evaluation in client.iter_evaluations(page_size=2)]
+
+    evaluations = asyncio.run(run())
+
+    assert [evaluation.id.int for evaluation in evaluations] == list(range(4))
+    assert mock_make_request.await_count == 3
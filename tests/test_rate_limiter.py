@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import Mandoline, RateLimiter
+
+
+def test_rate_limiter_validates_arguments():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+    assert RateLimiter(rate=0.5).burst == 1
+
+
+def test_rate_limiter_allows_burst_then_paces():
+    limiter = RateLimiter(rate=50, burst=5)
+
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_rate_limiter_is_shared_across_threads():
+    limiter = RateLimiter(rate=100, burst=1)
+
+    def worker():
+        for _ in range(5):
+            limiter.acquire()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests at 100/s with a burst of 1 take at least 190ms
+    assert time.monotonic() - start >= 0.18
+
+
+def test_rate_limiter_is_shared_across_tasks():
+    limiter = RateLimiter(rate=100, burst=2)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(12)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_client_acquires_a_token_per_request(mock_make_request):
+    mock_make_request.return_value = httpx.Response(
+        status_code=204,
+        request=httpx.Request("DELETE", "https://test.api.com/metrics/"),
+    )
+    limiter = MagicMock(spec=RateLimiter)
+    client = Mandoline(api_key="test_api_key", rate_limiter=limiter)
+
+    for _ in range(3):
+        client.delete_metric(metric_id=UUID("123e4567-e89b-12d3-a456-426614174000"))
+
+    assert limiter.acquire.call_count == 3
@@ -0,0 +1,163 @@
+import sqlite3
+from contextlib import closing
+from unittest.mock import patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import Mandoline, MemoryResultCache, SQLiteResultCache
+from mandoline.models import Evaluation, EvaluationCreate
+from mandoline.result_cache import make_cache_namespace, make_evaluation_key
+
+METRIC_ID = UUID("234e5678-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def mock_evaluation_data():
+    return {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "metric_id": str(METRIC_ID),
+        "prompt": "Test prompt",
+        "response": "Test response",
+        "properties": {"key": "value"},
+        "score": 0.42,
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+
+
+def test_evaluation_key_depends_on_payload_only():
+    first = EvaluationCreate(
+        metric_id=METRIC_ID, prompt="p", response="r", properties={"a": 1, "b": 2}
+    )
+    same = EvaluationCreate(
+        metric_id=METRIC_ID, prompt="p", response="r", properties={"b": 2, "a": 1}
+    )
+    other = EvaluationCreate(metric_id=METRIC_ID, prompt="p", response="r2")
+
+    assert make_evaluation_key(first) == make_evaluation_key(same)
+    assert make_evaluation_key(first) != make_evaluation_key(other)
+
+
+def test_evaluation_key_is_namespaced():
+    evaluation_create = EvaluationCreate(metric_id=METRIC_ID, prompt="p", response="r")
+    namespaces = [
+        make_cache_namespace(api_base_url="https://a.example/v1", api_key="k1"),
+        make_cache_namespace(api_base_url="https://b.example/v1", api_key="k1"),
+        make_cache_namespace(api_base_url="https://a.example/v1", api_key="k2"),
+    ]
+
+    keys = {
+        make_evaluation_key(evaluation_create, namespace=namespace)
+        for namespace in namespaces
+    }
+    assert len(keys) == 3
+    assert all("k1" not in namespace for namespace in namespaces)
+
+
+def test_sqlite_result_cache_persists(tmp_path, mock_evaluation_data):
+    path = tmp_path / "results.db"
+    evaluation = Evaluation.model_validate(mock_evaluation_data)
+
+    cache = SQLiteResultCache(path=path)
+    cache.set("key", evaluation)
+    cache.close()
+
+    reopened = SQLiteResultCache(path=path)
+    assert reopened.get("key") == evaluation
+    assert reopened.get("missing") is None
+    reopened.clear()
+    assert reopened.get("key") is None
+
+
+def count_rows(path):
+    with closing(sqlite3.connect(str(path))) as connection:
+        return connection.execute("SELECT COUNT(*) FROM evaluation_results").fetchone()[
+            0
+        ]
+
+
+def test_sqlite_result_cache_evicts_oldest(tmp_path, mock_evaluation_data):
+    path = tmp_path / "results.db"
+    evaluation = Evaluation.model_validate(mock_evaluation_data)
+    cache = SQLiteResultCache(path=path, maxsize=3)
+
+    with patch("mandoline.result_cache.time.time", side_effect=range(5)):
+        for i in range(5):
+            cache.set(f"key{i}", evaluation)
+
+    assert count_rows(path) == 3
+    assert cache.get("key1") is None
+    assert cache.get("key4") == evaluation
+    cache.close()
+
+
+def test_sqlite_result_cache_deletes_expired(tmp_path, mock_evaluation_data):
+    path = tmp_path / "results.db"
+    evaluation = Evaluation.model_validate(mock_evaluation_data)
+    cache = SQLiteResultCache(path=path, ttl=10)
+
+    with patch("mandoline.result_cache.time.time", return_value=0):
+        cache.set("key", evaluation)
+    with patch("mandoline.result_cache.time.time", return_value=5):
+        assert cache.get("key") == evaluation
+    with patch("mandoline.result_cache.time.time", return_value=20):
+        assert cache.get("key") is None
+
+    assert count_rows(path) == 0
+    cache.close()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_create_evaluation_uses_result_cache(
+    mock_make_request, backend, tmp_path, mock_evaluation_data
+):
+    mock_make_request.side_effect = lambda **_: httpx.Response(
+        status_code=200,
+        json=mock_evaluation_data,
+        request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+    )
+    result_cache = (
+        MemoryResultCache()
+        if backend == "memory"
+        else SQLiteResultCache(path=tmp_path / "results.db")
+    )
+    client = Mandoline(api_key="test_api_key", result_cache=result_cache)
+    kwargs = dict(
+        metric_id=METRIC_ID,
+        prompt="Test prompt",
+        response="Test response",
+        properties={"key": "value"},
+    )
+
+    first = client.create_evaluation(**kwargs)
+    second = client.create_evaluation(**kwargs)
+    assert first == second
+    assert mock_make_request.call_count == 1
+
+    client.create_evaluation(**kwargs, bypass_cache=True)
+    assert mock_make_request.call_count == 2
+
+    client.create_evaluation(**{**kwargs, "prompt": "Another prompt"})
+    assert mock_make_request.call_count == 3
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_result_cache_is_not_shared_between_accounts(
+    mock_make_request, tmp_path, mock_evaluation_data
+):
+    mock_make_request.side_effect = lambda **_: httpx.Response(
+        status_code=200,
+        json=mock_evaluation_data,
+        request=httpx.Request("POST", "https://test.api.com/evaluations/"),
+    )
+    result_cache = SQLiteResultCache(path=tmp_path / "results.db")
+    kwargs = dict(metric_id=METRIC_ID, prompt="Test prompt", response="r")
+
+    for api_key in ("first_key", "second_key", "first_key"):
+        Mandoline(api_key=api_key, result_cache=result_cache).create_evaluation(
+            **kwargs
+        )
+    assert mock_make_request.call_count == 2
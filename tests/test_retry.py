@@ -0,0 +1,258 @@
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import (
+    AdaptiveConcurrency,
+    AsyncMandoline,
+    Mandoline,
+    MandolineError,
+    RetryConfig,
+)
+from mandoline.errors import MandolineErrorType
+from mandoline.retry import compute_backoff, get_retry_after
+
+METRIC_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+@pytest.fixture
+def mock_metric_data():
+    return {
+        "id": str(METRIC_ID),
+        "name": "Test Metric",
+        "description": "A test metric",
+        "tags": ["test"],
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-01-01T00:00:00Z",
+    }
+
+
+def status_error(*, status_code, method="GET", headers=None, json=None):
+    response = httpx.Response(
+        status_code=status_code,
+        headers=headers,
+        json=json,
+        request=httpx.Request(method, "https://test.api.com/metrics/"),
+    )
+    return httpx.HTTPStatusError("Error", request=response.request, response=response)
+
+
+def ok_response(data, method="GET"):
+    return httpx.Response(
+        status_code=200,
+        json=data,
+        request=httpx.Request(method, "https://test.api.com/metrics/"),
+    )
+
+
+def test_compute_backoff_exponential_without_jitter():
+    policy = RetryConfig(backoff_base=1.0, backoff_max=5.0, jitter=False)
+    delays = [
+        compute_backoff(attempt=attempt, policy=policy) for attempt in (1, 2, 3, 4)
+    ]
+    assert delays == [1.0, 2.0, 4.0, 5.0]
+
+
+def test_compute_backoff_jitter_is_bounded():
+    policy = RetryConfig(backoff_base=1.0, backoff_max=5.0)
+    for _ in range(50):
+        assert 0 <= compute_backoff(attempt=3, policy=policy) <= 4.0
+
+
+def test_compute_backoff_prefers_retry_after():
+    policy = RetryConfig(backoff_max=10.0)
+    assert compute_backoff(attempt=1, policy=policy, retry_after=7.0) == 7.0
+    assert compute_backoff(attempt=1, policy=policy, retry_after=60.0) == 60.0
+
+
+def test_get_retry_after():
+    assert get_retry_after(err=status_error(status_code=429)) is None
+    assert (
+        get_retry_after(err=status_error(status_code=429, headers={"Retry-After": "3"}))
+        == 3.0
+    )
+    past_date = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert (
+        get_retry_after(
+            err=status_error(status_code=503, headers={"Retry-After": past_date})
+        )
+        == 0.0
+    )
+    assert get_retry_after(err=ValueError("not an http error")) is None
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_get_is_retried_until_success(mock_make_request, mock_sleep, mock_metric_data):
+    mock_make_request.side_effect = [
+        status_error(
+            status_code=429,
+            headers={"Retry-After": "2"},
+            json={"detail": {"type": "RateLimitExceeded", "message": "Slow down"}},
+        ),
+        status_error(status_code=503),
+        ok_response(mock_metric_data),
+    ]
+    client = Mandoline(api_key="test_api_key")
+
+    metric = client.get_metric(metric_id=METRIC_ID)
+
+    assert metric.id == METRIC_ID
+    assert mock_make_request.call_count == 3
+    assert mock_sleep.call_count == 2
+    assert mock_sleep.call_args_list[0].args == (2.0,)
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_retry_after_beyond_backoff_max_is_raised(mock_make_request, mock_sleep):
+    mock_make_request.side_effect = status_error(
+        status_code=429,
+        headers={"Retry-After": "120"},
+        json={"detail": {"type": "RateLimitExceeded", "message": "Slow down"}},
+    )
+    client = Mandoline(api_key="test_api_key", retry=RetryConfig(backoff_max=30.0))
+
+    with pytest.raises(MandolineError) as exc_info:
+        client.get_metric(metric_id=METRIC_ID)
+
+    assert exc_info.value.details.type == MandolineErrorType.RateLimitExceeded
+    assert mock_make_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_retries_stop_at_max_attempts(mock_make_request, mock_sleep):
+    mock_make_request.side_effect = status_error(status_code=503)
+    client = Mandoline(api_key="test_api_key", retry=RetryConfig(max_attempts=4))
+
+    with pytest.raises(MandolineError) as exc_info:
+        client.get_metric(metric_id=METRIC_ID)
+
+    assert exc_info.value.details.type == MandolineErrorType.HTTPError
+    assert mock_make_request.call_count == 4
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_non_retryable_status_is_raised_immediately(mock_make_request, mock_sleep):
+    mock_make_request.side_effect = status_error(status_code=404)
+
+    with pytest.raises(MandolineError):
+        Mandoline(api_key="test_api_key").get_metric(metric_id=METRIC_ID)
+
+    assert mock_make_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_post_is_only_retried_when_opted_in(
+    mock_make_request, mock_sleep, mock_metric_data
+):
+    mock_make_request.side_effect = [
+        status_error(status_code=503, method="POST"),
+        ok_response(mock_metric_data, method="POST"),
+    ]
+    with pytest.raises(MandolineError):
+        Mandoline(api_key="test_api_key").create_metric(name="a", description="b")
+    assert mock_make_request.call_count == 1
+
+    mock_make_request.reset_mock()
+    mock_make_request.side_effect = [
+        status_error(status_code=503, method="POST"),
+        ok_response(mock_metric_data, method="POST"),
+    ]
+    client = Mandoline(
+        api_key="test_api_key",
+        retry=RetryConfig(retry_methods=["GET", "POST", "PUT", "DELETE"]),
+    )
+    metric = client.create_metric(name="a", description="b")
+    assert metric.id == METRIC_ID
+    assert mock_make_request.call_count == 2
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_connect_errors_are_retried_for_any_method(
+    mock_make_request, mock_sleep, mock_metric_data
+):
+    mock_make_request.side_effect = [
+        httpx.ConnectError("Connection refused"),
+        ok_response(mock_metric_data, method="POST"),
+    ]
+
+    metric = Mandoline(api_key="test_api_key").create_metric(name="a", description="b")
+
+    assert metric.id == METRIC_ID
+    assert mock_make_request.call_count == 2
+
+
+@patch("mandoline.connection_manager.time.sleep")
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_retried_rate_limits_cut_adaptive_concurrency(mock_make_request, mock_sleep):
+    lock = threading.Lock()
+    rate_limited = set()
+
+    def respond(**kwargs):
+        payload = json.loads(kwargs["body"]["content"])
+        with lock:
+            first_attempt = payload["prompt"] not in rate_limited
+            rate_limited.add(payload["prompt"])
+        if first_attempt:
+            raise status_error(
+                status_code=429,
+                method="POST",
+                json={"detail": {"type": "RateLimitExceeded", "message": "Slow"}},
+            )
+        evaluation = {
+            **payload,
+            "id": "345e6789-e89b-12d3-a456-426614174000",
+            "score": 0.5,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-01-01T00:00:00Z",
+        }
+        return ok_response(evaluation, method="POST")
+
+    mock_make_request.side_effect = respond
+    controller = AdaptiveConcurrency(initial_limit=4, max_limit=8)
+    client = Mandoline(
+        api_key="test_api_key",
+        retry=RetryConfig(retry_methods=["GET", "POST", "PUT", "DELETE"]),
+    )
+
+    results = list(
+        client.evaluate_many(
+            items=[(METRIC_ID, f"p{i}", "r") for i in range(4)],
+            max_concurrency=controller,
+        )
+    )
+
+    # Every call succeeded, but only after being rate limited
+    assert all(result.ok for result in results)
+    assert controller.limit < 4
+
+
+@patch("mandoline.connection_manager.asyncio.sleep", new_callable=AsyncMock)
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_async_get_is_retried(mock_make_request, mock_sleep, mock_metric_data):
+    mock_make_request.side_effect = [
+        status_error(status_code=502),
+        ok_response(mock_metric_data),
+    ]
+    client = AsyncMandoline(api_key="test_api_key")
+
+    metric = asyncio.run(client.get_metric(metric_id=METRIC_ID))
+
+    assert metric.id == METRIC_ID
+    assert mock_make_request.await_count == 2
+    mock_sleep.assert_awaited_once()
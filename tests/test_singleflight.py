@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+
+from mandoline import AsyncMandoline, Mandoline
+from mandoline.singleflight import AsyncSingleFlight, SingleFlight
+
+METRIC_ID = UUID("123e4567-e89b-12d3-a456-426614174000")
+METRIC_DATA = {
+    "id": str(METRIC_ID),
+    "name": "Test Metric",
+    "description": "A test metric",
+    "created_at": "2023-01-01T00:00:00Z",
+    "updated_at": "2023-01-01T00:00:00Z",
+}
+
+
+def slow_metric_response(**_):
+    time.sleep(0.05)
+    return httpx.Response(
+        status_code=200,
+        json=METRIC_DATA,
+        request=httpx.Request("GET", "https://test.api.com/metrics/"),
+    )
+
+
+def test_single_flight_shares_one_call_between_threads():
+    single_flight = SingleFlight()
+    calls = 0
+    barrier = threading.Barrier(8)
+
+    def func():
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return object()
+
+    def call():
+        barrier.wait()
+        return single_flight.do("key", func)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: call(), range(8)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    # Once the call completes, the next one goes out again
+    single_flight.do("key", func)
+    assert calls == 2
+
+
+def test_single_flight_shares_exceptions():
+    single_flight = SingleFlight()
+    barrier = threading.Barrier(4)
+
+    def func():
+        time.sleep(0.05)
+        raise RuntimeError("boom")
+
+    def call():
+        barrier.wait()
+        with pytest.raises(RuntimeError, match="boom"):
+            single_flight.do("key", func)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: call(), range(4)))
+
+
+def test_async_single_flight_survives_caller_cancellation():
+    single_flight = AsyncSingleFlight()
+    calls = 0
+
+    async def func():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        cancelled = asyncio.ensure_future(single_flight.do("key", func))
+        waiting = asyncio.ensure_future(single_flight.do("key", func))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        return await waiting
+
+    assert asyncio.run(run()) == "result"
+    assert calls == 1
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_concurrent_identical_gets_are_coalesced(mock_make_request):
+    mock_make_request.side_effect = slow_metric_response
+    client = Mandoline(api_key="test_api_key")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        metrics = list(
+            executor.map(lambda _: client.get_metric(metric_id=METRIC_ID), range(8))
+        )
+
+    assert all(metric.id == METRIC_ID for metric in metrics)
+    assert mock_make_request.call_count == 1
+
+
+@patch("mandoline.connection_manager.make_request_with_timeout")
+def test_coalescing_can_be_disabled(mock_make_request):
+    mock_make_request.side_effect = slow_metric_response
+    client = Mandoline(api_key="test_api_key", coalesce_requests=False)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.get_metric(metric_id=METRIC_ID), range(4)))
+
+    assert mock_make_request.call_count == 4
+
+
+@patch(
+    "mandoline.connection_manager.make_async_request_with_timeout",
+    new_callable=AsyncMock,
+)
+def test_async_concurrent_identical_gets_are_coalesced(mock_make_request):
+    async def respond(**_):
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            status_code=200,
+            json=METRIC_DATA,
+            request=httpx.Request("GET", "https://test.api.com/metrics/"),
+        )
+
+    mock_make_request.side_effect = respond
+    client = AsyncMandoline(api_key="test_api_key")
+
+    async def run():
+        return await asyncio.gather(
+            *(client.get_metric(metric_id=METRIC_ID) for _ in range(8))
+        )
+
+    metrics = asyncio.run(run())
+
+    assert len(metrics) == 8
+    assert mock_make_request.await_count == 1
@@ -0,0 +1,131 @@
+import time
+
+import pytest
+
+from mandoline import EvaluationSpool, SpoolFullError
+
+METRIC_ID = "234e5678-e89b-12d3-a456-426614174000"
+
+
+def test_spool_delivers_in_background(legacy_server, make_client, tmp_path):
+    with make_client(legacy_server) as client:
+        spool = EvaluationSpool(client, path=tmp_path / "spool.db", batch_size=2)
+        for i in range(5):
+            spool.create_evaluation(metric_id=METRIC_ID, prompt=f"p{i}", response="r")
+
+        assert spool.drain(timeout=10)
+        assert len(spool) == 0
+        spool.close()
+
+    prompts = sorted(e["prompt"] for e in legacy_server.state.evaluations.values())
+    assert prompts == [f"p{i}" for i in range(5)]
+
+
+def test_spool_survives_restart(legacy_server, make_client, tmp_path):
+    path = tmp_path / "spool.db"
+    with make_client(legacy_server) as client:
+        spool = EvaluationSpool(client, path=path, flush_interval=60)
+        spool.submit((METRIC_ID, "p0", "r"))
+        spool.submit((METRIC_ID, "p1", "r"))
+        spool.close()
+
+        assert len(legacy_server.state.evaluations) == 0
+
+        with EvaluationSpool(client, path=path) as reopened:
+            assert len(reopened) == 2
+
+    assert len(legacy_server.state.evaluations) == 2
+
+
+def test_spool_is_bounded(legacy_server, make_client, tmp_path):
+    with make_client(legacy_server) as client:
+        spool = EvaluationSpool(
+            client, path=tmp_path / "spool.db", max_items=2, flush_interval=60
+        )
+        spool.submit((METRIC_ID, "p0", "r"))
+        spool.submit((METRIC_ID, "p1", "r"))
+        with pytest.raises(SpoolFullError):
+            spool.submit((METRIC_ID, "p2", "r"))
+
+        assert spool.flush(timeout=10)
+        spool.submit((METRIC_ID, "p2", "r"))
+        spool.close(drain_timeout=10)
+
+    assert len(legacy_server.state.evaluations) == 3
+
+
+def test_spool_counts_failed_evaluations_towards_capacity(
+    legacy_server, make_client, tmp_path
+):
+    with make_client(legacy_server) as client:
+        spool = EvaluationSpool(
+            client, path=tmp_path / "spool.db", max_items=2, flush_interval=60
+        )
+        spool.submit((METRIC_ID, "invalid", "r"))
+        assert spool.drain(timeout=10)
+        assert len(spool.failed()) == 1
+
+        spool.submit((METRIC_ID, "p0", "r"))
+        with pytest.raises(SpoolFullError):
+            spool.submit((METRIC_ID, "p1", "r"))
+
+        spool.clear_failed()
+        spool.submit((METRIC_ID, "p1", "r"))
+        spool.close(drain_timeout=10)
+
+    assert len(legacy_server.state.evaluations) == 2
+
+
+def test_spool_sets_aside_permanent_failures(legacy_server, make_client, tmp_path):
+    with make_client(legacy_server) as client:
+        with EvaluationSpool(client, path=tmp_path / "spool.db") as spool:
+            spool.submit((METRIC_ID, "invalid", "r"))
+            spool.submit((METRIC_ID, "ok", "r"))
+            assert spool.drain(timeout=10)
+
+            failed = spool.failed()
+            assert len(failed) == 1
+            assert failed[0][0].prompt == "invalid"
+            assert legacy_server.count("POST", "/v1/evaluations/") == 2
+
+            spool.clear_failed()
+            assert spool.failed() == []
+
+
+def test_spool_retries_transient_failures(legacy_server, make_client, tmp_path):
+    with make_client(legacy_server) as client:
+        legacy_server.stop()
+        spool = EvaluationSpool(
+            client,
+            path=tmp_path / "spool.db",
+            flush_interval=0.05,
+            max_attempts=3,
+            backoff_base=0.01,
+        )
+        spool.submit((METRIC_ID, "p0", "r"))
+
+        deadline = time.monotonic() + 10
+        while len(spool) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        [(evaluation_create, error)] = spool.failed()
+        spool.close()
+
+    assert evaluation_create.prompt == "p0"
+    assert error
+
+
+def test_spool_keeps_queue_when_draining_without_api(
+    legacy_server, make_client, tmp_path
+):
+    path = tmp_path / "spool.db"
+    with make_client(legacy_server) as client:
+        legacy_server.stop()
+        with EvaluationSpool(client, path=path, flush_interval=0.05) as spool:
+            for i in range(3):
+                spool.submit((METRIC_ID, f"p{i}", "r"))
+            assert not spool.drain(timeout=10)
+
+        reopened = EvaluationSpool(client, path=path, flush_interval=60)
+        assert len(reopened) == 3
+        assert reopened.failed() == []
+        reopened.close()
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from mandoline import LocalStore, Mandoline
+
+METRIC_IDS = [
+    UUID("234e5678-e89b-12d3-a456-426614174000"),
+    UUID("345e6789-e89b-12d3-a456-426614174000"),
+]
+
+
+def populate(client):
+    return [
+        client.create_evaluation(
+            metric_id=METRIC_IDS[i % 2],
+            prompt=f"p{i}",
+            response="r" * i,
+            properties={"model": "a" if i < 3 else "b", "tags": [i % 2]},
+        )
+        for i in range(6)
+    ]
+
+
+def test_store_syncs_incrementally(server, client, tmp_path):
+    populate(client)
+    with LocalStore(client, path=tmp_path / "store.db") as store:
+        assert store.last_synced() is None
+        assert store.sync_evaluations() == 6
+        assert store.last_synced() is not None
+
+        # Only rows at or after the watermark are downloaded again
+        assert store.sync_evaluations() < 6
+
+        updated = client.update_evaluation(
+            evaluation_id=client.get_evaluations()[0].id, properties={"model": "c"}
+        )
+        assert 1 <= store.sync_evaluations() < 6
+        assert store.get_evaluation(evaluation_id=updated.id) == updated
+        assert len(store.get_evaluations()) == 6
+
+
+def test_store_full_sync_drops_deleted_rows(server, client, tmp_path):
+    evaluations = populate(client)
+    with LocalStore(client, path=tmp_path / "store.db") as store:
+        store.sync_evaluations()
+        client.delete_evaluation(evaluation_id=evaluations[0].id)
+
+        store.sync_evaluations()
+        assert len(store.get_evaluations()) == 6
+
+        assert store.sync_evaluations(full=True) == 5
+        assert store.get_evaluation(evaluation_id=evaluations[0].id) is None
+        assert store.get_evaluations(properties={"model": "a"}) == evaluations[1:3]
+
+
+def test_store_concurrent_full_syncs_keep_each_others_rows(server, client, tmp_path):
+    populate(client)
+    iter_evaluations = client.iter_evaluations
+
+    with LocalStore(client, path=tmp_path / "store.db") as store:
+
+        def interleaved(**kwargs):
+            # The second metric's full sync runs while the first one is midway
+            for i, evaluation in enumerate(iter_evaluations(**kwargs)):
+                if i == 1 and kwargs["metric_id"] == METRIC_IDS[0]:
+                    store.sync_evaluations(metric_id=METRIC_IDS[1], full=True)
+                yield evaluation
+
+        client.iter_evaluations = interleaved
+        store.sync_evaluations(metric_id=METRIC_IDS[0], full=True, page_size=1)
+
+        assert len(store.get_evaluations(metric_id=METRIC_IDS[0])) == 3
+        assert len(store.get_evaluations(metric_id=METRIC_IDS[1])) == 3
+
+
+def test_store_persists_between_sessions(server, client, tmp_path):
+    populate(client)
+    path = tmp_path / "store.db"
+    with LocalStore(client, path=path) as store:
+        store.sync_evaluations(metric_id=METRIC_IDS[0])
+
+    with LocalStore(client, path=path) as store:
+        assert store.last_synced(metric_id=METRIC_IDS[0]) is not None
+        assert store.last_synced() is None
+        assert {e.metric_id for e in store.get_evaluations()} == {METRIC_IDS[0]}
+
+
+def test_store_queries(server, client, tmp_path):
+    evaluations = populate(client)
+    with LocalStore(client, path=tmp_path / "store.db") as store:
+        store.sync_evaluations()
+
+        assert store.get_evaluations() == evaluations
+        assert store.get_evaluations(metric_id=METRIC_IDS[1]) == evaluations[1::2]
+        assert store.get_evaluations(properties={"model": "b", "tags": [0]}) == [
+            evaluations[4]
+        ]
+        assert store.get_evaluations(properties={"model": "z"}) == []
+        assert store.get_evaluations(limit=2) == evaluations[:2]
+
+        middle = evaluations[2].created_at
+        assert store.get_evaluations(created_after=middle) == evaluations[2:]
+        assert store.get_evaluations(created_before=middle) == evaluations[:2]
+        future = datetime.now(timezone.utc) + timedelta(days=1)
+        assert store.get_evaluations(created_after=future) == []
+
+        with pytest.raises(ValueError):
+            store.get_evaluations(properties=["model"])
+
+
+def test_store_syncs_metrics(server, client, tmp_path):
+    metric = client.create_metric(name="Accuracy", description="Is it right?")
+    with LocalStore(client, path=tmp_path / "store.db") as store:
+        assert store.sync_metrics() == 1
+        assert store.get_metrics() == [metric]
+        assert store.get_metric(metric_id=metric.id) == metric
+
+        client.delete_metric(metric_id=metric.id)
+        store.sync_metrics(full=True)
+        assert store.get_metrics() == []
+
+
+def test_store_metric_syncs_bypass_the_metric_cache(server, tmp_path):
+    with Mandoline(
+        api_key="test_api_key",
+        api_base_url=server.api_base_url,
+        metric_cache_ttl=60,
+    ) as client:
+        client.create_metric(name="Accuracy", description="Is it right?")
+        with LocalStore(client, path=tmp_path / "store.db") as store:
+            assert store.sync_metrics(full=True) == 1
+            # Created by someone else, so the client's cache is not invalidated
+            server.state.create_metric({"name": "Tone", "description": "Polite?"})
+            assert store.sync_metrics(full=True) == 2
+            assert len(store.get_metrics()) == 2
@@ -0,0 +1,242 @@
+import asyncio
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from mandoline import (
+    AsyncMandoline,
+    EvaluationCreate,
+    MandolineError,
+    RequestHook,
+    RetryConfig,
+)
+from mandoline.tracing import method_attributes
+from mandoline.utils import NOT_GIVEN
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import (  # noqa: E402
+    ProxyTracerProvider,
+    SpanKind,
+    StatusCode,
+)
+
+METRIC_ID = "234e5678-e89b-12d3-a456-426614174000"
+
+EXPORTER = InMemorySpanExporter()
+
+
+@pytest.fixture(scope="module")
+def tracer_provider():
+    # Installed on first use rather than at import, so the rest of the
+    # suite does not record spans; the global provider can only be set once
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(EXPORTER))
+    trace.set_tracer_provider(provider)
+    return provider
+
+
+@pytest.fixture
+def spans(tracer_provider):
+    EXPORTER.clear()
+    yield EXPORTER
+    EXPORTER.clear()
+
+
+def test_methods_and_attempts_are_traced(server, make_client, spans):
+    with make_client(server) as client:
+        client.create_evaluation(metric_id=METRIC_ID, prompt="p", response="r")
+
+    attempt, method = spans.get_finished_spans()
+    assert method.name == "Mandoline.create_evaluation"
+    assert method.attributes["mandoline.metric_id"] == METRIC_ID
+
+    assert attempt.name == "POST evaluations"
+    assert attempt.kind == SpanKind.CLIENT
+    assert attempt.parent.span_id == method.context.span_id
+    assert attempt.context.trace_id == method.context.trace_id
+    assert attempt.attributes["http.response.status_code"] == 200
+    assert attempt.attributes["http.request.body.size"] > 0
+    assert attempt.attributes["http.request.resend_count"] == 0
+
+
+def test_trace_context_is_propagated(server, make_client, spans):
+    headers = []
+
+    class HeaderRecorder(RequestHook):
+        def after_response(self, event):
+            headers.append(dict(event.headers))
+
+    with make_client(server) as client:
+        client.hooks.insert(0, HeaderRecorder())
+        client.get_metrics()
+
+    [attempt, _] = spans.get_finished_spans()
+    trace_id = format(attempt.context.trace_id, "032x")
+    span_id = format(attempt.context.span_id, "016x")
+    assert headers[0]["traceparent"].startswith(f"00-{trace_id}-{span_id}-")
+
+
+def test_failed_attempts_are_marked(server, make_client, spans):
+    with make_client(server) as client:
+        with pytest.raises(MandolineError):
+            client.create_evaluation(
+                metric_id=METRIC_ID, prompt="invalid", response="r"
+            )
+
+    attempt, method = spans.get_finished_spans()
+    assert attempt.status.status_code == StatusCode.ERROR
+    assert attempt.attributes["error.type"] == "ValidationError"
+    assert method.status.status_code == StatusCode.ERROR
+
+
+def test_async_client_is_traced(server, make_client, spans):
+    async def run():
+        async with make_client(server, client_class=AsyncMandoline) as client:
+            await client.get_metric(metric_id=METRIC_ID)
+
+    with pytest.raises(MandolineError):
+        asyncio.run(run())
+
+    attempt, method = spans.get_finished_spans()
+    assert method.name == "AsyncMandoline.get_metric"
+    assert attempt.name == "GET metrics/{id}"
+    assert attempt.parent.span_id == method.context.span_id
+
+
+def test_tracing_can_be_disabled(server, make_client, spans):
+    with make_client(server, tracing=False) as client:
+        client.get_metrics()
+
+    assert spans.get_finished_spans() == ()
+
+
+def test_fanned_out_attempts_share_the_method_trace(server, make_client, spans):
+    with make_client(server) as client:
+        metrics = [
+            client.create_metric(name=f"m{i}", description="d") for i in range(3)
+        ]
+        spans.clear()
+        client.evaluate(metrics=metrics, prompt="p", response="r")
+
+    *attempts, method = spans.get_finished_spans()
+    assert method.name == "Mandoline.evaluate"
+    assert len(attempts) == 3
+    for attempt in attempts:
+        assert attempt.parent.span_id == method.context.span_id
+        assert attempt.context.trace_id == method.context.trace_id
+
+
+def test_prefetched_pages_share_the_caller_trace(server, make_client, spans):
+    for i in range(5):
+        server.state.create_evaluation(
+            {"metric_id": METRIC_ID, "prompt": f"p{i}", "response": "r"}
+        )
+
+    tracer = trace.get_tracer(__name__)
+    with make_client(server) as client:
+        with tracer.start_as_current_span("export"):
+            evaluations = list(client.iter_evaluations(page_size=2, max_concurrency=3))
+
+    assert len(evaluations) == 5
+    *children, root = spans.get_finished_spans()
+    assert root.name == "export"
+    assert children
+    for span in children:
+        assert span.parent is not None
+        assert span.context.trace_id == root.context.trace_id
+
+
+def test_cancelled_attempts_end_their_span(spans):
+    # Accepts connections but never answers
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    host, port = listener.getsockname()
+
+    async def run(client):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get_metrics(), timeout=0.2)
+
+    client = AsyncMandoline(
+        api_key="test_api_key",
+        api_base_url=f"http://{host}:{port}/v1",
+        retry=RetryConfig(max_attempts=1),
+    )
+    try:
+        asyncio.run(run(client))
+    finally:
+        listener.close()
+
+    assert client._tracing_hook._spans == {}
+    [attempt] = [
+        span for span in spans.get_finished_spans() if span.name == "GET metrics"
+    ]
+    assert attempt.status.status_code == StatusCode.ERROR
+
+
+def test_tracing_starts_once_a_tracer_provider_is_set(server, make_client, spans):
+    with patch(
+        "mandoline.tracing.trace.get_tracer_provider",
+        return_value=ProxyTracerProvider(),
+    ):
+        client = make_client(server)
+        client.get_metrics()
+        assert spans.get_finished_spans() == ()
+
+    client.get_metrics()
+    client.close()
+
+    attempt, method = spans.get_finished_spans()
+    assert method.name == "Mandoline.get_metrics"
+    assert attempt.parent.span_id == method.context.span_id
+
+
+def test_spans_record_metric_ids(server, make_client, spans):
+    with make_client(server) as client:
+        metrics = [
+            client.create_metric(name=f"m{i}", description="d") for i in range(2)
+        ]
+        metric_ids = [str(metric.id) for metric in metrics]
+        spans.clear()
+        client.evaluate(metrics=metrics, prompt="p", response="r")
+        client.create_evaluations(
+            evaluations=[
+                EvaluationCreate(metric_id=metric.id, prompt="p", response="r")
+                for metric in metrics
+            ]
+        )
+        client.get_evaluations(metric_id=metrics[0].id)
+
+    by_name = {}
+    for span in spans.get_finished_spans():
+        by_name.setdefault(span.name, []).append(span)
+    [evaluate] = by_name["Mandoline.evaluate"]
+    assert list(evaluate.attributes["mandoline.metric_ids"]) == metric_ids
+    [create] = by_name["Mandoline.create_evaluations"]
+    assert list(create.attributes["mandoline.metric_ids"]) == metric_ids
+    [batch] = by_name["POST evaluations/batch"]
+    assert list(batch.attributes["mandoline.metric_ids"]) == metric_ids
+    assert sorted(
+        span.attributes["mandoline.metric_id"] for span in by_name["POST evaluations"]
+    ) == sorted(metric_ids)
+    [listing] = by_name["GET evaluations"]
+    assert listing.attributes["mandoline.metric_id"] == metric_ids[0]
+
+
+def test_method_attributes_skip_arguments_not_given():
+    def get_evaluations(**kwargs):
+        pass
+
+    attributes = method_attributes(
+        get_evaluations, {"metric_id": NOT_GIVEN, "evaluation_id": None}
+    )
+
+    assert attributes == {"mandoline.method": "get_evaluations"}
@@ -0,0 +1,91 @@
+import gzip
+import json
+from uuid import UUID
+
+import pytest
+
+from mandoline import export_evaluations, import_evaluations
+
+METRIC_ID = UUID("234e5678-e89b-12d3-a456-426614174000")
+OTHER_METRIC_ID = UUID("345e6789-e89b-12d3-a456-426614174000")
+
+
+@pytest.mark.parametrize("filename", ["evaluations.jsonl", "evaluations.jsonl.gz"])
+def test_export_then_import_round_trips(server, client, tmp_path, filename):
+    path = tmp_path / filename
+    originals = [
+        client.create_evaluation(
+            metric_id=METRIC_ID,
+            prompt=f"p{i}",
+            response="r",
+            properties={"i": i},
+        )
+        for i in range(7)
+    ]
+    progress = []
+
+    assert (
+        export_evaluations(client, path=path, page_size=3, on_progress=progress.append)
+        == 7
+    )
+    assert progress == list(range(1, 8))
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(path, "rb") as file:
+        lines = [json.loads(line) for line in file]
+    assert [line["id"] for line in lines] == [str(e.id) for e in originals]
+
+    server.state.evaluations.clear()
+    results = list(
+        import_evaluations(
+            client,
+            path=path,
+            metric_ids={METRIC_ID: OTHER_METRIC_ID},
+            max_concurrency=3,
+            on_progress=progress.append,
+        )
+    )
+
+    assert all(result.ok for result in results)
+    assert sorted(result.index for result in results) == list(range(7))
+    assert progress[-1].succeeded == 7
+    imported = sorted(server.state.evaluations.values(), key=lambda e: e["prompt"])
+    assert [e["properties"] for e in imported] == [{"i": i} for i in range(7)]
+    assert {e["metric_id"] for e in imported} == {str(OTHER_METRIC_ID)}
+
+
+def test_import_reports_failures_and_skips_blank_lines(client, tmp_path):
+    path = tmp_path / "evaluations.jsonl"
+    rows = [
+        {"metric_id": str(METRIC_ID), "prompt": "ok", "response": "r"},
+        {"metric_id": str(METRIC_ID), "prompt": "invalid", "response": "r"},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n\n")
+
+    results = sorted(import_evaluations(client, path=path), key=lambda r: r.index)
+
+    assert [result.ok for result in results] == [True, False]
+
+
+def test_import_reports_incomplete_lines_individually(client, tmp_path):
+    path = tmp_path / "evaluations.jsonl"
+    rows = [
+        {"metric_id": str(METRIC_ID), "response": "r"},
+        {"metric_id": "not-a-uuid", "prompt": "p", "response": "r"},
+        {"metric_id": str(METRIC_ID), "prompt": "p", "response": "r"},
+    ]
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+
+    results = sorted(
+        import_evaluations(client, path=path, metric_ids={}), key=lambda r: r.index
+    )
+
+    assert [result.ok for result in results] == [False, False, True]
+    assert all(result.error is not None for result in results[:2])
+
+
+def test_import_rejects_malformed_lines(client, tmp_path):
+    path = tmp_path / "evaluations.jsonl"
+    path.write_text("{not json\n")
+
+    with pytest.raises(ValueError, match=":1: invalid JSON"):
+        list(import_evaluations(client, path=path))
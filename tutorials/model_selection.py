@@ -4,7 +4,7 @@ from uuid import UUID
 from anthropic import Anthropic
 from openai import OpenAI
 
-from mandoline import Evaluation, Mandoline, Metric
+from mandoline import Evaluation, Mandoline, Metric, summarize
 
 # Step 1: Set Up Your Experiment
 mandoline = Mandoline()
@@ -95,21 +95,16 @@ def run_experiment(*, prompt: str, metrics: List[Metric]) -> Dict[str, Dict[str,
 
 # Step 6: Analyze Results
 def analyze_results(*, metric_id: UUID) -> None:
-    # Fetch evaluations for the given metric
-    evaluations = mandoline.get_evaluations(metric_id=metric_id)
-
-    # Group evaluations by model
-    grouped_by_model: Dict[str, List[Evaluation]] = {}
-    for eval in evaluations:
-        model = eval.properties["model"]
-        if model not in grouped_by_model:
-            grouped_by_model[model] = []
-        grouped_by_model[model].append(eval)
-
-    # Calculate and print average scores for each model
-    for model, evals in grouped_by_model.items():
-        avg_score = sum(eval.score for eval in evals) / len(evals)
-        print(f"Average score for {model}: {avg_score:.2f}")
+    # Fetch evaluations for the given metric into a columnar frame
+    evaluations = mandoline.get_evaluation_frame(metric_id=metric_id)
+
+    # Summarize scores per model, with a 95% bootstrap confidence interval
+    for summary in summarize(evaluations, by="model"):
+        print(
+            f"Average score for {summary.group['model']}: {summary.mean:.2f} "
+            f"(95% CI {summary.ci_low:.2f} to {summary.ci_high:.2f}, "
+            f"n={summary.count})"
+        )
 
 
 # Main function to run the experiment